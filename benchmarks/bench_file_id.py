@@ -0,0 +1,99 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+"""File id encoding and decoding throughput.
+
+Decoding is measured both bypassing and going through the cache of decoded file ids, encoding always builds the file
+id from scratch, the same way media types do for every file and thumbnail they parse. Run it on two revisions to
+compare codecs.
+
+Run from the repository root with ``python -m benchmarks.bench_file_id [count]``.
+"""
+
+import sys
+import time
+
+from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
+
+COUNT = 100_000
+
+DOCUMENT = "BQACAgIAAx0CAAGgr9AAAgmPX7b4UxbjNoFEO_L0I4s6wrXNJA8AAgQAA4GkuUm9FFvIaOhXWR4E"
+THUMBNAIL = "AAMCAgADHQIAAaCv0AACCY9ftvhTFuM2gUQ78vQjizrCtc0kDwACBAADgaS5Sb0UW8ho6FdZIH3qihAAAwEAB3MAA_GeAQABHgQ"
+UNIQUE = "AgADBAADgaS5SQ"
+
+
+def bench(name: str, function, count: int):
+    start = time.perf_counter()
+
+    for i in range(count):
+        function(i)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{name}: {count / elapsed:,.0f}/s ({elapsed / count * 1e6:.2f} µs)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    # Older revisions have no cache of decoded file ids
+    decode = getattr(FileId.decode, "__wrapped__", FileId.decode)
+    decode_unique = getattr(FileUniqueId.decode, "__wrapped__", FileUniqueId.decode)
+    file_reference = FileId.decode(DOCUMENT).file_reference
+
+    bench("Decode document", lambda i: decode(DOCUMENT), count)
+    bench("Decode thumbnail", lambda i: decode(THUMBNAIL), count)
+    bench("Decode unique", lambda i: decode_unique(UNIQUE), count)
+    bench("Decode document, cached", lambda i: FileId.decode(DOCUMENT), count)
+
+    # A different media id each time, so that neither the objects nor their encoded ids are reused
+    bench(
+        "Encode document",
+        lambda i: FileId(
+            file_type=FileType.DOCUMENT,
+            dc_id=2,
+            media_id=i,
+            access_hash=6437869729085068477,
+            file_reference=file_reference
+        ).encode(),
+        count
+    )
+    bench(
+        "Encode thumbnail",
+        lambda i: FileId(
+            file_type=FileType.THUMBNAIL,
+            dc_id=2,
+            media_id=i,
+            access_hash=6437869729085068477,
+            file_reference=file_reference,
+            thumbnail_file_type=FileType.DOCUMENT,
+            thumbnail_source=ThumbnailSource.THUMBNAIL,
+            thumbnail_size="m",
+            volume_id=0,
+            local_id=0
+        ).encode(),
+        count
+    )
+    bench(
+        "Encode unique",
+        lambda i: FileUniqueId(file_unique_type=FileUniqueType.DOCUMENT, media_id=i).encode(),
+        count
+    )
+
+
+if __name__ == "__main__":
+    main()
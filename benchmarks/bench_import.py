@@ -0,0 +1,88 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Import time and memory footprint of pyrogram with the lazy and the eager raw registry.
+
+Each measurement runs in a fresh interpreter. The eager mode imports every raw type, function and base type right
+after ``import pyrogram``, which is what the import used to do before the registry became lazy.
+
+Run from the repository root with ``python -m benchmarks.bench_import [runs]``.
+"""
+
+import json
+import subprocess
+import sys
+
+RUNS = 5
+
+SCRIPT = """
+import json, resource, sys, time
+
+start = time.perf_counter()
+
+import pyrogram
+
+if {eager}:
+    from pyrogram import raw
+
+    def load(module):
+        for name in dir(module):
+            value = getattr(module, name)
+
+            if isinstance(value, type(raw)):
+                load(value)
+
+    raw.all.objects.load()
+
+    for namespace in (raw.types, raw.functions, raw.base):
+        load(namespace)
+
+elapsed = time.perf_counter() - start
+
+print(json.dumps({{
+    "elapsed": elapsed,
+    "modules": sum(name.startswith("pyrogram.raw.") for name in sys.modules),
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+}}))
+"""
+
+
+def measure(eager: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(eager=eager)],
+        check=True, capture_output=True, text=True
+    ).stdout
+
+    return json.loads(output.splitlines()[-1])
+
+
+def main(runs: int):
+    for mode, eager in (("lazy", False), ("eager", True)):
+        results = [measure(eager) for _ in range(runs)]
+        best = min(results, key=lambda r: r["elapsed"])
+
+        # ru_maxrss is reported in KiB on Linux
+        print(
+            f"{mode:>5}: {best['elapsed'] * 1000:,.0f} ms, "
+            f"{best['modules']:,} raw modules, "
+            f"{best['rss'] / 1024:.1f} MiB max RSS"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else RUNS)
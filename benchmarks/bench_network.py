@@ -0,0 +1,165 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""RPC latency, transfer speed, update throughput and history paging against a local fake data center.
+
+Everything runs offline, against :class:`tests.fakedc.FakeDC`, so results are reproducible and only depend on the
+client (and the fake server) code. Latency and bandwidth of the simulated link can be tuned from the command line.
+Install TgCrypto before raising the transfer sizes: the pure Python AES fallback makes megabyte-sized chunks slow
+enough to hit request timeouts.
+
+Run from the repository root with ``python -m benchmarks.bench_network [options]``.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from io import BytesIO
+
+from pyrogram import raw, filters
+from pyrogram.file_id import FileId, FileType
+from pyrogram.handlers import MessageHandler
+from tests.fakedc import FakeDC
+
+MB = 1024 * 1024
+
+
+def percentile(values: list, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def bench_rpc(app, count: int, concurrency: int):
+    latencies = []
+
+    async def worker(n: int):
+        for _ in range(n):
+            start = time.perf_counter()
+            await app.invoke(raw.functions.help.GetNearestDc())
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(count // concurrency) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"RPC: {len(latencies) / elapsed:,.0f} req/s, latency "
+        f"p50 {percentile(latencies, 50) * 1000:.2f} ms, "
+        f"p90 {percentile(latencies, 90) * 1000:.2f} ms, "
+        f"p99 {percentile(latencies, 99) * 1000:.2f} ms, "
+        f"mean {statistics.mean(latencies) * 1000:.2f} ms"
+    )
+
+
+async def bench_download(app, dc: FakeDC, size: int):
+    dc.files[1] = os.urandom(size)
+    file_id = FileId(file_type=FileType.DOCUMENT, dc_id=2, media_id=1, access_hash=0, file_reference=b"")
+
+    start = time.perf_counter()
+    received = sum([len(chunk) async for chunk in app.get_file(file_id)])
+    elapsed = time.perf_counter() - start
+
+    print(f"Download: {received / MB:.1f} MB in {elapsed:.2f}s ({received / MB / elapsed:.2f} MB/s)")
+
+
+async def bench_upload(app, size: int):
+    start = time.perf_counter()
+    await app.save_file(BytesIO(os.urandom(size)))
+    elapsed = time.perf_counter() - start
+
+    print(f"Upload: {size / MB:.1f} MB in {elapsed:.2f}s ({size / MB / elapsed:.2f} MB/s)")
+
+
+async def bench_updates(app, dc: FakeDC, count: int):
+    received = 0
+    done = asyncio.Event()
+
+    async def on_message(_, __):
+        nonlocal received
+        received += 1
+
+        if received == count:
+            done.set()
+
+    app.add_handler(MessageHandler(on_message, filters.private))
+
+    start = time.perf_counter()
+
+    for i in range(count):
+        await dc.push(dc.new_message(f"Message {i}"))
+
+    await asyncio.wait_for(done.wait(), 60 + count / 100)
+    elapsed = time.perf_counter() - start
+
+    print(f"Updates: {count} in {elapsed:.2f}s ({count / elapsed:,.0f} updates/s)")
+
+
+async def bench_history(app, dc: FakeDC, count: int, work: float):
+    if len(dc.history) < count:
+        dc.add_history(count - len(dc.history))
+
+    prefetch = app.prefetch_pages
+    passes = [
+        ("parsed, prefetch 0", 0, {}),
+        (f"parsed, prefetch {prefetch}", prefetch, {}),
+        (f"raw, prefetch {prefetch}", prefetch, dict(parse=False)),
+        (f"fields, prefetch {prefetch}", prefetch, dict(fields=["id", "date", "message"])),
+    ]
+
+    for name, pages, kwargs in passes:
+        app.prefetch_pages = pages
+        start = time.perf_counter()
+
+        async for _ in app.get_chat_history("me", limit=count, **kwargs):
+            # Stand-in for the work done by the consumer on each message
+            if work:
+                await asyncio.sleep(work)
+
+        elapsed = time.perf_counter() - start
+
+        print(f"History ({name}): {count} messages in {elapsed:.2f}s ({count / elapsed:,.0f} messages/s)")
+
+    app.prefetch_pages = prefetch
+
+
+async def main(args: argparse.Namespace):
+    async with FakeDC(latency=args.latency, bandwidth=int(args.bandwidth * MB)) as dc:
+        async with dc.client(prefetch_pages=args.prefetch) as app:
+            await bench_rpc(app, args.requests, args.concurrency)
+            await bench_download(app, dc, int(args.download * MB))
+            await bench_upload(app, int(args.upload * MB))
+            await bench_updates(app, dc, args.updates)
+            await bench_history(app, dc, args.history, args.work / 1000)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="RPCs to send (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=10, help="concurrent RPC senders (default: 10)")
+    parser.add_argument("--download", type=float, default=0.5, help="MB to download (default: 0.5)")
+    parser.add_argument("--upload", type=float, default=0.5, help="MB to upload (default: 0.5)")
+    parser.add_argument("--updates", type=int, default=1000, help="updates to push (default: 1000)")
+    parser.add_argument("--history", type=int, default=2000, help="messages to read from the history (default: 2000)")
+    parser.add_argument("--prefetch", type=int, default=1, help="history pages to fetch ahead (default: 1)")
+    parser.add_argument("--work", type=float, default=0, help="ms spent on each history message (default: 0)")
+    parser.add_argument("--latency", type=float, default=0, help="seconds of server latency (default: 0)")
+    parser.add_argument("--bandwidth", type=float, default=0, help="server MB/s per connection (default: unlimited)")
+
+    asyncio.run(main(parser.parse_args()))
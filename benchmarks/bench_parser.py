@@ -0,0 +1,144 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Text formatting parser speed on long and short messages.
+
+A long message close to the 4096 characters limit with a few hundred entities and a short message like the ones sent
+by broadcast jobs are parsed in Markdown (default) and HTML mode. The long messages are then unparsed back from their
+text and entities, both with plain BMP text and with emoji that need surrogate pairs, and so is a message made of deeply
+nested entities. Last, a broadcast template with an inline keyboard is prepared over and over, as when sending it to
+many chats, with and without the parse cache of the client. Run it on two revisions to compare parsers.
+
+Run from the repository root with ``python -m benchmarks.bench_parser``.
+"""
+
+import asyncio
+import time
+
+import pyrogram
+from pyrogram import enums, types, utils
+from pyrogram.parser import Parser
+from pyrogram.parser.html import HTML
+from pyrogram.parser.markdown import Markdown
+
+MARKDOWN_PIECES = [
+    "**bold {}** ", "__italic {}__ ", "--underline {}-- ", "~~strike {}~~ ", "||spoiler {}|| ", "`code {}` ",
+    "[link {}](https://example.com/{}) ", "**bold __nested {}__** ", "plain text {} 😀 ",
+]
+HTML_PIECES = [
+    "<b>bold {}</b> ", "<i>italic {}</i> ", "<u>underline {}</u> ", "<s>strike {}</s> ", "<spoiler>spoiler {}</spoiler> ",
+    "<code>code {}</code> ", '<a href="https://example.com/{}">link {}</a> ', "<b>bold <i>nested {}</i></b> ",
+    "plain text {} 😀 ",
+]
+BROADCAST_TEXT = (
+    "**Weekly digest** for __subscribers__\n\n"
+    "- [Release notes](https://example.com/releases) with `v2.0` changes\n"
+    "- ~~Old pricing~~ **new pricing** starts on --Monday--\n"
+    "- ||Secret|| giveaway, see the [rules](https://example.com/rules) 🎁\n\n"
+    "Reply with `/stop` to unsubscribe."
+)
+NESTED_PIECE = "<b>one <i>two <u>three <s>four <spoiler>five {}</spoiler></s></u></i></b> "
+
+
+def build(pieces: list, limit: int = 4096) -> str:
+    text = ""
+    i = 0
+
+    while True:
+        piece = pieces[i % len(pieces)].format(i, i)
+
+        if len(text) + len(piece) > limit:
+            return text
+
+        text += piece
+        i += 1
+
+
+async def bench(parser: Parser, name: str, text: str, mode: enums.ParseMode, count: int):
+    result = await parser.parse(text, mode)
+
+    start = time.perf_counter()
+
+    for _ in range(count):
+        await parser.parse(text, mode)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{name} ({len(text)} chars, {len(result['entities'] or [])} entities): {elapsed / count * 1e6:,.0f} µs")
+
+
+async def bench_unparse(parser: Parser, name: str, html_text: str, count: int):
+    result = await parser.parse(html_text, enums.ParseMode.HTML)
+    text = result["message"]
+    entities = [types.MessageEntity._parse(None, entity, {}) for entity in result["entities"]]
+
+    for unparser in (Markdown, HTML):
+        unparser.unparse(text, entities)
+
+        start = time.perf_counter()
+
+        for _ in range(count):
+            unparser.unparse(text, entities)
+
+        elapsed = time.perf_counter() - start
+
+        print(f"{name} to {unparser.__name__} ({len(text)} chars, {len(entities)} entities): "
+              f"{elapsed / count * 1e6:,.0f} µs")
+
+
+async def bench_broadcast(cache_size: int, count: int):
+    app = pyrogram.Client("bench", api_id=1, api_hash="bench", in_memory=True, parse_cache_size=cache_size)
+    markup = types.InlineKeyboardMarkup([
+        [types.InlineKeyboardButton(f"Option {i}.{j}", callback_data=f"option:{i}:{j}") for j in range(4)]
+        for i in range(3)
+    ])
+
+    start = time.perf_counter()
+
+    for _ in range(count):
+        await utils.parse_text_entities(app, BROADCAST_TEXT, None, None)
+        await markup.write(app)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"Broadcast template, parse cache size {cache_size}: {elapsed / count * 1e6:,.1f} µs")
+
+
+async def main():
+    parser = Parser(None)
+
+    long_markdown = build(MARKDOWN_PIECES)
+    long_html = build(HTML_PIECES)
+    short_markdown = "Hello **{name}**, your order __#1234__ has been [shipped](https://example.com/track) 📦"
+    short_html = 'Hello <b>{name}</b>, your order <i>#1234</i> has been <a href="https://example.com/track">shipped</a> 📦'
+
+    await bench(parser, "Long Markdown", long_markdown, enums.ParseMode.DEFAULT, 200)
+    await bench(parser, "Long HTML", long_html, enums.ParseMode.HTML, 200)
+    await bench(parser, "Short Markdown", short_markdown, enums.ParseMode.DEFAULT, 5000)
+    await bench(parser, "Short HTML", short_html, enums.ParseMode.HTML, 5000)
+
+    await bench_unparse(parser, "Unparse long", long_html.replace("😀", "é"), 500)
+    await bench_unparse(parser, "Unparse long emoji", long_html, 500)
+    await bench_unparse(parser, "Unparse nested", build([NESTED_PIECE]), 500)
+
+    await bench_broadcast(0, 5000)
+    await bench_broadcast(1024, 5000)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Serialization throughput of hot outgoing RPCs.
+
+Run from the repository root with ``python -m benchmarks.bench_serialization [count]``.
+"""
+
+import sys
+import time
+
+from pyrogram import raw
+from pyrogram.raw.core import Message
+
+COUNT = 100_000
+
+
+def make_queries():
+    peer = raw.types.InputPeerChannel(channel_id=1234567890, access_hash=-987654321)
+
+    return {
+        "SendMessage": raw.functions.messages.SendMessage(
+            peer=peer,
+            message="Hello, world! " * 8,
+            random_id=-1234567890123456789,
+            reply_to=raw.types.InputReplyToMessage(reply_to_msg_id=42),
+            entities=[
+                raw.types.MessageEntityBold(offset=0, length=5),
+                raw.types.MessageEntityTextUrl(offset=7, length=5, url="https://example.com")
+            ]
+        ),
+        "GetHistory": raw.functions.messages.GetHistory(
+            peer=peer, offset_id=100, offset_date=0, add_offset=0, limit=100, max_id=0, min_id=0, hash=0
+        ),
+        "SaveFilePart": raw.functions.upload.SaveFilePart(file_id=-5, file_part=3, bytes=bytes(512 * 1024)),
+        "InvokeWithLayer": raw.functions.InvokeWithLayer(
+            layer=raw.all.layer,
+            query=raw.functions.InitConnection(
+                api_id=1, device_model="PC", system_version="Linux", app_version="1.0",
+                system_lang_code="en", lang_pack="", lang_code="en",
+                query=raw.functions.help.GetConfig()
+            )
+        ),
+    }
+
+
+def main(count: int):
+    for name, query in make_queries().items():
+        # SaveFilePart is dominated by copying the payload, fewer rounds are enough
+        rounds = count // 100 if name == "SaveFilePart" else count
+        message = Message(query, 0, 0, 0)
+
+        start = time.perf_counter()
+
+        for _ in range(rounds):
+            message.write()
+
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:>16}: {rounds / elapsed:>10,.0f} writes/s ({elapsed / rounds * 1e6:.2f} µs/write)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
@@ -0,0 +1,145 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Memory and throughput of high-level types built from parsed text and media messages.
+
+Run from the repository root with ``python -m benchmarks.bench_types [count]``.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+
+import pyrogram
+from pyrogram import raw, types
+from pyrogram.raw.core import TLObject
+
+COUNT = 100_000
+
+
+def _read(obj: TLObject) -> TLObject:
+    # Go through the wire format, so that the raw objects look exactly like the ones coming from the server
+    return TLObject.read(BytesIO(obj.write()))
+
+
+def make_raw_messages(count: int):
+    users = {
+        1: _read(raw.types.User(id=1, access_hash=1, first_name="Alice", username="alice")),
+        2: _read(raw.types.User(id=2, access_hash=2, first_name="Bob", bot=True)),
+    }
+    chats = {
+        3: _read(raw.types.Channel(
+            id=3, access_hash=3, title="Group", photo=raw.types.ChatPhotoEmpty(), date=0, megagroup=True
+        )),
+    }
+    messages = [
+        _read(raw.types.Message(
+            id=i,
+            peer_id=raw.types.PeerChannel(channel_id=3),
+            from_id=raw.types.PeerUser(user_id=1 + i % 2),
+            date=1700000000 + i,
+            message=f"Message number {i} with some **bold** text",
+            entities=[raw.types.MessageEntityBold(offset=18, length=4)]
+        ))
+        for i in range(1, count + 1)
+    ]
+
+    return messages, users, chats
+
+
+def make_raw_media_messages(count: int):
+    def sizes():
+        return [
+            raw.types.PhotoSize(type=size, w=width, h=width, size=width * 100)
+            for size, width in (("s", 90), ("m", 320), ("x", 800), ("y", 1280))
+        ]
+
+    def media(i: int):
+        if i % 2:
+            return raw.types.MessageMediaPhoto(
+                photo=raw.types.Photo(
+                    id=i, access_hash=i, file_reference=bytes(range(20)), date=1700000000, sizes=sizes(), dc_id=2
+                )
+            )
+
+        return raw.types.MessageMediaDocument(
+            document=raw.types.Document(
+                id=i, access_hash=i, file_reference=bytes(range(20)), date=1700000000, mime_type="video/mp4",
+                size=10_000_000, dc_id=2, thumbs=sizes()[:2], attributes=[
+                    raw.types.DocumentAttributeVideo(duration=60, w=1280, h=720),
+                    raw.types.DocumentAttributeFilename(file_name=f"video_{i}.mp4")
+                ]
+            )
+        )
+
+    return [
+        _read(raw.types.Message(
+            id=i,
+            peer_id=raw.types.PeerChannel(channel_id=3),
+            from_id=raw.types.PeerUser(user_id=1),
+            date=1700000000 + i,
+            message="",
+            media=media(i)
+        ))
+        for i in range(1, count + 1)
+    ]
+
+
+async def parse_all(client: "pyrogram.Client", messages, users: dict, chats: dict):
+    return [
+        await types.Message._parse(client, m, users, chats, replies=0)
+        for m in messages
+    ]
+
+
+async def main(count: int):
+    client = pyrogram.Client("bench", in_memory=True)
+    messages, users, chats = make_raw_messages(count)
+
+    start = time.perf_counter()
+    parsed = await parse_all(client, messages, users, chats)
+    elapsed = time.perf_counter() - start
+
+    print(f"Parsed {len(parsed)} messages in {elapsed:.2f}s ({len(parsed) / elapsed:,.0f} msg/s)")
+
+    del parsed
+
+    # Tracing allocations slows parsing down considerably, hence the separate pass
+    tracemalloc.start()
+    parsed = await parse_all(client, messages, users, chats)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Retained {size / 2 ** 20:.1f} MiB ({size / len(parsed):,.0f} bytes/msg)")
+
+    del parsed
+
+    # Photos and videos with thumbnails, whose file ids are only read when the media is downloaded or sent again
+    media_messages = make_raw_media_messages(count // 10)
+
+    start = time.perf_counter()
+    parsed = await parse_all(client, media_messages, users, chats)
+    elapsed = time.perf_counter() - start
+
+    print(f"Parsed {len(parsed)} media messages in {elapsed:.2f}s ({len(parsed) / elapsed:,.0f} msg/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT))
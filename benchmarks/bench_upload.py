@@ -0,0 +1,119 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Upload throughput and event loop responsiveness against a local fake data center.
+
+Files are uploaded with :meth:`~pyrogram.Client.save_file` from a path on disk and from memory while a ticker task
+measures how late the event loop wakes it up, which shows how long the upload blocks the loop. The cost of packing a
+single part, from the file buffer to the bytes handed to the cipher, is measured separately.
+
+Install TgCrypto before raising the file size: the pure Python AES fallback makes uploads slow.
+
+Run from the repository root with ``python -m benchmarks.bench_upload [megabytes]``.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+from pyrogram import raw
+from pyrogram.crypto import mtproto
+from pyrogram.raw.core import Message
+from tests.fakedc import FakeDC
+
+MB = 1024 * 1024
+PART_SIZE = 512 * 1024
+TICK = 0.01
+
+
+def bench_pack(count: int = 200):
+    data = os.urandom(PART_SIZE)
+    auth_key = os.urandom(256)
+
+    for name, part in (("bytes", data), ("memoryview", memoryview(data))):
+        query = raw.functions.upload.SaveBigFilePart(file_id=1, file_part=0, file_total_parts=1, bytes=part)
+
+        start = time.perf_counter()
+
+        for _ in range(count):
+            message = Message(query, 0, 1, 0)
+            message.write_into(bytearray())
+
+        elapsed = time.perf_counter() - start
+
+        print(f"Serialize 512 KiB part ({name}): {elapsed / count * 1e6:,.0f} µs")
+
+    message = Message(raw.functions.upload.SaveBigFilePart(
+        file_id=1, file_part=0, file_total_parts=1, bytes=memoryview(data)
+    ), 0, 1, 0)
+
+    start = time.perf_counter()
+
+    for _ in range(count // 20):
+        mtproto.pack(message, 0, bytes(8), auth_key, bytes(8))
+
+    elapsed = time.perf_counter() - start
+
+    print(f"Pack and encrypt 512 KiB part: {elapsed / (count // 20) * 1e3:,.1f} ms")
+
+
+async def bench_upload(app, name: str, file, size: int):
+    lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal lag
+
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lag = max(lag, time.perf_counter() - start - TICK)
+
+    task = asyncio.create_task(ticker())
+
+    start = time.perf_counter()
+    await app.save_file(file)
+    elapsed = time.perf_counter() - start
+
+    running = False
+    await task
+
+    print(f"Upload {size / MB:.1f} MB ({name}): {size / MB / elapsed:.2f} MB/s, max loop lag {lag * 1000:.1f} ms")
+
+
+async def main(size: int):
+    content = os.urandom(size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "file.bin")
+
+        with open(path, "wb") as f:
+            f.write(content)
+
+        async with FakeDC() as dc:
+            async with dc.client() as app:
+                await bench_upload(app, "path", path, size)
+                await bench_upload(app, "memory", BytesIO(content), size)
+
+
+if __name__ == "__main__":
+    bench_pack()
+    asyncio.run(main(int(float(sys.argv[1]) * MB) if len(sys.argv) > 1 else MB))
@@ -41,6 +41,11 @@ FLAGS_RE_3 = re.compile(r"flags(\d?):#")
 INT_RE = re.compile(r"int(\d+)")
 
 CORE_TYPES = ["int", "long", "int128", "int256", "double", "bytes", "string", "Bool", "true"]
+FIXED_TYPES = {"int": "i", "long": "q", "double": "d", "Bool": "I"}
+
+VECTOR = "0x1cb5c415"
+BOOL_TRUE = "0x997275b5"
+BOOL_FALSE = "0xbc799737"
 
 WARNING = """
 # # # # # # # # # # # # # # # # # # # # # # # #
@@ -204,6 +209,144 @@ def get_references(t: str, kind: str):
 
 
 # noinspection PyShadowingBuiltins
+def get_flag_condition(arg_name: str, arg_type: str) -> str:
+    flag_type = arg_type.split("?")[1]
+
+    if flag_type == "true" or flag_type.startswith("Vector"):
+        return f"self.{arg_name}"
+
+    return f"self.{arg_name} is not None"
+
+
+# noinspection PyShadowingBuiltins
+def get_field_writer(arg_name: str, arg_type: str) -> List[Tuple[str, str]]:
+    """Split the serialization of a field into ("fmt", expression) fixed-width chunks and ("", statement) lines."""
+    value = f"self.{arg_name}"
+
+    if arg_type in FIXED_TYPES:
+        if arg_type == "Bool":
+            value = f"{BOOL_TRUE} if {value} else {BOOL_FALSE}"
+
+        return [(FIXED_TYPES[arg_type], value)]
+
+    if arg_type in ["int128", "int256"]:
+        size = int(arg_type[3:]) // 8
+
+        return [(f"{size}s", f'{value}.to_bytes({size}, "little", signed=True)')]
+
+    if arg_type == "bytes":
+        return [("", f"Bytes.append(b, {value})")]
+
+    if arg_type == "string":
+        return [("", f"b += String({value})")]
+
+    if "vector" in arg_type.lower():
+        sub_type = arg_type.split("<")[1][:-1]
+
+        if sub_type in FIXED_TYPES and sub_type != "Bool":
+            return [
+                ("I", VECTOR),
+                ("i", f"len({value})"),
+                ("", f'b += pack(f"<{{len({value})}}{FIXED_TYPES[sub_type]}", *{value})')
+            ]
+
+        if sub_type in CORE_TYPES:
+            return [("", f"b += Vector({value}, {sub_type.title()})")]
+
+        return [
+            ("I", VECTOR),
+            ("i", f"len({value})"),
+            ("", f"for i in {value}:\n    i.write_into(b)")
+        ]
+
+    return [("", f"{value}.write_into(b)")]
+
+
+def get_writer(c: Combinator) -> Tuple[str, str]:
+    """Build the body of write_into() for a combinator.
+
+    Consecutive fixed-width fields are packed at once using a precompiled struct.Struct, flags are computed in a
+    single expression and everything is appended to the bytearray shared by the whole object tree.
+    Returns the module-level struct definitions and the method body.
+    """
+    structs = {}
+    lines = []
+
+    def get_struct(fmt: str) -> str:
+        if fmt not in structs:
+            structs[fmt] = f"STRUCT_{len(structs)}"
+
+        return structs[fmt]
+
+    def emit(chunks: List[Tuple[str, str]], out: List[str], run: List[Tuple[str, str]]):
+        for fmt, code in chunks:
+            if fmt:
+                run.append((fmt, code))
+                continue
+
+            flush(out, run)
+            out.extend(code.split("\n"))
+
+    def flush(out: List[str], run: List[Tuple[str, str]]):
+        if run:
+            fmt = "<" + "".join(i[0] for i in run)
+            out.append(f"b += {get_struct(fmt)}.pack({', '.join(i[1] for i in run)})")
+            run.clear()
+
+    for arg_name, arg_type in c.args:
+        if re.match(r"flags\d?", arg_name) and arg_type == "#":
+            conditions = []
+
+            for i in c.args:
+                flag = FLAGS_RE_2.match(i[1])
+
+                if flag and arg_name == f"flags{flag.group(1)}":
+                    conditions.append(f"({1 << int(flag.group(2))} if {get_flag_condition(*i)} else 0)")
+
+            if len(conditions) > 1:
+                lines.append(f"{arg_name} = (")
+                lines.append(f"    {conditions[0]}")
+                lines.extend(f"    | {i}" for i in conditions[1:])
+                lines.append(")")
+            else:
+                lines.append(f"{arg_name} = {conditions[0][1:-1] if conditions else 0}")
+
+    if lines:
+        lines.append("")
+
+    run = [("I", c.id)]
+
+    for arg_name, arg_type in c.args:
+        if re.match(r"flags\d?", arg_name) and arg_type == "#":
+            run.append(("i", arg_name))
+            continue
+
+        flag = FLAGS_RE_2.match(arg_type)
+
+        if not flag:
+            emit(get_field_writer(arg_name, arg_type), lines, run)
+            continue
+
+        if flag.group(3) == "true":
+            continue
+
+        flush(lines, run)
+
+        block, block_run = [], []
+        emit(get_field_writer(arg_name, flag.group(3)), block, block_run)
+        flush(block, block_run)
+
+        lines.append(f"if {get_flag_condition(arg_name, arg_type)}:")
+        lines.extend(f"    {i}" for i in block)
+
+    flush(lines, run)
+
+    return (
+        "\n".join(f'{name} = Struct("{fmt}")' for fmt, name in structs.items()),
+        "\n        ".join(lines).replace("\n        \n", "\n\n")
+    )
+
+
 def start(format: bool = False):
     shutil.rmtree(DESTINATION_PATH / "types", ignore_errors=True)
     shutil.rmtree(DESTINATION_PATH / "functions", ignore_errors=True)
@@ -215,9 +358,11 @@ def start(format: bool = False):
         schema = (f1.read() + f2.read() + f3.read()).splitlines()
 
     with open(HOME_PATH / "template/type.txt") as f1, \
-        open(HOME_PATH / "template/combinator.txt") as f2:
+        open(HOME_PATH / "template/combinator.txt") as f2, \
+        open(HOME_PATH / "template/namespace.txt") as f3:
         type_tmpl = f1.read()
         combinator_tmpl = f2.read()
+        namespace_tmpl = f3.read()
 
     with open(NOTICE_PATH, encoding="utf-8") as f:
         notice = []
@@ -452,34 +597,14 @@ def start(format: bool = False):
                              f"            :nosignatures:\n\n" \
                              f"            " + references
 
-        write_types = read_types = "" if c.has_flags else "# No flags\n        "
+        structs, write_types = get_writer(c)
+
+        read_types = "" if c.has_flags else "# No flags\n        "
 
         for arg_name, arg_type in c.args:
             flag = FLAGS_RE_2.match(arg_type)
 
             if re.match(r"flags\d?", arg_name) and arg_type == "#":
-                write_flags = []
-
-                for i in c.args:
-                    flag = FLAGS_RE_2.match(i[1])
-
-                    if flag:
-                        if arg_name != f"flags{flag.group(1)}":
-                            continue
-
-                        if flag.group(3) == "true" or flag.group(3).startswith("Vector"):
-                            write_flags.append(f"{arg_name} |= (1 << {flag.group(2)}) if self.{i[0]} else 0")
-                        else:
-                            write_flags.append(
-                                f"{arg_name} |= (1 << {flag.group(2)}) if self.{i[0]} is not None else 0")
-
-                write_flags = "\n        ".join([
-                    f"{arg_name} = 0",
-                    "\n        ".join(write_flags),
-                    f"b.write(Int({arg_name}))\n        "
-                ])
-
-                write_types += write_flags
                 read_types += f"\n        {arg_name} = Int.read(b)\n        "
 
                 continue
@@ -491,55 +616,30 @@ def start(format: bool = False):
                     read_types += "\n        "
                     read_types += f"{arg_name} = True if flags{number} & (1 << {index}) else False"
                 elif flag_type in CORE_TYPES:
-                    write_types += "\n        "
-                    write_types += f"if self.{arg_name} is not None:\n            "
-                    write_types += f"b.write({flag_type.title()}(self.{arg_name}))\n        "
-
                     read_types += "\n        "
                     read_types += f"{arg_name} = {flag_type.title()}.read(b) if flags{number} & (1 << {index}) else None"
                 elif "vector" in flag_type.lower():
                     sub_type = arg_type.split("<")[1][:-1]
 
-                    write_types += "\n        "
-                    write_types += f"if self.{arg_name} is not None:\n            "
-                    write_types += "b.write(Vector(self.{}{}))\n        ".format(
-                        arg_name, f", {sub_type.title()}" if sub_type in CORE_TYPES else ""
-                    )
-
                     read_types += "\n        "
                     read_types += "{} = TLObject.read(b{}) if flags{} & (1 << {}) else []\n        ".format(
                         arg_name, f", {sub_type.title()}" if sub_type in CORE_TYPES else "", number, index
                     )
                 else:
-                    write_types += "\n        "
-                    write_types += f"if self.{arg_name} is not None:\n            "
-                    write_types += f"b.write(self.{arg_name}.write())\n        "
-
                     read_types += "\n        "
                     read_types += f"{arg_name} = TLObject.read(b) if flags{number} & (1 << {index}) else None\n        "
             else:
                 if arg_type in CORE_TYPES:
-                    write_types += "\n        "
-                    write_types += f"b.write({arg_type.title()}(self.{arg_name}))\n        "
-
                     read_types += "\n        "
                     read_types += f"{arg_name} = {arg_type.title()}.read(b)\n        "
                 elif "vector" in arg_type.lower():
                     sub_type = arg_type.split("<")[1][:-1]
 
-                    write_types += "\n        "
-                    write_types += "b.write(Vector(self.{}{}))\n        ".format(
-                        arg_name, f", {sub_type.title()}" if sub_type in CORE_TYPES else ""
-                    )
-
                     read_types += "\n        "
                     read_types += "{} = TLObject.read(b{})\n        ".format(
                         arg_name, f", {sub_type.title()}" if sub_type in CORE_TYPES else ""
                     )
                 else:
-                    write_types += "\n        "
-                    write_types += f"b.write(self.{arg_name}.write())\n        "
-
                     read_types += "\n        "
                     read_types += f"{arg_name} = TLObject.read(b)\n        "
 
@@ -558,7 +658,8 @@ def start(format: bool = False):
             fields=fields,
             read_types=read_types,
             write_types=write_types,
-            return_arguments=return_arguments
+            return_arguments=return_arguments,
+            structs=structs
         )
 
         directory = "types" if c.section == "types" else c.section
@@ -582,59 +683,33 @@ def start(format: bool = False):
 
         d[c.namespace].append(c.name)
 
-    for namespace, types in namespaces_to_types.items():
-        with open(DESTINATION_PATH / "base" / namespace / "__init__.py", "w") as f:
-            f.write(f"{notice}\n\n")
-            f.write(f"{WARNING}\n\n")
-
-            for t in types:
-                module = t
-
-                if module == "Updates":
-                    module = "UpdatesT"
-
-                f.write(f"from .{snake(module)} import {t}\n")
-
-            if not namespace:
-                f.write(f"from . import {', '.join(filter(bool, namespaces_to_types))}")
-
-    for namespace, types in namespaces_to_constructors.items():
-        with open(DESTINATION_PATH / "types" / namespace / "__init__.py", "w") as f:
-            f.write(f"{notice}\n\n")
-            f.write(f"{WARNING}\n\n")
-
-            for t in types:
-                module = t
-
-                if module == "Updates":
-                    module = "UpdatesT"
-
-                f.write(f"from .{snake(module)} import {t}\n")
-
-            if not namespace:
-                f.write(f"from . import {', '.join(filter(bool, namespaces_to_constructors))}\n")
-
-    for namespace, types in namespaces_to_functions.items():
-        with open(DESTINATION_PATH / "functions" / namespace / "__init__.py", "w") as f:
-            f.write(f"{notice}\n\n")
-            f.write(f"{WARNING}\n\n")
-
-            for t in types:
-                module = t
-
-                if module == "Updates":
-                    module = "UpdatesT"
-
-                f.write(f"from .{snake(module)} import {t}\n")
-
-            if not namespace:
-                f.write(f"from . import {', '.join(filter(bool, namespaces_to_functions))}")
+    for directory, namespaces in (
+        ("base", namespaces_to_types),
+        ("types", namespaces_to_constructors),
+        ("functions", namespaces_to_functions)
+    ):
+        for namespace, types in namespaces.items():
+            with open(DESTINATION_PATH / directory / namespace / "__init__.py", "w") as f:
+                f.write(
+                    namespace_tmpl.format(
+                        notice=notice,
+                        warning=WARNING,
+                        objects="".join(
+                            f'\n    "{t}": "{snake("UpdatesT" if t == "Updates" else t)}",'
+                            for t in types
+                        ),
+                        namespaces=", ".join(
+                            f'"{n}"' for n in namespaces if n
+                        ) if not namespace else ""
+                    )
+                )
 
     with open(DESTINATION_PATH / "all.py", "w", encoding="utf-8") as f:
         f.write(notice + "\n\n")
         f.write(WARNING + "\n\n")
+        f.write("from .core.registry import Registry\n\n")
         f.write(f"layer = {layer}\n\n")
-        f.write("objects = {")
+        f.write("objects = Registry({")
 
         for c in combinators:
             f.write(f'\n    {c.id}: "pyrogram.raw.{c.section}.{c.qualname}",')
@@ -648,7 +723,7 @@ def start(format: bool = False):
         f.write('\n    0x3072cfa1: "pyrogram.raw.core.GzipPacked",')
         f.write('\n    0x5bb8e511: "pyrogram.raw.core.Message",')
 
-        f.write("\n}\n")
+        f.write("\n})\n")
 
 
 if "__main__" == __name__:
@@ -171,7 +171,9 @@ def pyrogram_api():
         Messages
             send_message
             forward_messages
+            bulk_forward_messages
             copy_message
+            bulk_copy_messages
             send_photo
             send_audio
             send_document
@@ -194,6 +196,7 @@ def pyrogram_api():
             set_reaction
             download_media
             stream_media
+            stream_media_range
             edit_message_text
             edit_inline_text
             edit_message_caption
@@ -205,9 +208,11 @@ def pyrogram_api():
             edit_cached_media
             stop_poll
             delete_messages
+            bulk_delete_messages
             get_chat_sponsored_messages
             get_chat_history
             get_chat_history_count
+            export_chats
             read_chat_history
             get_messages
             view_messages
@@ -244,6 +249,7 @@ def pyrogram_api():
             join_chat
             leave_chat
             get_chat
+            get_chats
             get_chat_members
             get_chat_members_count
             get_chat_member
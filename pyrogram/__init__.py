@@ -21,6 +21,7 @@ __version__ = "2.1.35"
 __license__ = "GNU Lesser General Public License v3.0 (LGPL-3.0)"
 __copyright__ = "Copyright (C) 2017-present Dan <https://github.com/delivrance>"
 
+import importlib
 from concurrent.futures.thread import ThreadPoolExecutor
 
 
@@ -36,10 +37,24 @@ class ContinuePropagation(StopAsyncIteration):
     pass
 
 
-from . import raw, types, filters, handlers, emoji, enums
+from . import raw, types, filters, handlers, enums
 from .client import Client
 from .sync import idle, compose
 
 __version__ = f"{__version__}-TL-{raw.all.layer}"
 
 crypto_executor = ThreadPoolExecutor(1, thread_name_prefix="CryptoWorker")
+
+# Submodules nothing in the library depends on, imported the first time they are accessed
+_lazy_submodules = {"emoji"}
+
+
+def __getattr__(name: str):
+    if name in _lazy_submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_submodules)
@@ -0,0 +1,75 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple
+
+from pyrogram.errors import FloodWait, RPCError
+
+log = logging.getLogger(__name__)
+
+
+class BulkResult(NamedTuple):
+    """Outcome of a bulk operation, keyed by the ids it was given.
+
+    Ids whose chunk succeeded are in *results*, those whose chunk failed are in *errors* together with the error.
+    An id can be in neither, for example a message that no longer exists and thus wasn't forwarded.
+    """
+
+    results: Dict[int, Any]
+    errors: Dict[int, RPCError]
+
+
+async def run_bulk(
+    function: Callable[[List[int]], Awaitable[Dict[int, Any]]],
+    ids: Iterable[int],
+    size: int,
+    concurrency: int = 4
+) -> BulkResult:
+    """Call an async function with the ids split in chunks of the given size, running up to *concurrency* calls at a
+    time, in the order of the chunks.
+
+    The function returns the results of the ids of its chunk as a dict. Chunks failing with a flood wait are sent
+    again once it expires, any other error is recorded for all the ids of the chunk and the other chunks go on.
+    """
+    ids = list(dict.fromkeys(ids))
+    results, errors = {}, {}
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(chunk: List[int]):
+        async with semaphore:
+            while True:
+                try:
+                    results.update(await function(chunk))
+                except FloodWait as e:
+                    log.info("Waiting for %s seconds before sending a chunk of %s ids again (flood wait)",
+                             e.value, len(chunk))
+                    await asyncio.sleep(e.value)
+                    continue
+                except RPCError as e:
+                    errors.update(dict.fromkeys(chunk, e))
+
+                break
+
+    await asyncio.gather(*[run(ids[i:i + size]) for i in range(0, len(ids), size)])
+
+    return BulkResult(
+        {i: results[i] for i in ids if i in results},
+        {i: errors[i] for i in ids if i in errors}
+    )
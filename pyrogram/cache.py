@@ -0,0 +1,212 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set
+
+from pyrogram.raw.core import TLObject
+
+
+def approximate_size(obj: Any) -> int:
+    """Roughly estimate the memory used by an object and everything reachable from it.
+
+    Only containers, Pyrogram types and raw TL objects are followed. Shared objects are counted once.
+    """
+    from pyrogram.types import Object
+
+    seen = set()
+    stack = [obj]
+    size = 0
+
+    while stack:
+        o = stack.pop()
+
+        if o is None or id(o) in seen:
+            continue
+
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+
+        if isinstance(o, (str, bytes, int, float, bool)):
+            continue
+
+        if isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, Object):
+            stack.extend(getattr(o, attr) for attr in o._attributes() if attr != "_client")
+        elif isinstance(o, TLObject):
+            stack.extend(getattr(o, attr, None) for attr in o.__slots__)
+
+    return size
+
+
+class Cache:
+    """A least recently used cache with optional size and time bounds.
+
+    Keys are usually ``(chat_id, item_id)`` tuples; the first item of tuple keys is used to group the entries so that
+    everything related to a chat can be invalidated at once.
+
+    Parameters:
+        capacity (``int``):
+            Maximum number of entries.
+
+        max_bytes (``int``, *optional*):
+            Approximate maximum amount of memory, in bytes, the cached values may use.
+            Defaults to 0 (no limit).
+
+        ttl (``float``, *optional*):
+            Number of seconds after which an entry expires.
+            Defaults to 0 (entries never expire).
+
+        sizeof (``Callable``, *optional*):
+            Function used to estimate the size of a value when *max_bytes* is set.
+            Defaults to :func:`approximate_size`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        max_bytes: int = 0,
+        ttl: float = 0,
+        sizeof: Callable[[Any], int] = approximate_size
+    ):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+
+        # key -> (value, size, expiry)
+        self.store: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.groups: Dict[Hashable, Set[Hashable]] = {}
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __contains__(self, key) -> bool:
+        return key in self.store
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        if key in self.store:
+            self._remove(key)
+
+        size = self.sizeof(value) if self.max_bytes else 0
+        expiry = time.monotonic() + self.ttl if self.ttl else 0
+
+        self.store[key] = (value, size, expiry)
+        self.bytes += size
+
+        if isinstance(key, tuple):
+            self.groups.setdefault(key[0], set()).add(key)
+
+        while self.store and (
+            len(self.store) > self.capacity
+            or (self.max_bytes and self.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self.store)))
+            self.evictions += 1
+
+    def __delitem__(self, key):
+        self._remove(key)
+
+    def get(self, key, default=None):
+        entry = self.store.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, _, expiry = entry
+
+        if expiry and expiry < time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self.store.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def pop(self, key, default=None):
+        if key not in self.store:
+            return default
+
+        return self._remove(key)
+
+    def invalidate(self, group: Hashable, keys: Optional[Iterable[Hashable]] = None) -> int:
+        """Remove all the entries of a group, or only the given ``(group, key)`` entries.
+
+        Returns:
+            ``int``: The number of removed entries.
+        """
+        if keys is None:
+            keys = list(self.groups.get(group, ()))
+        else:
+            keys = [(group, key) for key in keys if (group, key) in self.store]
+
+        for key in keys:
+            self._remove(key)
+
+        return len(keys)
+
+    def clear(self):
+        self.store.clear()
+        self.groups.clear()
+        self.bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.store),
+            "capacity": self.capacity,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key):
+        value, size, _ = self.store.pop(key)
+        self.bytes -= size
+
+        if isinstance(key, tuple):
+            group = self.groups.get(key[0])
+
+            if group is not None:
+                group.discard(key)
+
+                if not group:
+                    del self.groups[key[0]]
+
+        return value
@@ -19,18 +19,19 @@
 import asyncio
 import functools
 import inspect
+import itertools
 import logging
 import os
 import platform
 import re
 import shutil
 import sys
+from collections import deque
 from concurrent.futures.thread import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from hashlib import sha256
 from importlib import import_module
-from io import StringIO, BytesIO
-from mimetypes import MimeTypes
+from io import BytesIO
 from pathlib import Path
 from typing import Union, List, Optional, Callable, AsyncGenerator, Type, Tuple
 
@@ -54,12 +55,16 @@ from pyrogram.session import Auth, Session
 from pyrogram.storage import Storage, FileStorage, MemoryStorage
 from pyrogram.types import User, TermsOfService
 from pyrogram.utils import ainput
+from .cache import Cache
 from .connection import Connection
 from .connection.transport import TCP, TCPAbridged, TCPFull
 from .dispatcher import Dispatcher
-from .file_id import FileId, FileType, ThumbnailSource
-from .mime_types import mime_types
+from .file_id import FileId
+from .mime_types import LazyMimeTypes
 from .parser import Parser
+from .sequencer import UpdatesSequencer
+from .flood import FloodRegistry
+from .rate_limiter import RateLimiter
 from .session.internals import MsgId
 
 log = logging.getLogger(__name__)
@@ -171,6 +176,27 @@ class Client(Methods):
             Pass True to skip pending updates that arrived while the client was offline.
             Defaults to True.
 
+        update_lanes (``dict``, *optional*):
+            Pass a dict of settings to dispatch updates by priority instead of in arrival order.
+            Time-critical updates (callback queries, inline queries, pre-checkout and shipping queries) go to the
+            "high" lane, status, typing, read and reaction count updates to the "low" lane and everything else to
+            the "normal" lane. All settings are optional, e.g.:
+            *dict(weights=dict(high=8, normal=4, low=1), reserved_workers=1, max_age=dict(low=30))*.
+            *weights* sets how many updates of a lane are handled in a row before moving on to the next lane,
+            *reserved_workers* sets how many workers only handle high priority updates, *max_age* drops updates that
+            waited in a lane for longer than the given seconds and *lanes* maps raw update types to lane names.
+            Per-lane statistics are available through ``Client.dispatcher.updates_queue.stats``.
+            Defaults to None (a single FIFO queue).
+
+        rate_limits (``dict``, *optional*):
+            Pass a dict of limits to throttle outgoing messages (sent, forwarded and edited) before they are sent,
+            instead of relying on flood waits after the fact. Limits are ``(count, seconds)`` tuples and all of them are
+            optional, e.g.: *dict(total=(30, 1), private=(1, 1), group=(20, 60))*, which are also the defaults.
+            Pass None as a limit to disable it. Chats waiting for their turn are served round-robin so that long
+            broadcasts don't hold back replies to other chats. Statistics are available through
+            ``Client.rate_limiter.stats``.
+            Defaults to None (no throttling).
+
         takeout (``bool``, *optional*):
             Pass True to let the client use a takeout session instead of a normal one, implies *no_updates=True*.
             Useful for exporting Telegram data. Methods invoked inside a takeout session (such as get_chat_history,
@@ -194,12 +220,42 @@ class Client(Methods):
             A value that is too high may result in network related issues.
             Defaults to 1.
 
+        resumable_uploads (``bool``, *optional*):
+            Pass True to make uploads resumable: uploaded parts are recorded in a manifest inside *workdir*, failed
+            parts are retried with backoff and an upload that still fails resumes from the missing parts the next time
+            the same file is uploaded, also after a restart. See :meth:`~pyrogram.Client.save_file`.
+            Defaults to False.
+
         max_message_cache_size (``int``, *optional*):
             Set the maximum size of the message cache.
             Defaults to 10000.
 
+        max_message_cache_bytes (``int``, *optional*):
+            Set an approximate memory budget, in bytes, for the message cache.
+            The least recently used messages are evicted once the budget is exceeded.
+            Defaults to 0 (only the number of messages is bounded).
+
+        message_cache_ttl (``float``, *optional*):
+            Set the number of seconds after which a cached message expires.
+            Defaults to 0 (cached messages never expire).
+
+        parse_cache_size (``int``, *optional*):
+            Set the maximum number of formatted texts and of reply markups to keep ready to be sent again, which is
+            useful when the same text or markup is sent to many chats. Texts are cached by text and parse mode, with
+            the mentions resolved each time they are sent. Reply markups are cached by identity, so a markup must not be
+            changed once it has been sent. Statistics are available through ``Client.parser.cache.stats`` and
+            ``Client.markup_cache.stats``.
+            Defaults to 0 (nothing is cached).
+
+        prefetch_pages (``int``, *optional*):
+            Set how many pages methods that iterate over many results (such as get_chat_history, search_messages,
+            search_global, get_dialogs and get_chat_members) fetch ahead while the current page is being consumed.
+            The number is halved every time fetching a page hits a flood wait. Pass 0 to fetch a page only once the
+            previous one has been consumed.
+            Defaults to 1.
+
         max_business_user_connection_cache_size (``int``, *optional*):
-            Set the maximum size of the message cache.
+            Set the maximum size of the business connection cache.
             Defaults to 10000.
 
         storage_engine (:obj:`~pyrogram.storage.Storage`, *optional*):
@@ -244,11 +300,17 @@ class Client(Methods):
     # Interval of seconds in which the updates watchdog will kick in
     UPDATES_WATCHDOG_INTERVAL = 15 * 60
 
+    # Seconds to wait for more short messages needing a difference request, so that they can share the same request
+    SHORT_MESSAGES_DELAY = 0.05
+
     MAX_CONCURRENT_TRANSMISSIONS = 1
+
+    # Parts requested ahead of the one being consumed when streaming a byte range
+    FILE_RANGE_PREFETCH = 4
+
     MAX_CACHE_SIZE = 10000
 
-    mimetypes = MimeTypes()
-    mimetypes.readfp(StringIO(mime_types))
+    mimetypes = LazyMimeTypes()
 
     def __init__(
         self,
@@ -276,11 +338,18 @@ class Client(Methods):
         parse_mode: "enums.ParseMode" = enums.ParseMode.DEFAULT,
         no_updates: bool = None,
         skip_updates: bool = True,
+        update_lanes: dict = None,
+        rate_limits: dict = None,
         takeout: bool = None,
         sleep_threshold: int = Session.SLEEP_THRESHOLD,
         hide_password: bool = False,
         max_concurrent_transmissions: int = MAX_CONCURRENT_TRANSMISSIONS,
+        resumable_uploads: bool = False,
         max_message_cache_size: int = MAX_CACHE_SIZE,
+        max_message_cache_bytes: int = 0,
+        message_cache_ttl: float = 0,
+        parse_cache_size: int = 0,
+        prefetch_pages: int = 1,
         max_business_user_connection_cache_size: int = MAX_CACHE_SIZE,
         storage_engine: Storage = None,
         no_joined_notifications: bool = False,
@@ -315,11 +384,18 @@ class Client(Methods):
         self.parse_mode = parse_mode
         self.no_updates = no_updates
         self.skip_updates = skip_updates
+        self.update_lanes = update_lanes
+        self.rate_limits = rate_limits
         self.takeout = takeout
         self.sleep_threshold = sleep_threshold
         self.hide_password = hide_password
         self.max_concurrent_transmissions = max_concurrent_transmissions
+        self.resumable_uploads = resumable_uploads
         self.max_message_cache_size = max_message_cache_size
+        self.max_message_cache_bytes = max_message_cache_bytes
+        self.message_cache_ttl = message_cache_ttl
+        self.parse_cache_size = parse_cache_size
+        self.prefetch_pages = prefetch_pages
         self.max_business_user_connection_cache_size = max_business_user_connection_cache_size
         self.no_joined_notifications = no_joined_notifications
         self.client_platform = client_platform
@@ -339,8 +415,11 @@ class Client(Methods):
             self.storage = FileStorage(self.name, self.WORKDIR)
 
         self.dispatcher = Dispatcher(self)
+        self.sequencer = UpdatesSequencer(self)
+        self.flood_registry = FloodRegistry()
+        self.rate_limiter = RateLimiter(**rate_limits) if rate_limits is not None else None
         self.rnd_id = MsgId
-        self.parser = Parser(self)
+        self.parser = Parser(self, self.parse_cache_size)
         self.session = None
 
         self.media_sessions = {}
@@ -359,8 +438,17 @@ class Client(Methods):
         # TODO: fix conditions here
         self.me: Optional[User] = None
 
-        self.message_cache = Cache(self.max_message_cache_size)
+        self.message_cache = Cache(
+            self.max_message_cache_size,
+            max_bytes=self.max_message_cache_bytes,
+            ttl=self.message_cache_ttl
+        )
+        # Latest raw users and chats seen, used to rebuild short messages without asking for the difference
+        self.peers_cache = Cache(self.MAX_CACHE_SIZE)
+        self.short_messages = []
         self.business_user_connection_cache = Cache(self.max_business_user_connection_cache_size)
+        # Written reply markups by id, kept together with the markup itself so that the id can't be reused
+        self.markup_cache = Cache(self.parse_cache_size) if self.parse_cache_size else None
 
         # Sometimes, for some reason, the server will stop sending updates and will only respond to pings.
         # This watchdog will invoke updates.GetState in order to wake up the server and enable it sending updates again
@@ -603,6 +691,7 @@ class Client(Methods):
                 continue
 
             parsed_peers.append((peer_id, access_hash, peer_type, usernames, phone_number))
+            self.peers_cache[peer_id] = peer
 
         await self.storage.update_peers(parsed_peers)
 
@@ -620,18 +709,18 @@ class Client(Methods):
             users = {u.id: u for u in updates.users}
             chats = {c.id: c for c in updates.chats}
 
+            self.sequencer.date = updates.date
+
             for update in updates.updates:
-                channel_id = getattr(
-                    getattr(
-                        getattr(
-                            update, "message", None
-                        ), "peer_id", None
-                    ), "channel_id", None
-                ) or getattr(update, "channel_id", None)
+                channel_id = self.sequencer.get_box(update) or None
 
                 pts = getattr(update, "pts", None)
                 pts_count = getattr(update, "pts_count", None)
 
+                if pts and pts_count is not None and self.sequencer.is_duplicate(channel_id or 0, pts, pts_count):
+                    self.sequencer.feed(channel_id or 0, pts, pts_count)
+                    continue
+
                 if pts and not self.skip_updates:
                     await self.storage.update_state(
                         (
@@ -672,8 +761,14 @@ class Client(Methods):
                                 users.update({u.id: u for u in diff.users})
                                 chats.update({c.id: c for c in diff.chats})
 
-                self.dispatcher.updates_queue.put_nowait((update, users, chats))
+                self.sequencer.feed(channel_id or 0, pts, pts_count, (update, users, chats))
         elif isinstance(updates, (raw.types.UpdateShortMessage, raw.types.UpdateShortChatMessage)):
+            self.sequencer.date = updates.date
+
+            if self.sequencer.is_duplicate(0, updates.pts, updates.pts_count):
+                self.sequencer.feed(0, updates.pts, updates.pts_count)
+                return
+
             if not self.skip_updates:
                 await self.storage.update_state(
                     (
@@ -685,31 +780,146 @@ class Client(Methods):
                     )
                 )
 
-            diff = await self.invoke(
-                raw.functions.updates.GetDifference(
-                    pts=updates.pts - updates.pts_count,
+            packet = self.build_short_message(updates)
+
+            if packet is not None:
+                self.sequencer.feed(0, updates.pts, updates.pts_count, packet)
+            else:
+                self.short_messages.append(updates)
+
+                if len(self.short_messages) == 1:
+                    self.loop.create_task(self.fetch_short_messages())
+        elif isinstance(updates, raw.types.UpdateShort):
+            self.dispatcher.updates_queue.put_nowait((updates.update, {}, {}))
+        elif isinstance(updates, raw.types.UpdatesTooLong):
+            log.info(updates)
+
+    def build_short_message(
+        self,
+        updates: Union["raw.types.UpdateShortMessage", "raw.types.UpdateShortChatMessage"]
+    ) -> Optional[tuple]:
+        """Rebuild the full message of a short message update using the cached peers.
+
+        Returns None in case any of the peers needed to parse the message is not cached.
+        """
+        if isinstance(updates, raw.types.UpdateShortMessage):
+            if updates.out and self.me is None:
+                return None
+
+            peer_id = raw.types.PeerUser(user_id=updates.user_id)
+            from_id = raw.types.PeerUser(user_id=self.me.id if updates.out else updates.user_id)
+        else:
+            peer_id = raw.types.PeerChat(chat_id=updates.chat_id)
+            from_id = raw.types.PeerUser(user_id=updates.from_id)
+
+        reply_to = updates.reply_to
+        peers = [
+            peer_id,
+            from_id,
+            raw.types.PeerUser(user_id=updates.via_bot_id) if updates.via_bot_id else None,
+            getattr(updates.fwd_from, "from_id", None),
+            getattr(reply_to, "reply_to_peer_id", None),
+            getattr(getattr(reply_to, "reply_from", None), "from_id", None),
+        ]
+
+        users = {}
+        chats = {}
+
+        for peer in peers:
+            if peer is None:
+                continue
+
+            cached = self.peers_cache[utils.get_peer_id(peer)]
+
+            if cached is None:
+                return None
+
+            (users if isinstance(peer, raw.types.PeerUser) else chats)[utils.get_raw_peer_id(peer)] = cached
+
+        return (
+            raw.types.UpdateNewMessage(
+                message=raw.types.Message(
+                    id=updates.id,
+                    peer_id=peer_id,
+                    from_id=from_id,
                     date=updates.date,
-                    qts=-1
+                    message=updates.message,
+                    out=updates.out,
+                    mentioned=updates.mentioned,
+                    media_unread=updates.media_unread,
+                    silent=updates.silent,
+                    fwd_from=updates.fwd_from,
+                    via_bot_id=updates.via_bot_id,
+                    reply_to=reply_to,
+                    entities=updates.entities,
+                    ttl_period=updates.ttl_period
+                ),
+                pts=updates.pts,
+                pts_count=updates.pts_count
+            ),
+            users,
+            chats
+        )
+
+    async def fetch_short_messages(self):
+        await asyncio.sleep(self.SHORT_MESSAGES_DELAY)
+
+        pending = sorted(self.short_messages, key=lambda u: u.pts)
+        self.short_messages = []
+
+        messages = {}
+        other_updates = []
+        users = {}
+        chats = {}
+
+        pts = pending[0].pts - pending[0].pts_count
+        date = pending[0].date
+
+        try:
+            while any(u.id not in messages for u in pending):
+                diff = await self.invoke(
+                    raw.functions.updates.GetDifference(
+                        pts=pts,
+                        date=date,
+                        qts=-1
+                    )
                 )
-            )
 
-            if diff.new_messages:
-                self.dispatcher.updates_queue.put_nowait((
+                if not isinstance(diff, (raw.types.updates.Difference, raw.types.updates.DifferenceSlice)):
+                    break
+
+                messages.update({m.id: m for m in diff.new_messages})
+                other_updates.extend(diff.other_updates)
+                users.update({u.id: u for u in diff.users})
+                chats.update({c.id: c for c in diff.chats})
+
+                if isinstance(diff, raw.types.updates.Difference):
+                    break
+
+                pts = diff.intermediate_state.pts
+                date = diff.intermediate_state.date
+        except Exception as e:
+            log.exception(e)
+
+        for updates in pending:
+            message = messages.get(updates.id)
+
+            if message is not None:
+                packet = (
                     raw.types.UpdateNewMessage(
-                        message=diff.new_messages[0],
+                        message=message,
                         pts=updates.pts,
                         pts_count=updates.pts_count
                     ),
-                    {u.id: u for u in diff.users},
-                    {c.id: c for c in diff.chats}
-                ))
+                    users,
+                    chats
+                )
+            elif other_updates:  # The other_updates list can be empty
+                packet = (other_updates.pop(0), {}, {})
             else:
-                if diff.other_updates:  # The other_updates list can be empty
-                    self.dispatcher.updates_queue.put_nowait((diff.other_updates[0], {}, {}))
-        elif isinstance(updates, raw.types.UpdateShort):
-            self.dispatcher.updates_queue.put_nowait((updates.update, {}, {}))
-        elif isinstance(updates, raw.types.UpdatesTooLong):
-            log.info(updates)
+                packet = None
+
+            self.sequencer.feed(0, updates.pts, updates.pts_count, packet)
 
     async def recover_gaps(self) -> Tuple[int, int]:
         states = await self.storage.update_state()
@@ -795,6 +1005,8 @@ class Client(Methods):
                 if isinstance(diff, (raw.types.updates.Difference, raw.types.updates.ChannelDifference)):
                     break
 
+            self.sequencer.set_state(utils.get_channel_id(id) if id < 0 else 0, local_pts)
+
             await self.storage.update_state(id)
 
         log.info("Recovered %s messages and %s updates.", message_updates_counter, other_updates_counter)
@@ -994,6 +1206,102 @@ class Client(Methods):
                 shutil.move(temp_file_path, file_path)
                 return file_path
 
+    async def get_media_session(self, dc_id: int) -> Session:
+        async with self.media_sessions_lock:
+            session = self.media_sessions.get(dc_id)
+
+            if session:
+                return session
+
+            session = self.media_sessions[dc_id] = Session(
+                self, dc_id,
+                await Auth(self, dc_id, await self.storage.test_mode()).create()
+                if dc_id != await self.storage.dc_id()
+                else await self.storage.auth_key(),
+                await self.storage.test_mode(),
+                is_media=True
+            )
+            await session.start()
+
+            if dc_id != await self.storage.dc_id():
+                for _ in range(3):
+                    exported_auth = await self.invoke(
+                        raw.functions.auth.ExportAuthorization(
+                            dc_id=dc_id
+                        )
+                    )
+
+                    try:
+                        await session.invoke(
+                            raw.functions.auth.ImportAuthorization(
+                                id=exported_auth.id,
+                                bytes=exported_auth.bytes
+                            )
+                        )
+                    except AuthBytesInvalid:
+                        continue
+                    else:
+                        break
+                else:
+                    raise AuthBytesInvalid
+
+            return session
+
+    async def get_file_range(
+        self,
+        file_id: FileId,
+        start: int = 0,
+        end: int = None
+    ) -> AsyncGenerator[bytes, None]:
+        location = utils.get_input_file_location(file_id)
+        session = await self.get_media_session(file_id.dc_id)
+
+        async def get_part(offset: int, limit: int) -> bytes:
+            # Parts of all ranges share the same media session and the transmissions limit
+            async with self.get_file_semaphore:
+                r = await session.invoke(
+                    raw.functions.upload.GetFile(
+                        location=location,
+                        offset=offset,
+                        limit=limit
+                    ),
+                    sleep_threshold=self.sleep_threshold
+                )
+
+            return r.bytes
+
+        parts = iter(utils.get_file_range_parts(start, end))
+        # Without a known end the next part could lie past the end of the file
+        prefetch = self.FILE_RANGE_PREFETCH if end is not None else 1
+        pending = deque()
+
+        def schedule():
+            for offset, limit in itertools.islice(parts, prefetch - len(pending)):
+                pending.append((offset, limit, self.loop.create_task(get_part(offset, limit))))
+
+        try:
+            schedule()
+
+            while pending:
+                offset, limit, task = pending.popleft()
+                chunk = await task
+
+                schedule()
+
+                skip = max(start - offset, 0)
+                stop = len(chunk) if end is None else min(len(chunk), end - offset)
+
+                if skip < stop:
+                    yield chunk[skip:stop] if skip or stop < len(chunk) else chunk
+
+                if len(chunk) < limit:
+                    break
+        finally:
+            for *_, task in pending:
+                task.cancel()
+
+            await asyncio.gather(*(task for *_, task in pending), return_exceptions=True)
+
     async def get_file(
         self,
         file_id: FileId,
@@ -1004,44 +1312,7 @@ class Client(Methods):
         progress_args: tuple = ()
     ) -> Optional[AsyncGenerator[bytes, None]]:
         async with self.get_file_semaphore:
-            file_type = file_id.file_type
-
-            if file_type == FileType.CHAT_PHOTO:
-                if file_id.chat_id > 0:
-                    peer = raw.types.InputPeerUser(
-                        user_id=file_id.chat_id,
-                        access_hash=file_id.chat_access_hash
-                    )
-                else:
-                    if file_id.chat_access_hash == 0:
-                        peer = raw.types.InputPeerChat(
-                            chat_id=-file_id.chat_id
-                        )
-                    else:
-                        peer = raw.types.InputPeerChannel(
-                            channel_id=utils.get_channel_id(file_id.chat_id),
-                            access_hash=file_id.chat_access_hash
-                        )
-
-                location = raw.types.InputPeerPhotoFileLocation(
-                    peer=peer,
-                    photo_id=file_id.media_id,
-                    big=file_id.thumbnail_source == ThumbnailSource.CHAT_PHOTO_BIG
-                )
-            elif file_type == FileType.PHOTO:
-                location = raw.types.InputPhotoFileLocation(
-                    id=file_id.media_id,
-                    access_hash=file_id.access_hash,
-                    file_reference=file_id.file_reference,
-                    thumb_size=file_id.thumbnail_size
-                )
-            else:
-                location = raw.types.InputDocumentFileLocation(
-                    id=file_id.media_id,
-                    access_hash=file_id.access_hash,
-                    file_reference=file_id.file_reference,
-                    thumb_size=file_id.thumbnail_size
-                )
+            location = utils.get_input_file_location(file_id)
 
             current = 0
             total = abs(limit) or (1 << 31) - 1
@@ -1051,39 +1322,7 @@ class Client(Methods):
             dc_id = file_id.dc_id
 
             try:
-                session = self.media_sessions.get(dc_id)
-                if not session:
-                    session = self.media_sessions[dc_id] = Session(
-                        self, dc_id,
-                        await Auth(self, dc_id, await self.storage.test_mode()).create()
-                        if dc_id != await self.storage.dc_id()
-                        else await self.storage.auth_key(),
-                        await self.storage.test_mode(),
-                        is_media=True
-                    )
-                    await session.start()
-
-                    if dc_id != await self.storage.dc_id():
-                        for _ in range(3):
-                            exported_auth = await self.invoke(
-                                raw.functions.auth.ExportAuthorization(
-                                    dc_id=dc_id
-                                )
-                            )
-
-                            try:
-                                await session.invoke(
-                                    raw.functions.auth.ImportAuthorization(
-                                        id=exported_auth.id,
-                                        bytes=exported_auth.bytes
-                                    )
-                                )
-                            except AuthBytesInvalid:
-                                continue
-                            else:
-                                break
-                        else:
-                            raise AuthBytesInvalid
+                session = await self.get_media_session(dc_id)
 
                 r = await session.invoke(
                     raw.functions.upload.GetFile(
@@ -1222,21 +1461,3 @@ class Client(Methods):
     def guess_extension(self, mime_type: str) -> Optional[str]:
         return self.mimetypes.guess_extension(mime_type)
 
-
-class Cache:
-    def __init__(self, capacity: int):
-        self.capacity = capacity
-        self.store = {}
-
-    def __getitem__(self, key):
-        return self.store.get(key, None)
-
-    def __setitem__(self, key, value):
-        if key in self.store:
-            del self.store[key]
-
-        self.store[key] = value
-
-        if len(self.store) > self.capacity:
-            for _ in range(self.capacity // 2 + 1):
-                del self.store[next(iter(self.store))]
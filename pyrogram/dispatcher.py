@@ -19,7 +19,9 @@
 import asyncio
 import inspect
 import logging
-from collections import OrderedDict
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Tuple
 
 import pyrogram
 from pyrogram import errors, utils, raw
@@ -64,11 +66,174 @@ from pyrogram.raw.types import (
     UpdateBotShippingQuery,
     UpdateStory,
     UpdateBusinessBotCallbackQuery,
+    UpdateUserTyping, UpdateChatUserTyping, UpdateChannelUserTyping,
+    UpdateReadHistoryInbox, UpdateReadHistoryOutbox,
+    UpdateReadChannelInbox, UpdateReadChannelOutbox,
 )
 
 log = logging.getLogger(__name__)
 
 
+class UpdatesQueue:
+    """A drop-in replacement for the FIFO updates queue that schedules updates by priority.
+
+    Updates are split into lanes and served with a weighted round-robin, so that a burst of bulk updates (e.g.: group
+    messages or a gap recovery) can't delay time-critical ones (e.g.: callback queries) for longer than a few slots.
+
+    Parameters:
+        lanes (``dict``):
+            Mapping of raw update types to lane names. Unknown update types go to the "normal" lane.
+
+        weights (``dict``, *optional*):
+            How many updates of a lane can be served in a row before giving the turn to the next lane.
+
+        max_age (``dict``, *optional*):
+            Maximum number of seconds an update of a lane can wait in the queue. Older updates are dropped.
+    """
+
+    LANES = ("high", "normal", "low")
+    WEIGHTS = {"high": 8, "normal": 4, "low": 1}
+
+    def __init__(
+        self,
+        lanes: Dict[type, str],
+        weights: Dict[str, int] = None,
+        max_age: Dict[str, float] = None
+    ):
+        self.lane_of = lanes
+        self.weights = {**self.WEIGHTS, **(weights or {})}
+        self.max_age = max_age or {}
+
+        self.lanes = {lane: deque() for lane in self.LANES}
+        self.credits = dict(self.weights)
+        self.sentinels = 0
+        self.waiters = deque()
+
+        self.unfinished = 0
+        self.finished = asyncio.Event()
+        self.finished.set()
+
+        self.counters = {
+            lane: {"processed": 0, "dropped": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for lane in self.LANES
+        }
+
+    def qsize(self) -> int:
+        return sum(len(i) for i in self.lanes.values())
+
+    def empty(self) -> bool:
+        return not self.qsize()
+
+    def put_nowait(self, packet):
+        self.unfinished += 1
+        self.finished.clear()
+
+        if packet is None:
+            # Stop signals are only delivered once all the updates a worker can serve have been handled
+            self.sentinels += 1
+            lane = None
+        else:
+            lane = self.lane_of.get(type(packet[0]), "normal")
+            self.lanes[lane].append((time.monotonic(), packet))
+
+        self._wake_up(lane)
+
+    async def put(self, packet):
+        self.put_nowait(packet)
+
+    async def get(self, lanes: Optional[Tuple[str, ...]] = None):
+        while True:
+            lane = self._select(lanes)
+
+            if lane is not None:
+                enqueued_at, packet = self.lanes[lane].popleft()
+                wait = time.monotonic() - enqueued_at
+                counters = self.counters[lane]
+
+                if wait > self.max_age.get(lane, wait):
+                    counters["dropped"] += 1
+                    self.task_done()
+                    continue
+
+                counters["processed"] += 1
+                counters["total_wait"] += wait
+                counters["max_wait"] = max(counters["max_wait"], wait)
+
+                return packet
+
+            if self.sentinels:
+                self.sentinels -= 1
+                return None
+
+            waiter = asyncio.get_event_loop().create_future()
+            self.waiters.append((waiter, lanes))
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                for i in self.waiters:
+                    if i[0] is waiter:
+                        self.waiters.remove(i)
+                        break
+                else:
+                    # Already woken up: pass the turn on to another worker
+                    self._wake_up(None)
+
+                raise
+
+    def task_done(self):
+        self.unfinished -= 1
+
+        if self.unfinished <= 0:
+            self.unfinished = 0
+            self.finished.set()
+
+    async def join(self):
+        await self.finished.wait()
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        return {
+            lane: {
+                "pending": len(self.lanes[lane]),
+                "processed": counters["processed"],
+                "dropped": counters["dropped"],
+                "average_wait": counters["total_wait"] / counters["processed"] if counters["processed"] else 0.0,
+                "max_wait": counters["max_wait"],
+            }
+            for lane, counters in self.counters.items()
+        }
+
+    def _wake_up(self, lane: Optional[str]):
+        for i in self.waiters:
+            waiter, lanes = i
+
+            if lane is None or lanes is None or lane in lanes:
+                self.waiters.remove(i)
+                waiter.set_result(None)
+                break
+
+    def _select(self, lanes: Optional[Tuple[str, ...]]) -> Optional[str]:
+        candidates = [
+            lane for lane in self.LANES
+            if self.lanes[lane] and (lanes is None or lane in lanes)
+        ]
+
+        if not candidates:
+            return None
+
+        for lane in candidates:
+            if self.credits[lane] > 0:
+                self.credits[lane] -= 1
+                return lane
+
+        # Every lane with pending updates used up its turns: start a new round
+        self.credits = dict(self.weights)
+        self.credits[candidates[0]] -= 1
+
+        return candidates[0]
+
+
 class Dispatcher:
     NEW_MESSAGE_UPDATES = (UpdateNewMessage, UpdateNewChannelMessage, UpdateNewScheduledMessage, UpdateBotNewBusinessMessage)
     EDIT_MESSAGE_UPDATES = (UpdateEditMessage, UpdateEditChannelMessage, UpdateBotEditBusinessMessage)
@@ -87,6 +252,24 @@ class Dispatcher:
     SHIPPING_QUERY_UPDATES = (UpdateBotShippingQuery,)
     NEW_STORY_UPDATES = (UpdateStory,)
 
+    # Lanes used when prioritized dispatching is enabled, anything else goes to the "normal" lane
+    HIGH_PRIORITY_UPDATES = (
+        CALLBACK_QUERY_UPDATES
+        + BOT_INLINE_QUERY_UPDATES
+        + CHOSEN_INLINE_RESULT_UPDATES
+        + PRE_CHECKOUT_QUERY_UPDATES
+        + SHIPPING_QUERY_UPDATES
+    )
+    LOW_PRIORITY_UPDATES = (
+        USER_STATUS_UPDATES
+        + MESSAGE_BOT_A_REACTION_UPDATES
+        + (
+            UpdateUserTyping, UpdateChatUserTyping, UpdateChannelUserTyping,
+            UpdateReadHistoryInbox, UpdateReadHistoryOutbox,
+            UpdateReadChannelInbox, UpdateReadChannelOutbox,
+        )
+    )
+
     def __init__(self, client: "pyrogram.Client"):
         self.client = client
         self.loop = asyncio.get_event_loop()
@@ -94,7 +277,22 @@ class Dispatcher:
         self.handler_worker_tasks = []
         self.locks_list = []
 
-        self.updates_queue = asyncio.Queue()
+        self.update_lanes = client.update_lanes
+
+        if self.update_lanes is not None:
+            lanes = {
+                **{update: "high" for update in Dispatcher.HIGH_PRIORITY_UPDATES},
+                **{update: "low" for update in Dispatcher.LOW_PRIORITY_UPDATES},
+                **self.update_lanes.get("lanes", {})
+            }
+
+            self.updates_queue = UpdatesQueue(
+                lanes,
+                weights=self.update_lanes.get("weights"),
+                max_age=self.update_lanes.get("max_age")
+            )
+        else:
+            self.updates_queue = asyncio.Queue()
         self.groups = OrderedDict()
 
         async def message_parser(update, users, chats):
@@ -242,11 +440,22 @@ class Dispatcher:
 
     async def start(self):
         if not self.client.no_updates:
+            reserved_workers = 0
+
+            if self.update_lanes is not None:
+                # At least one worker must be left for the other lanes
+                reserved_workers = min(self.update_lanes.get("reserved_workers", 0), self.client.workers - 1)
+
             for i in range(self.client.workers):
                 self.locks_list.append(asyncio.Lock())
 
                 self.handler_worker_tasks.append(
-                    self.loop.create_task(self.handler_worker(self.locks_list[-1]))
+                    self.loop.create_task(
+                        self.handler_worker(
+                            self.locks_list[-1],
+                            ("high",) if i < reserved_workers else None
+                        )
+                    )
                 )
 
             log.info("Started %s HandlerTasks", self.client.workers)
@@ -300,9 +509,9 @@ class Dispatcher:
 
         self.loop.create_task(fn())
 
-    async def handler_worker(self, lock):
+    async def handler_worker(self, lock, lanes: Optional[Tuple[str, ...]] = None):
         while True:
-            packet = await self.updates_queue.get()
+            packet = await (self.updates_queue.get(lanes) if lanes else self.updates_queue.get())
 
             if packet is None:
                 break
@@ -0,0 +1,179 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pyrogram
+from pyrogram import raw
+from pyrogram.file_id import FileId, FileType, ThumbnailSource
+from pyrogram.raw.core import TLObject
+
+log = logging.getLogger(__name__)
+
+
+class ExportSink:
+    """Destination of the records produced by :meth:`~pyrogram.Client.export_chats`.
+
+    Records are dicts holding raw objects: ``{"chat_id": ..., "message": ..., "media": ...}`` for messages and
+    ``{"user": ...}`` or ``{"chat": ...}`` for the users and chats they refer to, written the first time they are seen.
+    Records are written in batches and an export checkpoint is only saved once :meth:`write` returns, so a sink must
+    have persisted them by then.
+    """
+
+    async def write(self, records: List[dict]):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class JSONLinesSink(ExportSink):
+    """Append records to a file, one JSON object per line.
+
+    Raw objects are converted the same way they are printed, with the ``_`` key holding their type. The file is
+    opened in append mode, so that resumed exports continue where they left off.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.file = None
+        self.lock = asyncio.Lock()
+
+    def _write(self, records: List[dict]):
+        if self.file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.path, "a", encoding="utf-8")
+
+        for record in records:
+            self.file.write(json.dumps(record, default=TLObject.default, ensure_ascii=False))
+            self.file.write("\n")
+
+        self.file.flush()
+
+    async def write(self, records: List[dict]):
+        async with self.lock:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, records)
+
+    async def close(self):
+        async with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def get_media_file(
+    client: "pyrogram.Client",
+    media: "raw.base.MessageMedia"
+) -> Optional[Tuple[FileId, int, str]]:
+    """Get the file id, size and file name of the photo or document of a raw message, if it has one."""
+    if isinstance(media, raw.types.MessageMediaPhoto) and isinstance(media.photo, raw.types.Photo):
+        photo = media.photo
+        sizes = []
+
+        for size in photo.sizes:
+            if isinstance(size, raw.types.PhotoSize):
+                sizes.append((size.size, size.type))
+            elif isinstance(size, raw.types.PhotoSizeProgressive):
+                sizes.append((max(size.sizes), size.type))
+
+        if not sizes:
+            return None
+
+        file_size, thumbnail_size = max(sizes)
+        file_id = FileId(
+            file_type=FileType.PHOTO,
+            dc_id=photo.dc_id,
+            media_id=photo.id,
+            access_hash=photo.access_hash,
+            file_reference=photo.file_reference,
+            thumbnail_source=ThumbnailSource.THUMBNAIL,
+            thumbnail_file_type=FileType.PHOTO,
+            thumbnail_size=thumbnail_size,
+            volume_id=0,
+            local_id=0
+        )
+
+        return file_id, file_size, f"{photo.id}.jpg"
+
+    if isinstance(media, raw.types.MessageMediaDocument) and isinstance(media.document, raw.types.Document):
+        document = media.document
+        file_name = next(
+            (a.file_name for a in document.attributes if isinstance(a, raw.types.DocumentAttributeFilename)),
+            None
+        )
+
+        if file_name:
+            # Keep the name but never let it point outside the media directory
+            file_name = f"{document.id}_{os.path.basename(file_name)}"
+        else:
+            file_name = f"{document.id}{client.guess_extension(document.mime_type) or ''}"
+
+        file_id = FileId(
+            file_type=FileType.DOCUMENT,
+            dc_id=document.dc_id,
+            media_id=document.id,
+            access_hash=document.access_hash,
+            file_reference=document.file_reference
+        )
+
+        return file_id, document.size, file_name
+
+    return None
+
+
+async def download_media_file(client: "pyrogram.Client", file_id: FileId, file_size: int, path: Path) -> bool:
+    """Download a file through the chunked downloader into a temporary file, which is renamed once complete.
+
+    Returns False, leaving no file behind, if fewer bytes than *file_size* were received: the downloader logs errors
+    instead of raising them. The temporary file is removed as well when the download raises or is cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    tmp_path = path.with_name(path.name + ".temp")
+    received = 0
+    completed = False
+
+    await loop.run_in_executor(None, lambda: path.parent.mkdir(parents=True, exist_ok=True))
+
+    f = await loop.run_in_executor(None, open, tmp_path, "wb")
+
+    try:
+        async for chunk in client.get_file(file_id, file_size):
+            await loop.run_in_executor(None, f.write, chunk)
+            received += len(chunk)
+
+        completed = received >= file_size
+    finally:
+        # Not awaited, the task may be being cancelled
+        f.close()
+
+        if not completed:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    if not completed:
+        return False
+
+    await loop.run_in_executor(None, os.replace, tmp_path, path)
+
+    return True
@@ -17,12 +17,12 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 import base64
+import copy
 import functools
 import logging
 import struct
 import typing
 from enum import IntEnum
-from io import BytesIO
 from typing import List
 
 from pyrogram.raw.core import Bytes, String
@@ -56,31 +56,42 @@ def b64_decode(s: str) -> bytes:
     return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
 
 
+# Runs of zeros by length, decoded and encoded
+ZEROS = [bytes(i) for i in range(256)]
+ZERO_RUNS = [bytes((0, i)) for i in range(256)]
+
+
 def rle_encode(s: bytes) -> bytes:
     """Zero-value RLE encoder
+
     Parameters:
         s (``bytes``):
             Bytes to encode
+
     Returns:
         ``bytes``: The encoded bytes
     """
-    r: List[int] = []
+    if b"\x00" not in s:
+        return s
+
+    # Splitting on zeros leaves an empty part for each zero that follows another one
+    parts = s.split(b"\x00")
+    r: List[bytes] = [parts[0]]
     n: int = 0
 
-    for b in s:
-        if not b:
-            n += 1
-        else:
-            if n:
-                r.extend((0, n))
-                n = 0
+    for part in parts[1:]:
+        n += 1
 
-            r.append(b)
+        if part:
+            r.append(ZERO_RUNS[n] if n <= 255 else zero_runs(n))
+            r.append(part)
+            n = 0
 
     if n:
-        r.extend((0, n))
+        r.append(ZERO_RUNS[n] if n <= 255 else zero_runs(n))
+
+    return b"".join(r)
 
-    return bytes(r)
 
 def rle_decode(s: bytes) -> bytes:
     """Zero-value RLE decoder
@@ -92,21 +103,42 @@ def rle_decode(s: bytes) -> bytes:
     Returns:
         ``bytes``: The decoded bytes
     """
-    r: List[int] = []
-    z: bool = False
+    if b"\x00" not in s:
+        return s
 
-    for b in s:
-        if not b:
-            z = True
-            continue
+    # Each part after a zero starts with the length of the run, empty parts come from zeros without a length
+    parts = s.split(b"\x00")
+    r: List[bytes] = [parts[0]]
 
-        if z:
-            r.extend((0,) * b)
-            z = False
-        else:
-            r.append(b)
+    for part in parts[1:]:
+        if part:
+            r.append(ZEROS[part[0]])
+            r.append(part[1:])
+
+    return b"".join(r)
 
-    return bytes(r)
+
+def zero_runs(n: int) -> bytes:
+    """Encode a run of *n* zeros, split into runs of at most 255 zeros"""
+    if n <= 255:
+        return ZERO_RUNS[n]
+
+    return ZERO_RUNS[255] * (n // 255) + (ZERO_RUNS[n % 255] if n % 255 else b"")
+
+
+def read_bytes(data: bytes, offset: int) -> typing.Tuple[bytes, int]:
+    """Read a TL-serialized bytes value, returning it together with the offset right after it"""
+    length = data[offset]
+
+    if length <= 253:
+        offset += 1
+        end = offset + length
+        return data[offset:end], end + -(length + 1) % 4
+
+    length = int.from_bytes(data[offset + 1:offset + 4], "little")
+    offset += 4
+    end = offset + length
+    return data[offset:end], end + -length % 4
 
 
 class FileType(IntEnum):
@@ -150,17 +182,45 @@ DOCUMENT_TYPES = set(FileType) - PHOTO_TYPES
 WEB_LOCATION_FLAG = 1 << 24
 FILE_REFERENCE_FLAG = 1 << 25
 
+# Binary layouts of the file id fields
+HEADER = struct.Struct("<ii")  # file_type, dc_id
+LONG = struct.Struct("<q")
+INT = struct.Struct("<i")
+LOCATION = struct.Struct("<qq")  # media_id, access_hash
+LEGACY = struct.Struct("<qi")  # secret, local_id
+THUMBNAIL = struct.Struct("<iii")  # thumbnail_file_type, thumbnail_size, local_id
+PEER_PHOTO = struct.Struct("<qqi")  # chat_id or sticker_set_id, access hash, local_id
+VERSION = struct.Struct("<bb")  # minor, major
+DOCUMENT_VERSION = struct.Struct("<ii")  # minor, major
+
+UNIQUE_WEB = struct.Struct("<is")
+UNIQUE_PHOTO = struct.Struct("<iqi")  # file_unique_type, volume_id, local_id
+UNIQUE_DOCUMENT = struct.Struct("<iq")  # file_unique_type, media_id
+
+# Number of file ids kept by each of the encode and decode caches
+CACHE_SIZE = 8192
+
 
 class FileId:
     MAJOR = 4
     MINOR = 30
 
-    @functools.lru_cache(maxsize=8128)
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def __new__(cls, **kwargs) -> "FileIdCached":
         return FileIdCached(**kwargs)
 
     @staticmethod
-    def decode(file_id: str):
+    def decode(file_id: str) -> "FileIdCached":
+        """Decode a file id.
+
+        Decoded file ids are cached, every caller gets its own shallow copy since they can be modified. The copies
+        share the field values, such as the ``file_reference`` bytes, which must be replaced and not changed in place.
+        """
+        return copy.copy(FileId._decode(file_id))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def _decode(file_id: str) -> "FileIdCached":
         decoded = rle_decode(b64_decode(file_id))
 
         # region read version
@@ -169,13 +229,14 @@ class FileId:
 
         if major < 4:
             minor = 0
-            buffer = BytesIO(decoded[:-1])
+            data = decoded[:-1]
         else:
             minor = decoded[-2]
-            buffer = BytesIO(decoded[:-2])
+            data = decoded[:-2]
         # endregion
 
-        file_type, dc_id = struct.unpack("<ii", buffer.read(8))
+        file_type, dc_id = HEADER.unpack_from(data)
+        offset = HEADER.size
 
         # region media type flags
         # Check for flags existence
@@ -193,8 +254,9 @@ class FileId:
             raise ValueError(f"Unknown file_type {file_type} of file_id {file_id}")
 
         if has_web_location:
-            url = String.read(buffer)
-            access_hash, = struct.unpack("<q", buffer.read(8))
+            url, offset = read_bytes(data, offset)
+            url = url.decode(errors="replace")
+            access_hash, = LONG.unpack_from(data, offset)
 
             return FileId(
                 major=major,
@@ -205,12 +267,19 @@ class FileId:
                 access_hash=access_hash
             )
 
-        file_reference = Bytes.read(buffer) if has_file_reference else b""
-        media_id, access_hash = struct.unpack("<qq", buffer.read(16))
+        file_reference, offset = read_bytes(data, offset) if has_file_reference else (b"", offset)
+        media_id, access_hash = LOCATION.unpack_from(data, offset)
+        offset += LOCATION.size
 
         if file_type in PHOTO_TYPES:
-            volume_id, = struct.unpack("<q", buffer.read(8))
-            thumbnail_source, = (0,) if major < 4 else struct.unpack("<i", buffer.read(4))
+            volume_id, = LONG.unpack_from(data, offset)
+            offset += LONG.size
+
+            if major < 4:
+                thumbnail_source = 0
+            else:
+                thumbnail_source, = INT.unpack_from(data, offset)
+                offset += INT.size
 
             try:
                 thumbnail_source = ThumbnailSource(thumbnail_source)
@@ -218,7 +287,7 @@ class FileId:
                 raise ValueError(f"Unknown thumbnail_source {thumbnail_source} of file_id {file_id}")
 
             if thumbnail_source == ThumbnailSource.LEGACY:
-                secret, local_id = struct.unpack("<qi", buffer.read(12))
+                secret, local_id = LEGACY.unpack_from(data, offset)
 
                 return FileId(
                     major=major,
@@ -235,7 +304,7 @@ class FileId:
                 )
 
             if thumbnail_source == ThumbnailSource.THUMBNAIL:
-                thumbnail_file_type, thumbnail_size, local_id = struct.unpack("<iii", buffer.read(12))
+                thumbnail_file_type, thumbnail_size, local_id = THUMBNAIL.unpack_from(data, offset)
                 thumbnail_size = chr(thumbnail_size)
 
                 return FileId(
@@ -254,7 +323,7 @@ class FileId:
                 )
 
             if thumbnail_source in (ThumbnailSource.CHAT_PHOTO_SMALL, ThumbnailSource.CHAT_PHOTO_BIG):
-                chat_id, chat_access_hash, local_id = struct.unpack("<qqi", buffer.read(20))
+                chat_id, chat_access_hash, local_id = PEER_PHOTO.unpack_from(data, offset)
 
                 return FileId(
                     major=major,
@@ -272,7 +341,7 @@ class FileId:
                 )
 
             if thumbnail_source == ThumbnailSource.STICKER_SET_THUMBNAIL:
-                sticker_set_id, sticker_set_access_hash, local_id = struct.unpack("<qqi", buffer.read(20))
+                sticker_set_id, sticker_set_access_hash, local_id = PEER_PHOTO.unpack_from(data, offset)
 
                 return FileId(
                     major=major,
@@ -301,6 +370,11 @@ class FileId:
             )
 
 
+def encode_file_id(**kwargs) -> str:
+    """Encode the file id made of the given fields, see :class:`FileIdCached`"""
+    return FileId(**kwargs).encode()
+
+
 class FileIdCached:
     MAJOR = 4
     MINOR = 30
@@ -328,24 +402,27 @@ class FileIdCached:
             sticker_set_id: int = None,
             sticker_set_access_hash: int = None
     ):
-        self.major = major
-        self.minor = minor
-        self.file_type = file_type
-        self.dc_id = dc_id
-        self.file_reference = file_reference
-        self.url = url
-        self.media_id = media_id
-        self.access_hash = access_hash
-        self.volume_id = volume_id
-        self.thumbnail_source = thumbnail_source
-        self.thumbnail_file_type = thumbnail_file_type
-        self.thumbnail_size = thumbnail_size
-        self.secret = secret
-        self.local_id = local_id
-        self.chat_id = chat_id
-        self.chat_access_hash = chat_access_hash
-        self.sticker_set_id = sticker_set_id
-        self.sticker_set_access_hash = sticker_set_access_hash
+        # Set all at once, bypassing __setattr__: there is no encoded file id to invalidate yet
+        self.__dict__.update(
+            major=major,
+            minor=minor,
+            file_type=file_type,
+            dc_id=dc_id,
+            file_reference=file_reference,
+            url=url,
+            media_id=media_id,
+            access_hash=access_hash,
+            volume_id=volume_id,
+            thumbnail_source=thumbnail_source,
+            thumbnail_file_type=thumbnail_file_type,
+            thumbnail_size=thumbnail_size,
+            secret=secret,
+            local_id=local_id,
+            chat_id=chat_id,
+            chat_access_hash=chat_access_hash,
+            sticker_set_id=sticker_set_id,
+            sticker_set_access_hash=sticker_set_access_hash
+        )
 
     def __setattr__(self, key, value):
         if self._encoded is not None and key != "_encoded":
@@ -353,14 +430,16 @@ class FileIdCached:
         super().__setattr__(key, value)
 
     def encode(self, *, major: int = None, minor: int = None):
-        if self._encoded is not None:
+        # Only the file id of the current version is kept
+        if major is None and minor is None:
+            if self._encoded is None:
+                self._encoded = self.encode(major=self.major, minor=self.minor)
+
             return self._encoded
 
         major = major if major is not None else self.major
         minor = minor if minor is not None else self.minor
 
-        buffer = BytesIO()
-
         file_type = self.file_type
 
         if self.url:
@@ -369,55 +448,39 @@ class FileIdCached:
         if self.file_reference:
             file_type |= FILE_REFERENCE_FLAG
 
-        buffer.write(struct.pack("<ii", file_type, self.dc_id))
+        buffer = bytearray(HEADER.pack(file_type, self.dc_id))
 
         if self.url:
-            buffer.write(String(self.url))
+            Bytes.append(buffer, self.url.encode())
 
         if self.file_reference:
-            buffer.write(Bytes(self.file_reference))
+            Bytes.append(buffer, self.file_reference)
 
-        buffer.write(struct.pack("<qq", self.media_id, self.access_hash))
+        buffer += LOCATION.pack(self.media_id, self.access_hash)
 
         if self.file_type in PHOTO_TYPES:
-            buffer.write(struct.pack("<q", self.volume_id))
+            buffer += LONG.pack(self.volume_id)
 
             if major >= 4:
-                buffer.write(struct.pack("<i", self.thumbnail_source))
+                buffer += INT.pack(self.thumbnail_source)
 
             if self.thumbnail_source == ThumbnailSource.LEGACY:
-                buffer.write(struct.pack("<qi", self.secret, self.local_id))
+                buffer += LEGACY.pack(self.secret, self.local_id)
             elif self.thumbnail_source == ThumbnailSource.THUMBNAIL:
-                buffer.write(struct.pack(
-                    "<iii",
-                    self.thumbnail_file_type,
-                    ord(self.thumbnail_size),
-                    self.local_id
-                ))
+                buffer += THUMBNAIL.pack(self.thumbnail_file_type, ord(self.thumbnail_size), self.local_id)
             elif self.thumbnail_source in (ThumbnailSource.CHAT_PHOTO_SMALL, ThumbnailSource.CHAT_PHOTO_BIG):
-                buffer.write(struct.pack(
-                    "<qqi",
-                    self.chat_id,
-                    self.chat_access_hash,
-                    self.local_id
-                ))
+                buffer += PEER_PHOTO.pack(self.chat_id, self.chat_access_hash, self.local_id)
             elif self.thumbnail_source == ThumbnailSource.STICKER_SET_THUMBNAIL:
-                buffer.write(struct.pack(
-                    "<qqi",
-                    self.sticker_set_id,
-                    self.sticker_set_access_hash,
-                    self.local_id
-                ))
+                buffer += PEER_PHOTO.pack(self.sticker_set_id, self.sticker_set_access_hash, self.local_id)
         elif file_type in DOCUMENT_TYPES:
-            buffer.write(struct.pack("<ii", minor, major))
+            buffer += DOCUMENT_VERSION.pack(minor, major)
 
-        buffer.write(struct.pack("<bb", minor, major))
+        buffer += VERSION.pack(minor, major)
 
-        self._encoded = b64_encode(rle_encode(buffer.getvalue()))
-        return self._encoded
+        return b64_encode(rle_encode(bytes(buffer)))
 
     def __str__(self):
-        return str({k: v for k, v in self.__dict__.items() if v is not None})
+        return str({k: v for k, v in self.__dict__.items() if v is not None and not k.startswith("_")})
 
 
 class FileUniqueType(IntEnum):
@@ -431,14 +494,23 @@ class FileUniqueType(IntEnum):
 
 
 class FileUniqueId:
-    @functools.lru_cache(maxsize=8128)
+    @functools.lru_cache(maxsize=CACHE_SIZE)
     def __new__(cls, **kwargs) -> "FileUniqueIdCached":
         return FileUniqueIdCached(**kwargs)
 
     @staticmethod
-    def decode(file_unique_id: str):
-        buffer = BytesIO(rle_decode(b64_decode(file_unique_id)))
-        file_unique_type, = struct.unpack("<i", buffer.read(4))
+    def decode(file_unique_id: str) -> "FileUniqueIdCached":
+        """Decode a file unique id.
+
+        Same as :meth:`FileId.decode`, every caller gets its own shallow copy of the cached object.
+        """
+        return copy.copy(FileUniqueId._decode(file_unique_id))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def _decode(file_unique_id: str) -> "FileUniqueIdCached":
+        data = rle_decode(b64_decode(file_unique_id))
+        file_unique_type, = INT.unpack_from(data)
 
         try:
             file_unique_type = FileUniqueType(file_unique_type)
@@ -446,7 +518,7 @@ class FileUniqueId:
             raise ValueError(f"Unknown file_unique_type {file_unique_type} of file_unique_id {file_unique_id}")
 
         if file_unique_type == FileUniqueType.WEB:
-            url = String.read(buffer)
+            url = read_bytes(data, INT.size)[0].decode(errors="replace")
 
             return FileUniqueId(
                 file_unique_type=file_unique_type,
@@ -454,7 +526,7 @@ class FileUniqueId:
             )
 
         if file_unique_type == FileUniqueType.PHOTO:
-            volume_id, local_id = struct.unpack("<qi", buffer.read())
+            _, volume_id, local_id = UNIQUE_PHOTO.unpack(data)
 
             return FileUniqueId(
                 file_unique_type=file_unique_type,
@@ -463,7 +535,7 @@ class FileUniqueId:
             )
 
         if file_unique_type == FileUniqueType.DOCUMENT:
-            media_id, = struct.unpack("<q", buffer.read())
+            _, media_id = UNIQUE_DOCUMENT.unpack(data)
 
             return FileUniqueId(
                 file_unique_type=file_unique_type,
@@ -474,6 +546,11 @@ class FileUniqueId:
         raise ValueError(f"Unknown decoder for file_unique_type {file_unique_type} of file_unique_id {file_unique_id}")
 
 
+def encode_file_unique_id(**kwargs) -> str:
+    """Encode the file unique id made of the given fields, see :class:`FileUniqueIdCached`"""
+    return FileUniqueId(**kwargs).encode()
+
+
 class FileUniqueIdCached:
     _encoded: typing.Optional[str] = None
 
@@ -485,11 +562,14 @@ class FileUniqueIdCached:
             volume_id: int = None,
             local_id: int = None
     ):
-        self.file_unique_type = file_unique_type
-        self.url = url
-        self.media_id = media_id
-        self.volume_id = volume_id
-        self.local_id = local_id
+        # Set all at once, bypassing __setattr__: there is no encoded file unique id to invalidate yet
+        self.__dict__.update(
+            file_unique_type=file_unique_type,
+            url=url,
+            media_id=media_id,
+            volume_id=volume_id,
+            local_id=local_id
+        )
 
     def __setattr__(self, key, value):
         if self._encoded is not None and key != "_encoded":
@@ -501,11 +581,11 @@ class FileUniqueIdCached:
             return self._encoded
 
         if self.file_unique_type == FileUniqueType.WEB:
-            string = struct.pack("<is", self.file_unique_type, String(self.url))
+            string = UNIQUE_WEB.pack(self.file_unique_type, String(self.url))
         elif self.file_unique_type == FileUniqueType.PHOTO:
-            string = struct.pack("<iqi", self.file_unique_type, self.volume_id, self.local_id)
+            string = UNIQUE_PHOTO.pack(self.file_unique_type, self.volume_id, self.local_id)
         elif self.file_unique_type == FileUniqueType.DOCUMENT:
-            string = struct.pack("<iq", self.file_unique_type, self.media_id)
+            string = UNIQUE_DOCUMENT.pack(self.file_unique_type, self.media_id)
         else:
             # TODO: Missing encoder for SECURE, ENCRYPTED and TEMP
             raise ValueError(f"Unknown encoder for file_unique_type {self.file_unique_type}")
@@ -514,4 +594,4 @@ class FileUniqueIdCached:
         return self._encoded
 
     def __str__(self):
-        return str({k: v for k, v in self.__dict__.items() if v is not None})
+        return str({k: v for k, v in self.__dict__.items() if v is not None and not k.startswith("_")})
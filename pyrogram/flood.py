@@ -0,0 +1,146 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, Hashable, Optional, Tuple, Type
+
+from pyrogram.errors import FloodWait, RPCError
+from pyrogram.raw.core import TLObject
+
+log = logging.getLogger(__name__)
+
+# Fields holding the peer a query targets, in order of preference
+PEER_FIELDS = ("peer", "to_peer", "channel", "user_id")
+PEER_ID_FIELDS = ("user_id", "chat_id", "channel_id")
+
+
+def get_peer_key(query: TLObject) -> Optional[Hashable]:
+    """Get a hashable key identifying the peer targeted by a raw query, if any."""
+    for field in PEER_FIELDS:
+        peer = getattr(query, field, None)
+
+        if not isinstance(peer, TLObject):
+            continue
+
+        for id_field in PEER_ID_FIELDS:
+            peer_id = getattr(peer, id_field, None)
+
+            if isinstance(peer_id, int):
+                return id_field, peer_id
+
+        # InputPeerSelf, InputUserSelf, ...
+        return type(peer).__name__,
+
+    return None
+
+
+class FloodRegistry:
+    """Client-wide record of the flood waits imposed by Telegram.
+
+    When a request fails with a flood wait, its method and target peer are blocked until the wait expires: other
+    requests for the same method and peer wait for it before being sent instead of hitting the same error again.
+    Requests without a target peer block their method for every peer.
+
+    Keys are ``(query_name, peer)`` tuples, where *peer* is the key returned by :func:`get_peer_key` or None.
+    """
+
+    def __init__(self):
+        # key -> (expiry, error class)
+        self.waits: Dict[tuple, Tuple[float, Type[RPCError]]] = {}
+
+        self.floods = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.delayed_seconds = 0.0
+
+    def add(self, query_name: str, peer: Optional[Hashable], seconds: float, error: Type[RPCError] = FloodWait):
+        key = (query_name, peer)
+        expiry = time.monotonic() + seconds
+
+        if key not in self.waits or self.waits[key][0] < expiry:
+            self.waits[key] = (expiry, error)
+
+        self.floods += 1
+
+    def get(self, query_name: str, peer: Optional[Hashable] = None) -> Tuple[float, Type[RPCError]]:
+        """Get the remaining seconds a request must wait for, together with the flood error that caused the wait."""
+        now = time.monotonic()
+        remaining, error = 0.0, FloodWait
+
+        for key in {(query_name, None), (query_name, peer)}:
+            wait = self.waits.get(key)
+
+            if wait is None:
+                continue
+
+            expiry, wait_error = wait
+
+            if expiry <= now:
+                del self.waits[key]
+            elif expiry - now > remaining:
+                remaining, error = expiry - now, wait_error
+
+        return remaining, error
+
+    async def wait(self, query_name: str, peer: Optional[Hashable], sleep_threshold: float, client_name: str = ""):
+        """Wait for an active flood wait of the request to expire.
+
+        Raises the flood error right away, without waiting, if the remaining time is above *sleep_threshold*, the same
+        way a request failing with that error would.
+        """
+        remaining, error = self.get(query_name, peer)
+
+        if not remaining:
+            return
+
+        if remaining > sleep_threshold >= 0:
+            self.rejected += 1
+            raise error(value=math.ceil(remaining), rpc_name=query_name)
+
+        log.info(f'[{client_name}] Waiting for {remaining:.1f} seconds before sending "{query_name}" '
+                 f'(flood wait still active)')
+
+        self.delayed += 1
+        self.delayed_seconds += remaining
+
+        await asyncio.sleep(remaining)
+
+    def current(self) -> Dict[tuple, float]:
+        """Get the active flood waits as a ``{(query_name, peer): remaining_seconds}`` dict."""
+        now = time.monotonic()
+
+        for key in [k for k, (expiry, _) in self.waits.items() if expiry <= now]:
+            del self.waits[key]
+
+        return {key: expiry - now for key, (expiry, _) in self.waits.items()}
+
+    def clear(self):
+        self.waits.clear()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "active": len(self.current()),
+            "floods": self.floods,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "delayed_seconds": self.delayed_seconds,
+        }
@@ -70,6 +70,12 @@ class Invoke:
         if not self.is_connected:
             raise ConnectionError("Client has not been started yet")
 
+        if self.rate_limiter:
+            inner_query = query.query if isinstance(query, raw.functions.InvokeWithBusinessConnection) else query
+
+            if self.rate_limiter.is_limited(inner_query):
+                await self.rate_limiter.acquire(inner_query)
+
         if self.no_updates:
             query = raw.functions.InvokeWithoutUpdates(query=query)
 
@@ -86,4 +92,7 @@ class Invoke:
         await self.fetch_peers(getattr(r, "users", []))
         await self.fetch_peers(getattr(r, "chats", []))
 
+        if not self.no_updates:
+            self.sequencer.feed_result(query, r)
+
         return r
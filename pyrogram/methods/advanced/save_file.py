@@ -17,13 +17,13 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+import contextlib
 import functools
 import inspect
 import io
 import logging
 import math
 import os
-from hashlib import md5
 from pathlib import PurePath
 from typing import Union, BinaryIO, Callable
 
@@ -31,9 +31,18 @@ import pyrogram
 from pyrogram import StopTransmission
 from pyrogram import raw
 from pyrogram.session import Session
+from pyrogram.upload_manifest import UploadManifest, get_fingerprint
+from pyrogram.upload_reader import UploadReader
 
 log = logging.getLogger(__name__)
 
+PART_SIZE = 512 * 1024
+
+# Attempts made to send a part of a resumable upload again, waiting PART_RETRY_DELAY seconds before the first
+# one and doubling the delay each time
+PART_RETRIES = 3
+PART_RETRY_DELAY = 1
+
 
 class SaveFile:
     async def save_file(
@@ -42,7 +51,8 @@ class SaveFile:
         file_id: int = None,
         file_part: int = 0,
         progress: Callable = None,
-        progress_args: tuple = ()
+        progress_args: tuple = (),
+        resumable: bool = None
     ):
         """Upload a file onto Telegram servers, without actually sending the message to anyone.
         Useful whenever an InputFile type is required.
@@ -75,6 +85,12 @@ class SaveFile:
                 You can pass anything you need to be available in the progress callback scope; for example, a Message
                 object or a Client instance in order to edit the message with the updated progress status.
 
+            resumable (``bool``, *optional*):
+                Pass True to record the uploaded parts in a manifest file inside the working directory and retry the
+                parts that fail. If the upload still fails, uploading the same file again (even after a restart) only
+                sends the missing parts.
+                Defaults to the client's *resumable_uploads* setting.
+
         Other Parameters:
             current (``int``):
                 The amount of bytes transmitted so far.
@@ -102,12 +118,33 @@ class SaveFile:
                 if data is None:
                     return
 
-                try:
-                    await session.invoke(data)
-                except Exception as e:
-                    log.error(e)
+                for attempt in range(PART_RETRIES + 1 if manifest else 1):
+                    if attempt:
+                        await asyncio.sleep(PART_RETRY_DELAY * 2 ** (attempt - 1))
+
+                    try:
+                        await session.invoke(data)
+                    except Exception as e:
+                        log.error(e)
+                    else:
+                        if manifest:
+                            manifest.add(data.file_part)
+
+                        break
+                else:
+                    # Without a manifest the file is returned anyway, the methods sending it upload the missing
+                    # parts again when the server answers with FILE_PART_X_MISSING
+                    if manifest:
+                        failed_parts.append(data.file_part)
+
+        async def stop_workers():
+            for _ in workers:
+                await queue.put(None)
 
-        part_size = 512 * 1024
+            await asyncio.gather(*workers)
+            workers.clear()
+
+        part_size = PART_SIZE
 
         if isinstance(path, (str, PurePath)):
             fp = open(path, "rb")
@@ -139,7 +176,17 @@ class SaveFile:
         workers_count = 4 if is_big else 1
         is_missing_part = file_id is not None
         file_id = file_id or self.rnd_id()
-        md5_sum = md5() if not is_big and not is_missing_part else None
+        manifest = None
+        failed_parts = []
+
+        if (self.resumable_uploads if resumable is None else resumable) and not is_missing_part:
+            manifest = UploadManifest.open(
+                self.WORKDIR / f"{self.name}.uploads",
+                await self.loop.run_in_executor(self.executor, get_fingerprint, fp, file_size, part_size),
+                file_id, file_total_parts, is_big
+            )
+            file_id = manifest.file_id
+
         pool = [
             Session(
                 self, await self.storage.dc_id(), await self.storage.auth_key(),
@@ -148,20 +195,19 @@ class SaveFile:
         ]
         workers = [self.loop.create_task(worker(session)) for session in pool for _ in range(workers_count)]
         queue = asyncio.Queue(16)
+        reader = UploadReader(fp, file_size)
+        md5_sum = (
+            self.loop.run_in_executor(self.executor, reader.md5, part_size)
+            if not is_big and not is_missing_part
+            else None
+        )
 
         try:
             for session in pool:
                 await session.start()
 
-            fp.seek(part_size * file_part)
-
-            while True:
-                chunk = fp.read(part_size)
-
-                if not chunk:
-                    if not is_big and not is_missing_part:
-                        md5_sum = "".join([hex(i)[2:].zfill(2) for i in md5_sum.digest()])
-                    break
+            while file_part < file_total_parts:
+                chunk = await reader.read(file_part * part_size, part_size)
 
                 if is_big:
                     rpc = raw.functions.upload.SaveBigFilePart(
@@ -177,14 +223,12 @@ class SaveFile:
                         bytes=chunk
                     )
 
-                await queue.put(rpc)
+                if manifest is None or file_part not in manifest.parts:
+                    await queue.put(rpc)
 
                 if is_missing_part:
                     return
 
-                if not is_big and not is_missing_part:
-                    md5_sum.update(chunk)
-
                 file_part += 1
 
                 if progress:
@@ -204,6 +248,16 @@ class SaveFile:
         except Exception as e:
             log.error(e, exc_info=True)
         else:
+            await stop_workers()
+
+            if failed_parts:
+                log.error(f"Upload {file_id} failed, {len(failed_parts)} parts could not be sent")
+                return None
+
+            if manifest:
+                manifest.delete()
+                manifest = None
+
             if is_big:
                 return raw.types.InputFileBig(
                     id=file_id,
@@ -216,13 +270,23 @@ class SaveFile:
                     id=file_id,
                     parts=file_total_parts,
                     name=file_name,
-                    md5_checksum=md5_sum
+                    md5_checksum=await md5_sum
                 )
         finally:
-            for _ in workers:
-                await queue.put(None)
+            await stop_workers()
 
-            await asyncio.gather(*workers)
+            rpc = chunk = None
+
+            # The checksum is computed from the reader in a thread, it must be done before the reader is closed and
+            # its result retrieved even when the upload failed or was cancelled
+            if md5_sum is not None:
+                with contextlib.suppress(Exception):
+                    await md5_sum
+
+            reader.close()
+
+            if manifest:
+                manifest.save()
 
             for session in pool:
                 await session.stop()
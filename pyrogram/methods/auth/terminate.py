@@ -44,6 +44,7 @@ class Terminate:
             log.info("Takeout session %s finished", self.takeout_id)
 
         await self.storage.save()
+        self.sequencer.reset()
         await self.dispatcher.stop()
 
         for media_session in self.media_sessions.values():
@@ -27,6 +27,7 @@ from .delete_chat_photo import DeleteChatPhoto
 from .delete_supergroup import DeleteSupergroup
 from .delete_user_history import DeleteUserHistory
 from .get_chat import GetChat
+from .get_chats import GetChats
 from .get_chat_event_log import GetChatEventLog
 from .get_chat_member import GetChatMember
 from .get_chat_members import GetChatMembers
@@ -63,6 +64,7 @@ from .transfer_chat_ownership import TransferChatOwnership
 
 class Chats(
     GetChat,
+    GetChats,
     LeaveChat,
     JoinChat,
     BanChatMember,
@@ -21,6 +21,7 @@ from typing import Union, Optional, AsyncGenerator
 
 import pyrogram
 from pyrogram import raw, types, enums
+from pyrogram.pagination import Paginator
 
 log = logging.getLogger(__name__)
 
@@ -129,12 +130,13 @@ class GetChatMembers:
 
             return
 
-        current = 0
         offset = 0
         total = abs(limit) or (1 << 31) - 1
         limit = min(200, total)
 
-        while True:
+        async def fetch():
+            nonlocal offset
+
             members = await get_chunk(
                 client=self,
                 chat_id=chat_id,
@@ -144,15 +146,9 @@ class GetChatMembers:
                 query=query
             )
 
-            if not members:
-                return
-
             offset += len(members)
 
-            for member in members:
-                yield member
-
-                current += 1
+            return members
 
-                if current >= total:
-                    return
+        async for member in Paginator(fetch, total, self.prefetch_pages, self.flood_registry):
+            yield member
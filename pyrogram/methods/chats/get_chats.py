@@ -0,0 +1,114 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from typing import Union, List, Iterable
+
+import pyrogram
+from pyrogram import raw, types, utils
+
+# Most users, channels and basic groups that can be fetched by a single request
+GET_USERS_LIMIT = 200
+GET_CHANNELS_LIMIT = 100
+GET_CHATS_LIMIT = 100
+
+
+class GetChats:
+    async def get_chats(
+        self: "pyrogram.Client",
+        chat_ids: Iterable[Union[int, str]],
+        force_full: bool = False
+    ) -> List["types.Chat"]:
+        """Get information about many chats at once.
+
+        The chats are grouped by type and fetched with as few requests as possible, sent concurrently. Use this
+        instead of calling :meth:`~pyrogram.Client.get_chat` in a loop.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            chat_ids (Iterable of ``int`` | ``str``):
+                Unique identifiers (int) or usernames (str) of the target chats.
+
+            force_full (``bool``, *optional*):
+                Pass True to fetch the full variant of each chat. This takes one request per chat, sent a few at a
+                time.
+                Defaults to False.
+
+        Returns:
+            List of :obj:`~pyrogram.types.Chat`: The chats in the order they were asked for. Chats the server
+            doesn't return are left out.
+
+        Example:
+            .. code-block:: python
+
+                chats = await app.get_chats([chat_id1, "pyrogram", chat_id2])
+        """
+        chat_ids = list(chat_ids)
+
+        if force_full:
+            async def get_full(chunk: list) -> list:
+                return [await self.get_chat(chunk[0], force_full=True)]
+
+            return types.List(await utils.gather_chunks(get_full, chat_ids, 1))
+
+        peers = await utils.resolve_peers(self, chat_ids)
+        me = await self.storage.user_id()
+
+        users = [p for p in peers if isinstance(p, (raw.types.InputPeerUser, raw.types.InputPeerSelf))]
+        channels = [p for p in peers if isinstance(p, raw.types.InputPeerChannel)]
+        chats = list(dict.fromkeys(p.chat_id for p in peers if isinstance(p, raw.types.InputPeerChat)))
+
+        async def get_users(chunk: list) -> list:
+            return await self.invoke(raw.functions.users.GetUsers(id=chunk))
+
+        async def get_channels(chunk: list) -> list:
+            return (await self.invoke(raw.functions.channels.GetChannels(id=chunk))).chats
+
+        async def get_basic_chats(chunk: list) -> list:
+            return (await self.invoke(raw.functions.messages.GetChats(id=chunk))).chats
+
+        r = await asyncio.gather(
+            utils.gather_chunks(get_users, users, GET_USERS_LIMIT),
+            utils.gather_chunks(get_channels, channels, GET_CHANNELS_LIMIT),
+            utils.gather_chunks(get_basic_chats, chats, GET_CHATS_LIMIT)
+        )
+        r = [i for result in r for i in result]
+
+        await self.fetch_peers(r)
+
+        parsed = {chat.id: chat for chat in (types.Chat._parse_chat(self, i) for i in r) if chat}
+
+        result = types.List()
+
+        for peer in peers:
+            if isinstance(peer, raw.types.InputPeerSelf):
+                chat_id = me
+            elif isinstance(peer, raw.types.InputPeerUser):
+                chat_id = peer.user_id
+            elif isinstance(peer, raw.types.InputPeerChannel):
+                chat_id = utils.get_channel_id(peer.channel_id)
+            elif isinstance(peer, raw.types.InputPeerChat):
+                chat_id = -peer.chat_id
+            else:
+                continue
+
+            if chat_id in parsed:
+                result.append(parsed[chat_id])
+
+        return result
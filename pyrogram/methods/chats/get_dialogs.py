@@ -16,10 +16,11 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, List
 
 import pyrogram
 from pyrogram import types, raw, utils
+from pyrogram.pagination import Paginator, RawDialog, project
 
 
 class GetDialogs:
@@ -27,7 +28,9 @@ class GetDialogs:
         self: "pyrogram.Client",
         limit: int = 0,
         pinned_only: bool = False,
-        chat_list: int = 0
+        chat_list: int = 0,
+        parse: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Optional[AsyncGenerator["types.Dialog", None]]:
         """Get a user's dialogs sequentially.
 
@@ -45,8 +48,18 @@ class GetDialogs:
             chat_list (``int``, *optional*):
                 Chat list from which to get the dialogs; Only Main (0) and Archive (1) chat lists are supported. Defaults to (0) Main chat list.
 
+            parse (``bool``, *optional*):
+                Pass False to get the raw dialogs, as ``RawDialog`` named tuples of the raw dialog, its raw top message
+                and the users and chats dicts of its page, without building :obj:`~pyrogram.types.Dialog` objects.
+                Defaults to True.
+
+            fields (List of ``str``, *optional*):
+                Names of the raw dialog fields to get, each dialog is yielded as a dict with only these fields.
+                Implies *parse=False*.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Dialog` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Dialog` objects, or raw dialogs when *parse* is
+            False or *fields* is given.
 
         Example:
             .. code-block:: python
@@ -55,7 +68,6 @@ class GetDialogs:
                 async for dialog in app.get_dialogs():
                     print(dialog.chat.first_name or dialog.chat.title)
         """
-        current = 0
         total = limit or (1 << 31) - 1
         limit = min(100, total)
 
@@ -63,7 +75,9 @@ class GetDialogs:
         offset_id = 0
         offset_peer = raw.types.InputPeerEmpty()
 
-        while True:
+        async def fetch():
+            nonlocal offset_date, offset_id, offset_peer
+
             r = await self.invoke(
                 raw.functions.messages.GetDialogs(
                     offset_date=offset_date,
@@ -80,42 +94,45 @@ class GetDialogs:
             users = {i.id: i for i in r.users}
             chats = {i.id: i for i in r.chats}
 
-            messages = {}
+            top_messages = {}
 
             for message in r.messages:
                 if isinstance(message, raw.types.MessageEmpty):
                     continue
 
-                chat_id = utils.get_peer_id(message.peer_id)
-                messages[chat_id] = await types.Message._parse(
-                    self,
-                    message,
-                    users,
-                    chats,
-                    replies=self.fetch_replies
-                )
+                top_messages[utils.get_peer_id(message.peer_id)] = message
 
-            dialogs = []
+            raw_dialogs = [dialog for dialog in r.dialogs if isinstance(dialog, raw.types.Dialog)]
 
-            for dialog in r.dialogs:
-                if not isinstance(dialog, raw.types.Dialog):
-                    continue
+            if raw_dialogs:
+                chat_id = utils.get_peer_id(raw_dialogs[-1].peer)
+                top_message = top_messages[chat_id]
 
-                dialogs.append(types.Dialog._parse(self, dialog, messages, users, chats))
+                offset_id = top_message.id
+                offset_date = top_message.date
+                offset_peer = await self.resolve_peer(chat_id)
 
-            if not dialogs:
-                return
+            if fields:
+                return [project(dialog, fields) for dialog in raw_dialogs]
 
-            last = dialogs[-1]
+            if not parse:
+                return [
+                    RawDialog(dialog, top_messages.get(utils.get_peer_id(dialog.peer)), users, chats)
+                    for dialog in raw_dialogs
+                ]
 
-            offset_id = last.top_message.id
-            offset_date = utils.datetime_to_timestamp(last.top_message.date)
-            offset_peer = await self.resolve_peer(last.chat.id)
+            messages = {}
 
-            for dialog in dialogs:
-                yield dialog
+            for chat_id, message in top_messages.items():
+                messages[chat_id] = await types.Message._parse(
+                    self,
+                    message,
+                    users,
+                    chats,
+                    replies=self.fetch_replies
+                )
 
-                current += 1
+            return [types.Dialog._parse(self, dialog, messages, users, chats) for dialog in raw_dialogs]
 
-                if current >= total:
-                    return
+        async for dialog in Paginator(fetch, total, self.prefetch_pages, self.flood_registry):
+            yield dialog
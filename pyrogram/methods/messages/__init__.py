@@ -16,6 +16,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+from .bulk_copy_messages import BulkCopyMessages
+from .bulk_delete_messages import BulkDeleteMessages
+from .bulk_forward_messages import BulkForwardMessages
 from .copy_media_group import CopyMediaGroup
 from .copy_message import CopyMessage
 from .delete_messages import DeleteMessages
@@ -29,6 +32,7 @@ from .edit_message_caption import EditMessageCaption
 from .edit_message_media import EditMessageMedia
 from .edit_message_reply_markup import EditMessageReplyMarkup
 from .edit_message_text import EditMessageText
+from .export_chats import ExportChats
 from .forward_messages import ForwardMessages
 from .get_chat_history import GetChatHistory
 from .get_chat_history_count import GetChatHistoryCount
@@ -66,6 +70,7 @@ from .send_video_note import SendVideoNote
 from .send_voice import SendVoice
 from .stop_poll import StopPoll
 from .stream_media import StreamMedia
+from .stream_media_range import StreamMediaRange
 from .view_messages import ViewMessages
 from .vote_poll import VotePoll
 from .get_chat_sponsored_messages import GetChatSponsoredMessages
@@ -77,6 +82,9 @@ class Messages(
     CopyMediaGroup,
     CopyMessage,
     DeleteMessages,
+    BulkDeleteMessages,
+    BulkForwardMessages,
+    BulkCopyMessages,
     DownloadMedia,
     EditCachedMedia,
     EditInlineCaption,
@@ -87,6 +95,7 @@ class Messages(
     EditMessageMedia,
     EditMessageReplyMarkup,
     EditMessageText,
+    ExportChats,
     ForwardMessages,
     GetChatHistory,
     GetChatHistoryCount,
@@ -126,6 +135,7 @@ class Messages(
     SetReaction,
     StopPoll,
     StreamMedia,
+    StreamMediaRange,
     ViewMessages,
     VotePoll,
     GetChatSponsoredMessages,
@@ -0,0 +1,110 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+from typing import Iterable, Union
+
+import pyrogram
+from pyrogram.bulk import BulkResult
+
+
+class BulkCopyMessages:
+    async def bulk_copy_messages(
+        self: "pyrogram.Client",
+        chat_id: Union[int, str],
+        from_chat_id: Union[int, str],
+        message_ids: Iterable[int],
+        message_thread_id: int = None,
+        disable_notification: bool = None,
+        protect_content: bool = None,
+        remove_captions: bool = None,
+        send_as: Union[int, str] = None,
+        schedule_date: datetime = None,
+        max_concurrent_requests: int = 1
+    ) -> BulkResult:
+        """Copy any number of messages, reporting the outcome of each one.
+
+        Calling :meth:`~pyrogram.Client.copy_message` or :meth:`~pyrogram.Client.copy_media_group` in a loop takes
+        two requests per message: one to get it and one to send it again (media is sent again by file id). Here
+        the messages are copied by the server 100 at a time, as forwards without the original author. Media
+        groups stay grouped. Captions can only be kept or removed. Use :meth:`~pyrogram.Client.copy_message` to
+        change them.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the target chat.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            from_chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the source chat where the original messages were sent.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            message_ids (Iterable of ``int``):
+                The identifiers of the messages to copy, in the chat specified in *from_chat_id*.
+
+            message_thread_id (``int``, *optional*):
+                Unique identifier for the target message thread (topic) of the forum; for forum supergroups only
+
+            disable_notification (``bool``, *optional*):
+                Sends the messages silently.
+                Users will receive a notification with no sound.
+
+            protect_content (``bool``, *optional*):
+                Pass True if the content of the messages must be protected from forwarding and saving; for bots only.
+
+            remove_captions (``bool``, *optional*):
+                Pass True to copy media without their captions.
+
+            send_as (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the chat or channel to send the messages as.
+
+            schedule_date (:py:obj:`~datetime.datetime`, *optional*):
+                Date when the messages will be automatically sent.
+
+            max_concurrent_requests (``int``, *optional*):
+                Maximum number of chunks copied at the same time. With more than one the chunks are faster to copy,
+                but may not arrive in order.
+                Defaults to 1.
+
+        Returns:
+            ``pyrogram.bulk.BulkResult``: A named tuple of two dicts keyed by the ids of the original messages:
+            *results*, the new :obj:`~pyrogram.types.Message` objects, and *errors*, the error of the chunk of each
+            message that failed. Messages that don't exist are in neither.
+
+        Example:
+            .. code-block:: python
+
+                r = await app.bulk_copy_messages(to_chat, from_chat, range(1, 1001))
+        """
+        return await self.bulk_forward_messages(
+            chat_id,
+            from_chat_id,
+            message_ids,
+            message_thread_id=message_thread_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            drop_author=True,
+            drop_media_captions=remove_captions,
+            send_as=send_as,
+            schedule_date=schedule_date,
+            max_concurrent_requests=max_concurrent_requests
+        )
@@ -0,0 +1,82 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Iterable, Union
+
+import pyrogram
+from pyrogram.bulk import BulkResult, run_bulk
+from .delete_messages import DELETE_MESSAGES_LIMIT
+
+
+class BulkDeleteMessages:
+    async def bulk_delete_messages(
+        self: "pyrogram.Client",
+        chat_id: Union[int, str],
+        message_ids: Iterable[int],
+        revoke: bool = True,
+        is_scheduled: bool = False,
+        max_concurrent_requests: int = 4
+    ) -> BulkResult:
+        """Delete any number of messages, reporting the outcome of each one.
+
+        The messages are deleted in chunks of 100, with the same limitations as
+        :meth:`~pyrogram.Client.delete_messages`. Chunks failing with a flood wait are sent again once it expires, the
+        other errors don't stop the chunks that follow.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the target chat.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            message_ids (Iterable of ``int``):
+                The identifiers of the messages to delete.
+
+            revoke (``bool``, *optional*):
+                Deletes messages on both parts.
+                This is only for private cloud chats and normal groups, messages on
+                channels and supergroups are always revoked (i.e.: deleted for everyone).
+                Defaults to True.
+
+            is_scheduled (``bool``, *optional*):
+                True, if the specified ``message_ids`` refers to a scheduled message. Defaults to False.
+
+            max_concurrent_requests (``int``, *optional*):
+                Maximum number of chunks deleted at the same time.
+                Defaults to 4.
+
+        Returns:
+            ``pyrogram.bulk.BulkResult``: A named tuple of two dicts keyed by message id: *results*, True for the
+            messages of the chunks that succeeded, and *errors*, the error of the chunk of each message that failed.
+
+        Example:
+            .. code-block:: python
+
+                r = await app.bulk_delete_messages(chat_id, range(1, 10001))
+
+                for message_id, error in r.errors.items():
+                    print(message_id, error)
+        """
+        async def delete(chunk: list) -> dict:
+            await self.delete_messages(chat_id, chunk, revoke=revoke, is_scheduled=is_scheduled)
+
+            return dict.fromkeys(chunk, True)
+
+        return await run_bulk(delete, message_ids, DELETE_MESSAGES_LIMIT, max_concurrent_requests)
@@ -0,0 +1,118 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+from typing import Iterable, Union
+
+import pyrogram
+from pyrogram.bulk import BulkResult, run_bulk
+from .forward_messages import FORWARD_MESSAGES_LIMIT
+
+
+class BulkForwardMessages:
+    async def bulk_forward_messages(
+        self: "pyrogram.Client",
+        chat_id: Union[int, str],
+        from_chat_id: Union[int, str],
+        message_ids: Iterable[int],
+        message_thread_id: int = None,
+        disable_notification: bool = None,
+        protect_content: bool = None,
+        allow_paid_broadcast: bool = None,
+        drop_author: bool = None,
+        drop_media_captions: bool = None,
+        send_as: Union[int, str] = None,
+        schedule_date: datetime = None,
+        max_concurrent_requests: int = 1
+    ) -> BulkResult:
+        """Forward any number of messages, reporting the outcome of each one.
+
+        The messages are forwarded in chunks of 100. Chunks failing with a flood wait are sent again once it expires,
+        the other errors don't stop the chunks that follow.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the target chat.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            from_chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the source chat where the original messages were sent.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            message_ids (Iterable of ``int``):
+                The identifiers of the messages to forward, in the chat specified in *from_chat_id*.
+
+            message_thread_id (``int``, *optional*):
+                Unique identifier for the target message thread (topic) of the forum; for forum supergroups only
+
+            disable_notification (``bool``, *optional*):
+                Sends the messages silently.
+                Users will receive a notification with no sound.
+
+            protect_content (``bool``, *optional*):
+                Pass True if the content of the messages must be protected from forwarding and saving; for bots only.
+
+            allow_paid_broadcast (``bool``, *optional*):
+                Pass True to allow the messages to ignore regular broadcast limits for a fee; for bots only
+
+            drop_author (``bool``, *optional*):
+                Whether to forward messages without quoting the original author.
+
+            drop_media_captions (``bool``, *optional*):
+                Whether to strip captions from media.
+
+            send_as (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the chat or channel to send the messages as.
+
+            schedule_date (:py:obj:`~datetime.datetime`, *optional*):
+                Date when the messages will be automatically sent.
+
+            max_concurrent_requests (``int``, *optional*):
+                Maximum number of chunks forwarded at the same time. With more than one the chunks are faster to
+                forward, but may not arrive in order.
+                Defaults to 1.
+
+        Returns:
+            ``pyrogram.bulk.BulkResult``: A named tuple of two dicts keyed by the ids of the original messages:
+            *results*, the forwarded :obj:`~pyrogram.types.Message` objects, and *errors*, the error of the chunk of
+            each message that failed. Messages that don't exist are in neither.
+
+        Example:
+            .. code-block:: python
+
+                r = await app.bulk_forward_messages(to_chat, from_chat, range(1, 1001))
+
+                print(len(r.results), "forwarded,", len(r.errors), "failed")
+        """
+        to_peer = await self.resolve_peer(chat_id)
+        from_peer = await self.resolve_peer(from_chat_id)
+        send_as = await self.resolve_peer(send_as) if send_as else None
+
+        async def forward(chunk: list) -> dict:
+            forwarded_messages = await self._forward_messages(
+                to_peer, from_peer, chunk, message_thread_id, disable_notification, protect_content,
+                allow_paid_broadcast, drop_author, drop_media_captions, send_as, schedule_date
+            )
+
+            return {i: message for i, message in forwarded_messages if i is not None}
+
+        return await run_bulk(forward, message_ids, FORWARD_MESSAGES_LIMIT, max_concurrent_requests)
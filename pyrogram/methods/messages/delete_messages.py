@@ -21,6 +21,9 @@ from typing import Union, Iterable
 import pyrogram
 from pyrogram import raw
 
+# Most messages that can be deleted by a single request
+DELETE_MESSAGES_LIMIT = 100
+
 
 class DeleteMessages:
     async def delete_messages(
@@ -43,6 +46,8 @@ class DeleteMessages:
 
         Use this method to delete multiple messages simultaneously.
         If some of the specified messages can't be found, they are skipped.
+        More than 100 messages are deleted with multiple requests, sent one after the other. Use
+        :meth:`~pyrogram.Client.bulk_delete_messages` to know which messages failed to be deleted.
 
         .. include:: /_includes/usable-by/users-bots.rst
 
@@ -84,34 +89,46 @@ class DeleteMessages:
         peer = await self.resolve_peer(chat_id)
         message_ids = list(message_ids) if not isinstance(message_ids, int) else [message_ids]
 
-        if is_scheduled:
-            r = await self.invoke(
-                raw.functions.messages.DeleteScheduledMessages(
-                    peer=peer,
-                    id=message_ids
-                )
-            )
-            for i in r.updates:
-                if isinstance(i, raw.types.UpdateDeleteScheduledMessages):
-                    return len(
-                        getattr(i, "messages", [])
-                    ) + len(
-                        getattr(i, "sent_messages", [])
-                    )
-        else:
-            if isinstance(peer, raw.types.InputPeerChannel):
+        async def delete(chunk: list) -> int:
+            if is_scheduled:
                 r = await self.invoke(
-                    raw.functions.channels.DeleteMessages(
-                        channel=peer,
-                        id=message_ids
+                    raw.functions.messages.DeleteScheduledMessages(
+                        peer=peer,
+                        id=chunk
                     )
                 )
+                for i in r.updates:
+                    if isinstance(i, raw.types.UpdateDeleteScheduledMessages):
+                        return len(
+                            getattr(i, "messages", [])
+                        ) + len(
+                            getattr(i, "sent_messages", [])
+                        )
+
+                return 0
             else:
-                r = await self.invoke(
-                    raw.functions.messages.DeleteMessages(
-                        id=message_ids,
-                        revoke=revoke
+                if isinstance(peer, raw.types.InputPeerChannel):
+                    r = await self.invoke(
+                        raw.functions.channels.DeleteMessages(
+                            channel=peer,
+                            id=chunk
+                        )
                     )
-                )
+                else:
+                    r = await self.invoke(
+                        raw.functions.messages.DeleteMessages(
+                            id=chunk,
+                            revoke=revoke
+                        )
+                    )
+
+                return getattr(r, "pts_count", 0)
+
+        # Chunks are deleted one after the other, so that an error stops the deletion instead of leaving the other
+        # chunks running
+        affected = 0
+
+        for i in range(0, len(message_ids), DELETE_MESSAGES_LIMIT):
+            affected += await delete(message_ids[i:i + DELETE_MESSAGES_LIMIT])
 
-            return getattr(r, "pts_count", 0)
+        return affected
@@ -0,0 +1,235 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+import pyrogram
+from pyrogram import raw, utils
+from pyrogram.errors import FloodWait
+from pyrogram.export import ExportSink, JSONLinesSink, get_media_file, download_media_file
+
+log = logging.getLogger(__name__)
+
+# Messages written to the sink between two checkpoints, the size of a history page
+BATCH_SIZE = 100
+
+
+class ExportChats:
+    async def export_chats(
+        self: "pyrogram.Client",
+        chat_ids: Iterable[Union[int, str]],
+        sink: Union[str, Path, "ExportSink"],
+        max_concurrent_chats: int = 4,
+        media_dir: Union[str, Path] = None,
+        max_media_size: int = 0,
+        resume: bool = True
+    ) -> Dict[int, int]:
+        """Export the whole history of many chats, from the oldest message to the most recent one.
+
+        Chats are exported concurrently, each one as a stream of raw messages (see *parse* in
+        :meth:`~pyrogram.Client.get_chat_history`) written to the sink in batches. After each batch the id of the
+        last exported message of the chat is saved in the session storage, so that an interrupted export, or a later
+        one meant to fetch the new messages only, continues from there. With custom storage engines that don't
+        implement ``Storage.export_state``, the chats are always exported from their beginning.
+        Flood waits longer than the sleep threshold
+        pause the stream of the affected chat instead of stopping the export.
+
+        Use a client started with *takeout=True*, which makes the requests go through a takeout session that Telegram
+        limits less strictly when exporting data.
+
+        .. include:: /_includes/usable-by/users.rst
+
+        Parameters:
+            chat_ids (Iterable of ``int`` | ``str``):
+                Unique identifiers (int) or usernames (str) of the chats to export.
+
+            sink (``str`` | ``Path`` | ``ExportSink``):
+                Path of a JSON Lines file to which the records are appended, or an ``ExportSink`` instance from
+                ``pyrogram.export`` for any other destination.
+
+            max_concurrent_chats (``int``, *optional*):
+                Maximum number of chats exported at the same time.
+                Defaults to 4.
+
+            media_dir (``str`` | ``Path``, *optional*):
+                Directory in which to download the photos and documents of the exported messages, in a subdirectory
+                for each chat. The path of each file relative to this directory is stored in the *media* key of the
+                message record. Files that already exist are not downloaded again.
+                Defaults to None (no media is downloaded).
+
+            max_media_size (``int``, *optional*):
+                Skip media larger than this number of bytes.
+                Defaults to 0 (no limit).
+
+            resume (``bool``, *optional*):
+                Pass False to export the chats from their beginning, ignoring the saved progress.
+                Defaults to True.
+
+        Returns:
+            ``Dict[int, int]``: The number of messages exported for each chat id, including those of previous exports
+            when resuming.
+
+        Example:
+            .. code-block:: python
+
+                exported = await app.export_chats(["me", "pyrogram"], "export.jsonl", media_dir="media")
+        """
+        own_sink = not isinstance(sink, ExportSink)
+
+        if own_sink:
+            sink = JSONLinesSink(sink)
+
+        states = {}
+
+        # Custom storage engines may not implement export_state, the chats are then exported without saving progress
+        try:
+            saved_states = await self.storage.export_state()
+        except NotImplementedError:
+            log.warning("The storage engine can't save the export progress, the export won't be resumable")
+            saved_states = None
+
+        if resume:
+            for chat_id, last_message_id, count, _ in saved_states or []:
+                states[chat_id] = (last_message_id, count)
+
+        # Users and chats already written to the sink
+        seen_peers = set()
+        results = {}
+        semaphore = asyncio.Semaphore(max(max_concurrent_chats, 1))
+
+        def get_peer_records(users: dict, chats: dict) -> List[dict]:
+            records = []
+
+            for kind, peers in (("user", users), ("chat", chats)):
+                for peer_id, peer in peers.items():
+                    if (kind, peer_id) not in seen_peers:
+                        seen_peers.add((kind, peer_id))
+                        records.append({kind: peer})
+
+            return records
+
+        async def get_media(chat_id: int, message) -> Union[str, None]:
+            media_file = get_media_file(self, getattr(message, "media", None))
+
+            if media_file is None:
+                return None
+
+            file_id, file_size, file_name = media_file
+
+            if max_media_size and file_size > max_media_size:
+                return None
+
+            relative_path = Path(str(chat_id), f"{message.id}_{file_name}")
+            path = Path(media_dir) / relative_path
+
+            if not path.exists() and not await download_media_file(self, file_id, file_size, path):
+                log.warning("Failed to download the media of message %s in chat %s", message.id, chat_id)
+                return None
+
+            return relative_path.as_posix()
+
+        async def export_chat(chat_id: Union[int, str]):
+            peer = await self.resolve_peer(chat_id)
+
+            if isinstance(peer, raw.types.InputPeerSelf):
+                chat_id = await self.storage.user_id()
+            else:
+                chat_id = utils.get_peer_id(peer)
+
+            last_message_id, count = states.get(chat_id, (0, 0))
+            records = []
+            batch_last_id, batch_count = last_message_id, 0
+            # Messages of the same page share their users and chats dicts, which only need to be looked at once
+            page_users = None
+
+            async def flush():
+                nonlocal records, last_message_id, count, batch_count
+
+                if not records:
+                    return
+
+                await sink.write(records)
+                records = []
+
+                last_message_id = batch_last_id
+                count += batch_count
+                batch_count = 0
+
+                if saved_states is not None:
+                    await self.storage.export_state((chat_id, last_message_id, count, int(time.time())))
+
+            while True:
+                try:
+                    async for item in self.get_chat_history(
+                        chat_id,
+                        offset_id=last_message_id + 1,
+                        reverse=True,
+                        parse=False
+                    ):
+                        message = item.message
+
+                        if item.users is not page_users:
+                            page_users = item.users
+                            records.extend(get_peer_records(item.users, item.chats))
+
+                        record = {"chat_id": chat_id, "message": message}
+
+                        if media_dir is not None:
+                            record["media"] = await get_media(chat_id, message)
+
+                        records.append(record)
+                        batch_last_id = message.id
+                        batch_count += 1
+
+                        if batch_count >= BATCH_SIZE:
+                            await flush()
+
+                    await flush()
+                    break
+                except FloodWait as e:
+                    await flush()
+
+                    log.info("Waiting for %s seconds before exporting chat %s again (flood wait)", e.value, chat_id)
+                    await asyncio.sleep(e.value)
+
+            results[chat_id] = count
+            log.info("Exported %s messages of chat %s", count, chat_id)
+
+        async def worker(chat_id: Union[int, str]):
+            async with semaphore:
+                await export_chat(chat_id)
+
+        tasks = [asyncio.ensure_future(worker(chat_id)) for chat_id in chat_ids]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop the other chats if one of them failed
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            if own_sink:
+                await sink.close()
+
+        return results
@@ -17,12 +17,15 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from datetime import datetime
-from typing import Union, List, Iterable
+from typing import Union, List, Iterable, Optional, Tuple
 
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
 
+# Most messages that can be forwarded by a single request
+FORWARD_MESSAGES_LIMIT = 100
+
 
 class ForwardMessages:
     async def forward_messages(
@@ -40,6 +43,8 @@ class ForwardMessages:
         schedule_date: datetime = None
     ) -> Union["types.Message", List["types.Message"]]:
         """Forward messages of any kind.
+        More than 100 messages are forwarded with multiple requests, one after the other so that they keep their
+        order. Use :meth:`~pyrogram.Client.bulk_forward_messages` to know which messages failed to be forwarded.
 
         .. include:: /_includes/usable-by/users-bots.rst
 
@@ -103,10 +108,43 @@ class ForwardMessages:
         is_iterable = not isinstance(message_ids, int)
         message_ids = list(message_ids) if is_iterable else [message_ids]
 
+        to_peer = await self.resolve_peer(chat_id)
+        from_peer = await self.resolve_peer(from_chat_id)
+        send_as = await self.resolve_peer(send_as) if send_as else None
+
+        forwarded_messages = types.List()
+
+        for i in range(0, len(message_ids), FORWARD_MESSAGES_LIMIT):
+            forwarded_messages.extend(message for _, message in await self._forward_messages(
+                to_peer, from_peer, message_ids[i:i + FORWARD_MESSAGES_LIMIT], message_thread_id,
+                disable_notification, protect_content, allow_paid_broadcast, drop_author, drop_media_captions,
+                send_as, schedule_date
+            ))
+
+        return forwarded_messages if is_iterable else forwarded_messages[0]
+
+    async def _forward_messages(
+        self: "pyrogram.Client",
+        to_peer: "raw.base.InputPeer",
+        from_peer: "raw.base.InputPeer",
+        message_ids: List[int],
+        message_thread_id: int = None,
+        disable_notification: bool = None,
+        protect_content: bool = None,
+        allow_paid_broadcast: bool = None,
+        drop_author: bool = None,
+        drop_media_captions: bool = None,
+        send_as: "raw.base.InputPeer" = None,
+        schedule_date: datetime = None
+    ) -> List[Tuple[Optional[int], "types.Message"]]:
+        """Forward up to 100 messages with one request, returning the new messages in order, each one paired with the
+        id of the message it was forwarded from, or None if it is unknown."""
+        random_ids = {self.rnd_id(): i for i in message_ids}
+
         r = await self.invoke(
             raw.functions.messages.ForwardMessages(
-                to_peer=await self.resolve_peer(chat_id),
-                from_peer=await self.resolve_peer(from_chat_id),
+                to_peer=to_peer,
+                from_peer=from_peer,
                 id=message_ids,
                 silent=disable_notification or None,
                 # TODO
@@ -115,8 +153,8 @@ class ForwardMessages:
                 drop_media_captions=drop_media_captions,
                 noforwards=protect_content,
                 allow_paid_floodskip=allow_paid_broadcast,
-                random_id=[self.rnd_id() for _ in message_ids],
-                send_as=await self.resolve_peer(send_as) if send_as else None,
+                random_id=list(random_ids),
+                send_as=send_as,
                 schedule_date=utils.datetime_to_timestamp(schedule_date),
                 top_msg_id=message_thread_id
                 # TODO
@@ -148,4 +186,19 @@ class ForwardMessages:
                     )
                 )
 
-        return types.List(forwarded_messages) if is_iterable else forwarded_messages[0]
+        # The new id of each message comes with the random id it was sent with, which tells which message it was
+        # forwarded from, since messages that don't exist are skipped. Without them the messages can only be matched
+        # in order when none was skipped.
+        source_ids = {
+            i.id: random_ids[i.random_id]
+            for i in r.updates
+            if isinstance(i, raw.types.UpdateMessageID) and i.random_id in random_ids
+        }
+
+        if not source_ids:
+            if len(forwarded_messages) == len(message_ids):
+                return list(zip(message_ids, forwarded_messages))
+
+            return [(None, m) for m in forwarded_messages]
+
+        return [(source_ids.get(m.id), m) for m in forwarded_messages]
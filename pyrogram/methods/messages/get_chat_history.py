@@ -17,10 +17,11 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from datetime import datetime
-from typing import Union, Optional, AsyncGenerator
+from typing import Union, Optional, AsyncGenerator, List
 
 import pyrogram
 from pyrogram import types, raw, utils
+from pyrogram.pagination import Paginator, get_raw_messages, project
 
 
 async def get_chunk(
@@ -34,7 +35,8 @@ async def get_chunk(
     from_message_id: int = 0,
     from_date: datetime = utils.zero_datetime(),
     reverse: bool = False,
-    is_scheduled: bool = False
+    is_scheduled: bool = False,
+    parse: bool = True
 ):
     if is_scheduled:
         r = await client.invoke(
@@ -44,12 +46,15 @@ async def get_chunk(
             ),
             sleep_threshold=60
         )
-        messages = await utils.parse_messages(
-            client,
-            r,
-            is_scheduled=True,
-            replies=0
-        )
+        if parse:
+            messages = await utils.parse_messages(
+                client,
+                r,
+                is_scheduled=True,
+                replies=0
+            )
+        else:
+            messages = get_raw_messages(r)
         if reverse:
             messages.reverse()
         return messages
@@ -68,12 +73,15 @@ async def get_chunk(
             ),
             sleep_threshold=60
         )
-        messages =await utils.parse_messages(
-            client,
-            messages,
-            is_scheduled=False,
-            replies=0
-        )
+        if parse:
+            messages = await utils.parse_messages(
+                client,
+                messages,
+                is_scheduled=False,
+                replies=0
+            )
+        else:
+            messages = get_raw_messages(messages)
         if reverse:
             messages.reverse()
         return messages
@@ -90,7 +98,9 @@ class GetChatHistory:
         max_id: int = 0,
         offset_date: datetime = utils.zero_datetime(),
         reverse: bool = False,
-        is_scheduled: bool = False
+        is_scheduled: bool = False,
+        parse: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Optional[AsyncGenerator["types.Message", None]]:
         """Get messages from a chat history.
 
@@ -132,20 +142,42 @@ class GetChatHistory:
             is_scheduled (``bool``, *optional*):
                 Whether to get scheduled messages. Defaults to False.
 
+            parse (``bool``, *optional*):
+                Pass False to get the raw messages as they come from Telegram, without building
+                :obj:`~pyrogram.types.Message` objects. Each message is yielded as a ``RawMessage`` named tuple of
+                the raw message and the users and chats dicts of its page. Useful to export large histories quickly.
+                Defaults to True.
+
+            fields (List of ``str``, *optional*):
+                Names of the raw message fields to get, such as ``["id", "date", "message"]``. Each message is
+                yielded as a dict with only these fields instead. Implies *parse=False*.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects, or raw messages when *parse*
+            is False or *fields* is given.
 
         Example:
             .. code-block:: python
 
                 async for message in app.get_chat_history(chat_id):
                     print(message.text)
+
+                # Export the id, date and text of every message without parsing them
+                async for message in app.get_chat_history(chat_id, fields=["id", "date", "message"]):
+                    print(message["id"], message["message"])
         """
-        current = 0
         total = limit or (1 << 31) - 1
         limit = min(100, total)
+        parse = parse and not fields
+        fetched = False
+
+        async def fetch():
+            nonlocal offset_id, fetched
+
+            # Scheduled messages all come in a single page
+            if is_scheduled and fetched:
+                return []
 
-        while True:
             messages = await get_chunk(
                 client=self,
                 chat_id=chat_id,
@@ -156,21 +188,20 @@ class GetChatHistory:
                 max_id=max_id,
                 from_date=offset_date,
                 reverse=reverse,
-                is_scheduled=is_scheduled
+                is_scheduled=is_scheduled,
+                parse=parse
             )
 
-            if not messages:
-                return
-
-            offset_id = messages[-1].id + (1 if reverse else 0)
+            if messages:
+                last = messages[-1] if parse else messages[-1].message
+                offset_id = last.id + (1 if reverse else 0)
 
-            for message in messages:
-                yield message
+            fetched = True
 
-                current += 1
+            if fields:
+                return [project(m.message, fields) for m in messages]
 
-                if current >= total:
-                    return
+            return messages
 
-            if is_scheduled:
-                break
+        async for message in Paginator(fetch, total, self.prefetch_pages, self.flood_registry):
+            yield message
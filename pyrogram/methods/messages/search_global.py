@@ -16,12 +16,13 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, List
 
 import pyrogram
 from pyrogram import raw, enums
 from pyrogram import types
 from pyrogram import utils
+from pyrogram.pagination import Paginator, get_raw_messages, project
 
 
 class SearchGlobal:
@@ -32,6 +33,8 @@ class SearchGlobal:
         limit: int = 0,
         chat_list: int = 0,
         only_in_channels: bool = False,
+        parse: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Optional[AsyncGenerator["types.Message", None]]:
         """Search messages globally from all of your chats.
 
@@ -64,8 +67,18 @@ class SearchGlobal:
                 True, if should search only in joined channels.
                 Defaults to False. All available chats are searched.
 
+            parse (``bool``, *optional*):
+                Pass False to get the raw messages, as ``RawMessage`` named tuples of the raw message and the users and
+                chats dicts of its page, without building :obj:`~pyrogram.types.Message` objects.
+                Defaults to True.
+
+            fields (List of ``str``, *optional*):
+                Names of the raw message fields to get, each message is yielded as a dict with only these fields.
+                Implies *parse=False*.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects, or raw messages when *parse*
+            is False or *fields* is given.
 
         Example:
             .. code-block:: python
@@ -80,7 +93,6 @@ class SearchGlobal:
                 async for message in app.search_global(filter=enums.MessagesFilter.PHOTO, limit=20):
                     print(message.photo)
         """
-        current = 0
         # There seems to be an hard limit of 10k, beyond which Telegram starts spitting one message at a time.
         total = abs(limit) or (1 << 31)
         limit = min(100, total)
@@ -89,40 +101,39 @@ class SearchGlobal:
         offset_peer = raw.types.InputPeerEmpty()
         offset_id = 0
 
-        while True:
-            messages = await utils.parse_messages(
-                self,
-                await self.invoke(
-                    raw.functions.messages.SearchGlobal(
-                        q=query,
-                        filter=filter.value(),
-                        min_date=0,
-                        max_date=0,
-                        offset_rate=offset_date,
-                        offset_peer=offset_peer,
-                        offset_id=offset_id,
-                        limit=limit,
-                        folder_id=chat_list,
-                        broadcasts_only=only_in_channels
-                    ),
-                    sleep_threshold=60
+        async def fetch():
+            nonlocal offset_date, offset_peer, offset_id
+
+            r = await self.invoke(
+                raw.functions.messages.SearchGlobal(
+                    q=query,
+                    filter=filter.value(),
+                    min_date=0,
+                    max_date=0,
+                    offset_rate=offset_date,
+                    offset_peer=offset_peer,
+                    offset_id=offset_id,
+                    limit=limit,
+                    folder_id=chat_list,
+                    broadcasts_only=only_in_channels
                 ),
-                replies=0
+                sleep_threshold=60
             )
 
-            if not messages:
-                return
+            if r.messages:
+                last = r.messages[-1]
 
-            last = messages[-1]
+                offset_date = last.date
+                offset_peer = await self.resolve_peer(utils.get_peer_id(last.peer_id))
+                offset_id = last.id
 
-            offset_date = utils.datetime_to_timestamp(last.date)
-            offset_peer = await self.resolve_peer(last.chat.id)
-            offset_id = last.id
+            if fields:
+                return [project(message, fields) for message in r.messages]
 
-            for message in messages:
-                yield message
+            if not parse:
+                return get_raw_messages(r)
 
-                current += 1
+            return await utils.parse_messages(self, r, replies=0)
 
-                if current >= total:
-                    return
+        async for message in Paginator(fetch, total, self.prefetch_pages, self.flood_registry):
+            yield message
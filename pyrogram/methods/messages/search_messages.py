@@ -21,6 +21,7 @@ from typing import Union, List, AsyncGenerator, Optional
 
 import pyrogram
 from pyrogram import raw, types, utils, enums
+from pyrogram.pagination import Paginator, get_raw_messages, project
 
 
 # noinspection PyShadowingBuiltins
@@ -38,7 +39,8 @@ async def get_chunk(
     max_date: datetime = utils.zero_datetime(),
     min_id: int = 0,
     max_id: int = 0,
-    saved_messages_topic_id: Optional[Union[int, str]] = None
+    saved_messages_topic_id: Optional[Union[int, str]] = None,
+    parse: bool = True
 ) -> List["types.Message"]:
     r = await client.invoke(
         raw.functions.messages.Search(
@@ -65,6 +67,9 @@ async def get_chunk(
         sleep_threshold=60
     )
 
+    if not parse:
+        return get_raw_messages(r)
+
     return await utils.parse_messages(client, r, replies=0)
 
 
@@ -84,7 +89,9 @@ class SearchMessages:
         max_date: datetime = utils.zero_datetime(),
         min_id: int = 0,
         max_id: int = 0,
-        saved_messages_topic_id: Optional[Union[int, str]] = None
+        saved_messages_topic_id: Optional[Union[int, str]] = None,
+        parse: bool = True,
+        fields: Optional[List[str]] = None
     ) -> Optional[AsyncGenerator["types.Message", None]]:
         """Search for text and media messages inside a specific chat.
 
@@ -140,8 +147,18 @@ class SearchMessages:
             saved_messages_topic_id (``int`` | ``str``, *optional*):
                 If not None, only messages in the specified Saved Messages topic will be returned; pass None to return all messages, or for chats other than Saved Messages.
 
+            parse (``bool``, *optional*):
+                Pass False to get the raw messages, as ``RawMessage`` named tuples of the raw message and the users and
+                chats dicts of its page, without building :obj:`~pyrogram.types.Message` objects.
+                Defaults to True.
+
+            fields (List of ``str``, *optional*):
+                Names of the raw message fields to get, each message is yielded as a dict with only these fields.
+                Implies *parse=False*.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects, or raw messages when *parse*
+            is False or *fields* is given.
 
         Example:
             .. code-block:: python
@@ -161,11 +178,12 @@ class SearchMessages:
                     print(message.text)
         """
 
-        current = 0
         total = abs(limit) or (1 << 31) - 1
         limit = min(100, total)
 
-        while True:
+        async def fetch():
+            nonlocal offset
+
             messages = await get_chunk(
                 client=self,
                 chat_id=chat_id,
@@ -180,18 +198,16 @@ class SearchMessages:
                 max_date=max_date,
                 min_id=min_id,
                 max_id=max_id,
-                saved_messages_topic_id=saved_messages_topic_id
+                saved_messages_topic_id=saved_messages_topic_id,
+                parse=parse and not fields
             )
 
-            if not messages:
-                return
-
             offset += len(messages)
 
-            for message in messages:
-                yield message
+            if fields:
+                return [project(m.message, fields) for m in messages]
 
-                current += 1
+            return messages
 
-                if current >= total:
-                    return
+        async for message in Paginator(fetch, total, self.prefetch_pages, self.flood_registry):
+            yield message
@@ -0,0 +1,114 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union, Optional, AsyncGenerator
+
+import pyrogram
+from pyrogram import types
+from pyrogram.file_id import FileId
+
+
+class StreamMediaRange:
+    async def stream_media_range(
+        self: "pyrogram.Client",
+        message: Union["types.Message", str],
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream an exact range of bytes of the media from a message.
+
+        Unlike :meth:`~pyrogram.Client.stream_media`, the range is given in bytes and the chunks are trimmed so that
+        exactly the bytes from *start* up to *end* (excluded) are yielded, which is what serving HTTP range requests
+        needs. The range is fetched with the smallest parts Telegram allows and several ranges, also of the same
+        media, can be streamed concurrently.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            message (:obj:`~pyrogram.types.Message` | ``str``):
+                Pass a Message containing the media, the media itself (message.audio, message.video, ...) or a file id
+                as string.
+
+            start (``int``, *optional*):
+                Position of the first byte to stream. Negative values count from the end of the media.
+                Defaults to 0 (start from the beginning).
+
+            end (``int``, *optional*):
+                Position of the byte to stop at, excluded. Negative values count from the end of the media.
+                Defaults to None (stream until the end of the media).
+
+        Returns:
+            ``Generator``: A generator yielding the bytes of the range chunk by chunk
+
+        Raises:
+            ValueError: In case the range is invalid or counts from the end of a file id, whose size is unknown.
+
+        Example:
+            .. code-block:: python
+
+                # Stream bytes 1000 to 1999
+                async for chunk in app.stream_media_range(message, 1000, 2000):
+                    print(len(chunk))
+
+                # Stream the last 64 KiB
+                async for chunk in app.stream_media_range(message, -64 * 1024):
+                    print(len(chunk))
+        """
+        available_media = ("audio", "document", "photo", "sticker", "animation", "video", "voice", "video_note",
+                           "new_chat_photo")
+
+        if isinstance(message, types.Message):
+            for kind in available_media:
+                media = getattr(message, kind, None)
+
+                if media is not None:
+                    break
+            else:
+                raise ValueError("This message doesn't contain any downloadable media")
+        else:
+            media = message
+
+        if isinstance(media, str):
+            file_id_str = media
+        else:
+            file_id_str = media.file_id
+
+        file_id_obj = FileId.decode(file_id_str)
+        file_size = getattr(media, "file_size", 0) or 0
+
+        if start < 0 or (end is not None and end < 0):
+            if file_size == 0:
+                raise ValueError("Negative positions are not supported for file ids, pass a Message object instead")
+
+            if start < 0:
+                start = max(start + file_size, 0)
+
+            if end is not None and end < 0:
+                end = max(end + file_size, 0)
+
+        if file_size:
+            end = file_size if end is None else min(end, file_size)
+
+        if end is not None and end < start:
+            raise ValueError(f"Invalid range: the end ({end}) comes before the start ({start})")
+
+        if end == start:
+            return
+
+        async for chunk in self.get_file_range(file_id_obj, start, end):
+            yield chunk
@@ -16,12 +16,16 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-import asyncio
 from typing import Union, List, Iterable
 
 import pyrogram
 from pyrogram import raw
 from pyrogram import types
+from pyrogram import utils
+from pyrogram.errors import PeerIdInvalid
+
+# Most users that can be fetched by a single users.GetUsers request
+GET_USERS_LIMIT = 200
 
 
 class GetUsers:
@@ -30,7 +34,8 @@ class GetUsers:
         user_ids: Union[int, str, Iterable[Union[int, str]]]
     ) -> Union["types.User", List["types.User"]]:
         """Get information about a user.
-        You can retrieve up to 200 users at once.
+        You can retrieve any number of users at once, lists longer than 200 are split in multiple requests sent
+        concurrently.
 
         .. include:: /_includes/usable-by/users-bots.rst
 
@@ -43,6 +48,9 @@ class GetUsers:
             :obj:`~pyrogram.types.User` | List of :obj:`~pyrogram.types.User`: In case *user_ids* was not a list,
             a single user is returned, otherwise a list of users is returned.
 
+        Raises:
+            PeerIdInvalid: In case *user_ids* was not a list and the user couldn't be found.
+
         Example:
             .. code-block:: python
 
@@ -55,17 +63,31 @@ class GetUsers:
 
         is_iterable = not isinstance(user_ids, (int, str))
         user_ids = list(user_ids) if is_iterable else [user_ids]
-        user_ids = await asyncio.gather(*[self.resolve_peer(i) for i in user_ids])
+        peers = await utils.resolve_peers(self, user_ids)
+
+        async def get_chunk(chunk: list) -> list:
+            return await self.invoke(raw.functions.users.GetUsers(id=chunk))
+
+        r = await utils.gather_chunks(get_chunk, peers, GET_USERS_LIMIT)
 
-        r = await self.invoke(
-            raw.functions.users.GetUsers(
-                id=user_ids
-            )
-        )
+        await self.fetch_peers(r)
 
+        parsed = {user.id: user for user in (types.User._parse(self, i) for i in r) if user}
+        me = await self.storage.user_id()
+
+        # Users are returned in the order they were asked for, the server may leave out the ones it can't find
         users = types.List()
 
-        for i in r:
-            users.append(types.User._parse(self, i))
+        for peer in peers:
+            user_id = me if isinstance(peer, raw.types.InputPeerSelf) else getattr(peer, "user_id", None)
+
+            if user_id in parsed:
+                users.append(parsed[user_id])
+
+        if is_iterable:
+            return users
+
+        if not users:
+            raise PeerIdInvalid
 
-        return users if is_iterable else users[0]
+        return users[0]
@@ -16,6 +16,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+from io import StringIO
+from mimetypes import MimeTypes
+
 # From https://svn.apache.org/repos/asf/httpd/httpd/trunk/docs/conf/mime.types.
 # Extended with extra mime types specific to Telegram.
 
@@ -1882,3 +1885,23 @@ x-conference/x-cooltalk				ice
 application/x-bad-tgsticker		tgs
 application/x-tgsticker		tgs
 """
+
+
+class LazyMimeTypes:
+    """Class attribute holding a :obj:`~mimetypes.MimeTypes` database built from :obj:`mime_types`.
+
+    Parsing the table takes a few milliseconds, so it is only done the first time the attribute is accessed rather than
+    when the owning class is defined. The database is shared by every instance.
+    """
+
+    def __init__(self):
+        self.value = None
+
+    def __get__(self, instance, owner) -> MimeTypes:
+        if self.value is None:
+            value = MimeTypes()
+            value.readfp(StringIO(mime_types))
+
+            self.value = value
+
+        return self.value
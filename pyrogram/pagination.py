@@ -0,0 +1,169 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncGenerator, Awaitable, Callable, Deque, Dict, Iterable, List, NamedTuple, Optional
+
+from pyrogram import raw
+from .flood import FloodRegistry
+
+log = logging.getLogger(__name__)
+
+
+class RawMessage(NamedTuple):
+    """A raw message with the users and chats of its page, yielded by the iterators when *parse* is False."""
+
+    message: "raw.base.Message"
+    users: Dict[int, "raw.base.User"]
+    chats: Dict[int, "raw.base.Chat"]
+
+
+class RawDialog(NamedTuple):
+    """A raw dialog with its raw top message and the users and chats of its page, see :class:`RawMessage`."""
+
+    dialog: "raw.types.Dialog"
+    top_message: Optional["raw.base.Message"]
+    users: Dict[int, "raw.base.User"]
+    chats: Dict[int, "raw.base.Chat"]
+
+
+def get_raw_messages(r: "raw.base.messages.Messages") -> List[RawMessage]:
+    """Pair the messages of a raw result with the users and chats it contains, which are shared by the whole page."""
+    users = {i.id: i for i in r.users}
+    chats = {i.id: i for i in r.chats}
+
+    return [RawMessage(message, users, chats) for message in r.messages]
+
+
+def project(obj: "raw.core.TLObject", fields: Iterable[str]) -> dict:
+    """Get a dict with only the given fields of a raw object, None for those the object doesn't have."""
+    return {field: getattr(obj, field, None) for field in fields}
+
+
+class Paginator:
+    """Iterate over the items of a paginated request, fetching the next pages while the current one is consumed.
+
+    *fetch* is called with no arguments to get the next page and returns its items, an empty page ends the iteration.
+    Since the offsets of a page usually depend on the last item of the previous one, *fetch* is never called again
+    before the previous call has returned and is expected to advance the offsets itself. Pages are yielded in the
+    order they were fetched, item by item, and no more pages are fetched than needed to reach *limit* items.
+
+    Up to *prefetch* pages are fetched ahead of the one being consumed, 0 fetches a page only when the consumer asks
+    for it. When a flood wait happens while fetching a page the prefetch depth is halved, so that an iteration that
+    is already being throttled doesn't keep requesting pages that aren't needed yet.
+
+    Parameters:
+        fetch (``Callable``):
+            Coroutine function returning the items of the next page.
+
+        limit (``int``):
+            Maximum number of items to yield.
+
+        prefetch (``int``, *optional*):
+            Number of pages to fetch ahead. Defaults to 1.
+
+        flood_registry (:obj:`~pyrogram.flood.FloodRegistry`, *optional*):
+            Registry used to notice flood waits happening while fetching.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[Optional[list]]],
+        limit: int,
+        prefetch: int = 1,
+        flood_registry: Optional[FloodRegistry] = None
+    ):
+        self.fetch = fetch
+        self.limit = limit
+        self.prefetch = max(prefetch, 0)
+        self.flood_registry = flood_registry
+
+        self.pages: Deque[list] = deque()
+        self.done = False
+        self.error: Optional[BaseException] = None
+        # Whether the consumer is waiting for a page
+        self.waiting = False
+
+        self.fetched = asyncio.Event()
+        self.consumed = asyncio.Event()
+
+    def can_fetch(self) -> bool:
+        return len(self.pages) < self.prefetch or (self.waiting and not self.pages)
+
+    async def produce(self):
+        count = 0
+
+        try:
+            while count < self.limit:
+                while not self.can_fetch():
+                    self.consumed.clear()
+                    await self.consumed.wait()
+
+                floods = self.flood_registry.floods if self.flood_registry else 0
+                items = await self.fetch()
+
+                if self.flood_registry and self.flood_registry.floods > floods and self.prefetch:
+                    self.prefetch //= 2
+                    log.debug("Flood wait while fetching a page, prefetching %s pages from now on", self.prefetch)
+
+                if not items:
+                    break
+
+                self.pages.append(items)
+                count += len(items)
+                self.fetched.set()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self.fetched.set()
+
+    async def __aiter__(self) -> AsyncGenerator:
+        task = asyncio.create_task(self.produce())
+        current = 0
+
+        try:
+            while True:
+                while not self.pages and not self.done:
+                    self.waiting = True
+                    self.consumed.set()
+                    self.fetched.clear()
+                    await self.fetched.wait()
+
+                self.waiting = False
+
+                if not self.pages:
+                    if self.error is not None:
+                        raise self.error
+
+                    return
+
+                items: List = self.pages.popleft()
+                self.consumed.set()
+
+                for item in items:
+                    yield item
+
+                    current += 1
+
+                    if current >= self.limit:
+                        return
+        finally:
+            task.cancel()
@@ -19,7 +19,6 @@
 import html
 import logging
 import re
-from html.parser import HTMLParser
 from typing import Optional
 
 import pyrogram
@@ -30,19 +29,79 @@ from . import utils
 
 log = logging.getLogger(__name__)
 
-
-class Parser(HTMLParser):
+TAG_PATTERN = (
+    r"(?P<tag><(?:(?P<closing>/)\s*)?(?P<name>[a-zA-Z][^\s/>]*)"
+    r"(?P<attrs>(?:\s+[^\s/>=][^\s/=>]*(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]*))?)*)\s*(?P<self_closing>/?)>)"
+)
+# Comments, declarations and processing instructions are dropped
+COMMENT_PATTERN = r"(?P<comment><!--(?s:.*?)-->|<![^>]*>|<\?[^>]*>)"
+
+HTML_RE = re.compile("|".join([TAG_PATTERN, COMMENT_PATTERN]))
+ATTR_RE = re.compile(r"""([^\s/>=][^\s/=>]*)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s>]*))?""")
+# Characters replaced by html.escape
+ESCAPE_RE = re.compile(r"[&<>\"']")
+
+# Start and end tags of the entities that carry no attributes
+UNPARSE_TAGS = {
+    MessageEntityType.BOLD: ("<b>", "</b>"),
+    MessageEntityType.ITALIC: ("<i>", "</i>"),
+    MessageEntityType.UNDERLINE: ("<u>", "</u>"),
+    MessageEntityType.STRIKETHROUGH: ("<s>", "</s>"),
+    MessageEntityType.BLOCKQUOTE: ("<blockquote>", "</blockquote>"),
+    MessageEntityType.EXPANDABLE_BLOCKQUOTE: ("<blockquote expandable>", "</blockquote>"),
+    MessageEntityType.CODE: ("<code>", "</code>"),
+    MessageEntityType.SPOILER: ("<spoiler>", "</spoiler>"),
+}
+
+
+class Parser:
     MENTION_RE = re.compile(r"tg://user\?id=(\d+)")
 
     def __init__(self, client: "pyrogram.Client"):
-        super().__init__()
-
         self.client = client
 
-        self.text = ""
+        self.chunks = []
+        # Length of the text so far in UTF-16 code units, which is what entity offsets are measured in
+        self.offset = 0
         self.entities = []
         self.tag_entities = {}
 
+        # First chunk of the text since the last start tag, used to strip the whitespace before trailing closing tags
+        self.tail = None
+
+    def feed(self, text: str):
+        position = 0
+
+        for match in HTML_RE.finditer(text):
+            self.handle_data(text[position:match.start()])
+            position = match.end()
+            self.handle_tag(match)
+
+        self.handle_data(text[position:])
+
+    def handle_tag(self, match: re.Match):
+        if match.lastgroup == "comment":
+            return
+
+        tag = match.group("name").lower()
+
+        if match.group("closing"):
+            self.handle_endtag(tag)
+            return
+
+        attrs = []
+
+        for name, value in ATTR_RE.findall(match.group("attrs")):
+            if value[:1] in ("'", '"'):
+                value = value[1:-1]
+
+            attrs.append((name.lower(), html.unescape(value) if value else None))
+
+        self.handle_starttag(tag, attrs)
+
+        if match.group("self_closing"):
+            self.handle_endtag(tag)
+
     def handle_starttag(self, tag, attrs):
         attrs = dict(attrs)
         extra = {}
@@ -86,46 +145,72 @@ class Parser(HTMLParser):
         if tag not in self.tag_entities:
             self.tag_entities[tag] = []
 
-        self.tag_entities[tag].append(entity(offset=len(self.text), length=0, **extra))
+        self.tag_entities[tag].append(entity(offset=self.offset, length=0, **extra))
+        self.tail = None
 
     def handle_data(self, data):
-        data = html.unescape(data)
+        # Unescaped twice, same as when html.parser converted character references before handle_data did it again
+        self.add_text(html.unescape(html.unescape(data)))
+
+    def add_text(self, text: str):
+        if not text:
+            return
 
-        for entities in self.tag_entities.values():
-            for entity in entities:
-                entity.length += len(data)
+        if self.tail is None:
+            self.tail = len(self.chunks)
 
-        self.text += data
+        self.chunks.append(text)
+        self.offset += utils.get_utf16_length(text)
 
     def handle_endtag(self, tag):
         try:
-            self.entities.append(self.tag_entities[tag].pop())
+            entity = self.tag_entities[tag].pop()
+            entity.length = self.offset - entity.offset
+            self.entities.append(entity)
         except (KeyError, IndexError):
-            line, offset = self.getpos()
-            offset += 1
-
-            log.debug("Unmatched closing tag </%s> at line %s:%s", tag, line, offset)
+            log.debug("Unmatched closing tag </%s>", tag)
         else:
             if not self.tag_entities[tag]:
                 self.tag_entities.pop(tag)
 
-    def error(self, message):
-        pass
+    def rstrip(self):
+        """Strip the whitespaces at the end of the text that come right before the closing tags at its end."""
+        if self.tail is None or not any(e.offset + e.length == self.offset for e in self.entities):
+            return
+
+        stripped = 0
+
+        for i in range(len(self.chunks) - 1, self.tail - 1, -1):
+            chunk = self.chunks[i].rstrip()
+            stripped += len(self.chunks[i]) - len(chunk)
+            self.chunks[i] = chunk
+
+            if chunk:
+                break
+
+        if stripped:
+            self.offset -= stripped
+
+            for entity in self.entities:
+                if entity.offset + entity.length > self.offset:
+                    entity.length = max(self.offset - entity.offset, 0)
 
 
 class HTML:
     def __init__(self, client: Optional["pyrogram.Client"]):
         self.client = client
 
-    async def parse(self, text: str):
+    async def parse(self, text: str, resolve: bool = True):
         # Strip whitespaces from the beginning and the end, but preserve closing tags
         text = re.sub(r"^\s*(<[\w<>=\s\"]*>)\s*", r"\1", text)
         text = re.sub(r"\s*(</[\w</>]*>)\s*$", r"\1", text)
 
         parser = Parser(self.client)
-        parser.feed(utils.add_surrogates(text))
-        parser.close()
+        parser.feed(text)
+
+        return await self.get_result(parser, resolve)
 
+    async def get_result(self, parser: Parser, resolve: bool = True):
         if parser.tag_entities:
             unclosed_tags = []
 
@@ -134,24 +219,42 @@ class HTML:
 
             log.info("Unclosed tags: %s", ", ".join(unclosed_tags))
 
+        # Remove zero-length entities
+        entities = list(filter(lambda x: x.length > 0, parser.entities))
+
+        result = {
+            "message": "".join(parser.chunks),
+            "entities": sorted(entities, key=lambda e: e.offset) or None
+        }
+
+        return await self.resolve_mentions(result) if resolve else result
+
+    async def resolve_mentions(self, result: dict) -> dict:
+        """Return a copy of a parse result in which the user ids of the mentions are resolved to input users.
+
+        Mentions of users that can't be resolved are dropped. The given result is left as it is, so that it can be
+        cached and resolved again later.
+        """
         entities = []
 
-        for entity in parser.entities:
-            if isinstance(entity, raw.types.InputMessageEntityMentionName):
+        for entity in result["entities"] or []:
+            if isinstance(entity, raw.types.InputMessageEntityMentionName) and self.client is not None:
                 try:
-                    if self.client is not None:
-                        entity.user_id = await self.client.resolve_peer(entity.user_id)
+                    user_id = await self.client.resolve_peer(entity.user_id)
                 except PeerIdInvalid:
                     continue
 
-            entities.append(entity)
+                entity = raw.types.InputMessageEntityMentionName(
+                    offset=entity.offset,
+                    length=entity.length,
+                    user_id=user_id
+                )
 
-        # Remove zero-length entities
-        entities = list(filter(lambda x: x.length > 0, entities))
+            entities.append(entity)
 
         return {
-            "message": utils.remove_surrogates(parser.text),
-            "entities": sorted(entities, key=lambda e: e.offset) or None
+            "message": result["message"],
+            "entities": entities or None
         }
 
     @staticmethod
@@ -164,35 +267,12 @@ class HTML:
             start = entity.offset
             end = start + entity.length
 
-            if entity_type in (
-                MessageEntityType.BOLD,
-                MessageEntityType.ITALIC,
-                MessageEntityType.UNDERLINE,
-                MessageEntityType.STRIKETHROUGH,
-            ):
-                name = entity_type.name[0].lower()
-                start_tag = f"<{name}>"
-                end_tag = f"</{name}>"
+            if entity_type in UNPARSE_TAGS:
+                start_tag, end_tag = UNPARSE_TAGS[entity_type]
             elif entity_type == MessageEntityType.PRE:
-                name = entity_type.name.lower()
                 language = getattr(entity, "language", "") or ""
-                start_tag = f'<{name} language="{language}">' if language else f"<{name}>"
-                end_tag = f"</{name}>"
-            elif entity_type == MessageEntityType.BLOCKQUOTE:
-                name = entity_type.name.lower()
-                start_tag = f"<{name}>"
-                end_tag = f"</{name}>"
-            elif entity_type == MessageEntityType.EXPANDABLE_BLOCKQUOTE:
-                name = "blockquote"
-                start_tag = f"<{name} expandable>"
-                end_tag = f"</{name}>"
-            elif entity_type in (
-                MessageEntityType.CODE,
-                MessageEntityType.SPOILER,
-            ):
-                name = entity_type.name.lower()
-                start_tag = f"<{name}>"
-                end_tag = f"</{name}>"
+                start_tag = f'<pre language="{language}">' if language else "<pre>"
+                end_tag = "</pre>"
             elif entity_type == MessageEntityType.TEXT_LINK:
                 url = entity.url
                 start_tag = f'<a href="{url}">'
@@ -210,42 +290,49 @@ class HTML:
 
             return (start_tag, start), (end_tag, end)
 
-        def recursive(entity_i: int) -> int:
-            """
-            Takes the index of the entity to start parsing from, returns the number of parsed entities inside it.
-            Uses entities_offsets as a stack, pushing (start_tag, start) first, then parsing nested entities,
-            and finally pushing (end_tag, end) to the stack.
-            No need to sort at the end.
-            """
-            this = parse_one(entities[entity_i])
-            if this is None:
-                return 1
-            (start_tag, start), (end_tag, end) = this
-            entities_offsets.append((start_tag, start))
-            internal_i = entity_i + 1
-            # while the next entity is inside the current one, keep parsing
-            while internal_i < len(entities) and entities[internal_i].offset < end:
-                internal_i += recursive(internal_i)
-            entities_offsets.append((end_tag, end))
-            return internal_i - entity_i
-
-        text = utils.add_surrogates(text)
+        # Surrogates only need to be added and removed when there are code points outside the BMP. The text is turned
+        # into a plain str either way, Message.text is a subclass that adds surrogates on every slice.
+        is_bmp = utils.is_bmp(text)
+        text = str(text) if is_bmp else utils.add_surrogates(text)
 
         entities_offsets = []
 
         # probably useless because entities are already sorted by telegram
         entities.sort(key=lambda e: (e.offset, -e.length))
 
-        # main loop for first-level entities
-        i = 0
-        while i < len(entities):
-            i += recursive(i)
+        # Entities starting before the innermost open one ends are nested inside it, the open ones are kept in a stack
+        # and closed as soon as the next entity starts at or after their end.
+        stack = []
+
+        for entity in entities:
+            tags = parse_one(entity)
+
+            if tags is None:
+                continue
+
+            start, end = tags
+
+            while stack and stack[-1][1] <= start[1]:
+                entities_offsets.append(stack.pop())
+
+            entities_offsets.append(start)
+            stack.append(end)
+
+        entities_offsets.extend(reversed(stack))
 
         if entities_offsets:
-            last_offset = entities_offsets[-1][1]
-            # no need to sort, but still add entities starting from the end
-            for entity, offset in reversed(entities_offsets):
-                text = text[:offset] + entity + html.escape(text[offset:last_offset]) + text[last_offset:]
-                last_offset = offset
+            # the text between the tags is escaped, the text before the first and after the last tag is left as is
+            parts = [text[:entities_offsets[0][1]]]
+            escape = ESCAPE_RE.search(text, entities_offsets[0][1], entities_offsets[-1][1]) is not None
+
+            for (entity, offset), (_, next_offset) in zip(entities_offsets, entities_offsets[1:]):
+                parts.append(entity)
+                parts.append(html.escape(text[offset:next_offset]) if escape else text[offset:next_offset])
+
+            entity, offset = entities_offsets[-1]
+            parts.append(entity)
+            parts.append(text[offset:])
+
+            text = "".join(parts)
 
-        return utils.remove_surrogates(text)
+        return text if is_bmp else utils.remove_surrogates(text)
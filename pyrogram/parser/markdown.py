@@ -24,7 +24,7 @@ from typing import Optional
 import pyrogram
 from pyrogram.enums import MessageEntityType
 from . import utils
-from .html import HTML
+from .html import HTML, Parser, TAG_PATTERN, COMMENT_PATTERN
 
 BOLD_DELIM = "**"
 ITALIC_DELIM = "__"
@@ -36,138 +36,247 @@ PRE_DELIM = "```"
 BLOCKQUOTE_DELIM = ">"
 BLOCKQUOTE_EXPANDABLE_DELIM = "**>"
 
-MARKDOWN_RE = re.compile(r"({d})|(!?)\[(.+?)\]\((.+?)\)".format(
-    d="|".join(
-        ["".join(i) for i in [
-            [rf"\{j}" for j in i]
-            for i in [
-                PRE_DELIM,
-                CODE_DELIM,
-                STRIKE_DELIM,
-                UNDERLINE_DELIM,
-                ITALIC_DELIM,
-                BOLD_DELIM,
-                SPOILER_DELIM
-            ]
-        ]]
-    )))
-
-OPENING_TAG = "<{}>"
-CLOSING_TAG = "</{}>"
-URL_MARKUP = '<a href="{}">{}</a>'
-EMOJI_MARKUP = '<emoji id={}>{}</emoji>'
+DELIM_TAGS = {
+    PRE_DELIM: "pre",
+    CODE_DELIM: "code",
+    STRIKE_DELIM: "s",
+    UNDERLINE_DELIM: "u",
+    ITALIC_DELIM: "i",
+    BOLD_DELIM: "b",
+    SPOILER_DELIM: "spoiler",
+}
+
+DELIM_PATTERN = r"(?P<delim>{})".format("|".join(re.escape(i) for i in DELIM_TAGS))
+LINK_PATTERN = r"(?P<link>(?P<emoji>!?)\[(?P<text>.+?)\]\((?P<url>.+?)\))"
+
+MARKDOWN_RE = re.compile("|".join([TAG_PATTERN, COMMENT_PATTERN, DELIM_PATTERN, LINK_PATTERN]))
+STRICT_MARKDOWN_RE = re.compile("|".join([DELIM_PATTERN, LINK_PATTERN]))
+LEADING_TAG_RE = re.compile(r"<[\w<>=\s\"]*>")
+
 FIXED_WIDTH_DELIMS = [CODE_DELIM, PRE_DELIM]
 
+# Delimiters of the entities that are wrapped in the same delimiter on both sides
+UNPARSE_DELIMS = {
+    MessageEntityType.BOLD: BOLD_DELIM,
+    MessageEntityType.ITALIC: ITALIC_DELIM,
+    MessageEntityType.UNDERLINE: UNDERLINE_DELIM,
+    MessageEntityType.STRIKETHROUGH: STRIKE_DELIM,
+    MessageEntityType.CODE: CODE_DELIM,
+    MessageEntityType.SPOILER: SPOILER_DELIM,
+}
 
-class Markdown:
-    def __init__(self, client: Optional["pyrogram.Client"]):
-        self.html = HTML(client)
 
-    def _parse_blockquotes(self, text: str):
-        text = html.unescape(text)
-        lines = text.split('\n')
-        result = []
-        in_blockquote = False
-        is_expandable_blockquote = False
-        current_blockquote = []
+class MarkdownParser(Parser):
+    """Single pass over Markdown text, HTML tags included unless strict, that creates the entities directly instead
+    of converting the text to HTML first."""
+
+    def __init__(self, client: Optional["pyrogram.Client"], strict: bool = False):
+        super().__init__(client)
+
+        self.strict = strict
+        self.pattern = STRICT_MARKDOWN_RE if strict else MARKDOWN_RE
 
-        for line in lines:
+        self.delims = set()
+        self.is_fixed_width = False
+
+        # Whitespaces around the tags the text starts with are stripped, same as HTML.parse does
+        self.is_leading = True
+        self.has_leading_tag = False
+        self.leading_whitespace = ""
+
+        # Number of chunks when the last closing tag was handled, the whitespaces after the closing tags the text
+        # ends with are stripped too
+        self.closing_chunks = None
+
+    def feed(self, text: str):
+        blocks = []
+
+        # Consecutive lines are grouped into blocks of either plain or quoted lines, expandable is None for the former
+        for line in text.split("\n"):
             if line.startswith(BLOCKQUOTE_DELIM):
-                in_blockquote = True
-                current_blockquote.append(line[1:].strip())
+                line, expandable = line[1:].strip(), False
             elif line.startswith(BLOCKQUOTE_EXPANDABLE_DELIM):
-                in_blockquote = True
-                is_expandable_blockquote = True
-                current_blockquote.append(line[3:].strip())
+                line, expandable = line[3:].strip(), True
             else:
-                if in_blockquote:
-                    in_blockquote = False
-                    result.append(
-                        (f"<blockquote expandable>" if is_expandable_blockquote else OPENING_TAG.format("blockquote")) +
-                        '\n'.join(current_blockquote) +
-                        CLOSING_TAG.format("blockquote")
-                    )
-                    current_blockquote = []
-                result.append(line)
-
-        if in_blockquote:
-            result.append(
-                (f"<blockquote expandable>" if is_expandable_blockquote else OPENING_TAG.format("blockquote")) +
-                '\n'.join(current_blockquote) +
-                CLOSING_TAG.format("blockquote")
-            )
-        return '\n'.join(result)
-
-    async def parse(self, text: str, strict: bool = False):
-        if strict:
-            text = html.escape(text)
-        
-
-        text = self._parse_blockquotes(text)
-
-        text = self._parse_blockquotes(text)
-
-        delims = set()
-        is_fixed_width = False
-
-        for i, match in enumerate(re.finditer(MARKDOWN_RE, text)):
-            start, _ = match.span()
-            delim, is_emoji, text_url, url = match.groups()
-            full = match.group(0)
-
-            if delim in FIXED_WIDTH_DELIMS:
-                is_fixed_width = not is_fixed_width
-
-            if is_fixed_width and delim not in FIXED_WIDTH_DELIMS:
-                continue
+                expandable = None
 
-            if not is_emoji and text_url:
-                text = utils.replace_once(text, full, URL_MARKUP.format(url, text_url), start)
-                continue
+            if blocks and (blocks[-1][1] is None) == (expandable is None):
+                blocks[-1][0].append(line)
 
-            if is_emoji:
-                emoji = text_url
-                emoji_id = url.lstrip("tg://emoji?id=")
-                text = utils.replace_once(text, full, EMOJI_MARKUP.format(emoji_id, emoji), start)
-                continue
+                if expandable:
+                    blocks[-1][1] = True
+            else:
+                blocks.append([[line], expandable])
+
+        for i, (lines, expandable) in enumerate(blocks):
+            if i:
+                self.handle_data("\n")
 
-            if delim == BOLD_DELIM:
-                tag = "b"
-            elif delim == ITALIC_DELIM:
-                tag = "i"
-            elif delim == UNDERLINE_DELIM:
-                tag = "u"
-            elif delim == STRIKE_DELIM:
-                tag = "s"
-            elif delim == CODE_DELIM:
-                tag = "code"
-            elif delim == PRE_DELIM:
-                tag = "pre"
-            elif delim == SPOILER_DELIM:
-                tag = "spoiler"
+            if expandable is None:
+                self.tokenize("\n".join(lines))
             else:
+                if expandable:
+                    self.open_tag("blockquote", [("expandable", None)], "<blockquote expandable>")
+                else:
+                    self.open_tag("blockquote", [], "<blockquote>")
+
+                self.tokenize("\n".join(lines))
+                self.handle_endtag("blockquote")
+
+        self.strip_trailing()
+        self.rstrip()
+
+    def tokenize(self, text: str):
+        position = 0
+
+        for match in self.pattern.finditer(text):
+            start = match.start()
+
+            # Skip what has already been consumed as the language of a pre block
+            if start < position:
                 continue
 
-            if delim not in delims:
-                delims.add(delim)
-                tag = OPENING_TAG.format(tag)
+            self.handle_data(text[position:start])
+            position = match.end()
+
+            kind = match.lastgroup
+
+            if kind == "delim":
+                delim = match.group(kind)
+
+                if delim in FIXED_WIDTH_DELIMS:
+                    self.is_fixed_width = not self.is_fixed_width
+
+                if self.is_fixed_width and delim not in FIXED_WIDTH_DELIMS:
+                    self.handle_data(delim)
+                    continue
+
+                tag = DELIM_TAGS[delim]
+
+                if delim in self.delims:
+                    self.delims.remove(delim)
+                    self.handle_endtag(tag)
+                    continue
+
+                self.delims.add(delim)
+
+                if delim == PRE_DELIM:
+                    # The rest of the line is the language, unless the block ends on the same line
+                    end = text.find("\n", position)
+                    end = len(text) if end == -1 else end
+                    language = text[position:end]
+
+                    if PRE_DELIM in language:
+                        language = ""
+                    else:
+                        position = end
+
+                    self.open_tag(tag, [("language", html.unescape(language))], f'<pre language="{language}">')
+                else:
+                    self.open_tag(tag, [], f"<{tag}>")
+            elif kind == "link":
+                if self.is_fixed_width:
+                    self.tokenize_html(match.group(kind))
+                    continue
+
+                url = match.group("url")
+
+                if match.group("emoji"):
+                    emoji_id = url.lstrip("tg://emoji?id=")
+                    self.open_tag("emoji", [("id", emoji_id)], f"<emoji id={emoji_id}>")
+                    self.tokenize_html(match.group("text"))
+                    self.handle_endtag("emoji")
+                else:
+                    self.open_tag("a", [("href", html.unescape(url))], f'<a href="{url}">')
+                    self.tokenize_html(match.group("text"))
+                    self.handle_endtag("a")
             else:
-                delims.remove(delim)
-                tag = CLOSING_TAG.format(tag)
+                self.handle_tag(match)
 
-            if delim == PRE_DELIM and delim in delims:
-                delim_and_language = text[text.find(PRE_DELIM):].split("\n")[0]
-                language = delim_and_language[len(PRE_DELIM):]
-                text = utils.replace_once(text, delim_and_language, f'<pre language="{language}">', start)
-                continue
+        self.handle_data(text[position:])
+
+    def tokenize_html(self, text: str):
+        if self.strict:
+            self.handle_data(text)
+        else:
+            super().feed(text)
+
+    def handle_tag(self, match: re.Match):
+        if match.lastgroup != "comment":
+            self.check_leading(match.group())
+
+        super().handle_tag(match)
+
+    def open_tag(self, tag: str, attrs: list, markup: str):
+        self.check_leading(markup)
+        self.handle_starttag(tag, attrs)
+
+    def check_leading(self, markup: str):
+        if not self.is_leading:
+            return
+
+        # Whitespaces before the first leading tag are dropped and those between the leading tags are kept, until a
+        # tag that HTML.parse wouldn't strip after
+        if LEADING_TAG_RE.fullmatch(markup):
+            if self.leading_whitespace and self.has_leading_tag:
+                self.add_text(self.leading_whitespace)
+
+            self.leading_whitespace = ""
+            self.has_leading_tag = True
+        else:
+            self.is_leading = False
+
+    def strip_trailing(self):
+        if self.closing_chunks is None:
+            return
+
+        trailing = self.chunks[self.closing_chunks:]
 
-            text = utils.replace_once(text, delim, tag, start)
+        if trailing and all(chunk.isspace() for chunk in trailing):
+            del self.chunks[self.closing_chunks:]
+            self.offset -= sum(utils.get_utf16_length(chunk) for chunk in trailing)
 
-        return await self.html.parse(text)
+    def handle_endtag(self, tag):
+        self.is_leading = False
+        self.closing_chunks = len(self.chunks)
+        super().handle_endtag(tag)
+
+    def handle_data(self, data):
+        if self.is_leading:
+            if not data or data.isspace():
+                self.leading_whitespace += data
+                return
+
+            # Text with no tag before it keeps its leading whitespaces
+            if self.has_leading_tag:
+                data = data.lstrip()
+            else:
+                data = self.leading_whitespace + data
+
+            self.is_leading = False
+
+        if self.strict:
+            self.add_text(data)
+        else:
+            super().handle_data(data)
+
+
+class Markdown:
+    def __init__(self, client: Optional["pyrogram.Client"]):
+        self.html = HTML(client)
+
+    async def parse(self, text: str, strict: bool = False, resolve: bool = True):
+        parser = MarkdownParser(self.html.client, strict)
+        parser.feed(text)
+
+        return await self.html.get_result(parser, resolve)
 
     @staticmethod
     def unparse(text: str, entities: list):
-        text = utils.add_surrogates(text)
+        # Surrogates only need to be added and removed when there are code points outside the BMP. The text is turned
+        # into a plain str either way, Message.text is a subclass that adds surrogates on every slice.
+        is_bmp = utils.is_bmp(text)
+        text = str(text) if is_bmp else utils.add_surrogates(text)
 
         entities_offsets = []
 
@@ -176,16 +285,8 @@ class Markdown:
             start = entity.offset
             end = start + entity.length
 
-            if entity_type == MessageEntityType.BOLD:
-                start_tag = end_tag = BOLD_DELIM
-            elif entity_type == MessageEntityType.ITALIC:
-                start_tag = end_tag = ITALIC_DELIM
-            elif entity_type == MessageEntityType.UNDERLINE:
-                start_tag = end_tag = UNDERLINE_DELIM
-            elif entity_type == MessageEntityType.STRIKETHROUGH:
-                start_tag = end_tag = STRIKE_DELIM
-            elif entity_type == MessageEntityType.CODE:
-                start_tag = end_tag = CODE_DELIM
+            if entity_type in UNPARSE_DELIMS:
+                start_tag = end_tag = UNPARSE_DELIMS[entity_type]
             elif entity_type == MessageEntityType.PRE:
                 language = getattr(entity, "language", "") or ""
                 start_tag = f"{PRE_DELIM}{language}\n"
@@ -206,8 +307,6 @@ class Markdown:
                     entities_offsets.append((end_tag, end_offset,))
                     last_length = last_length+1
                 continue
-            elif entity_type == MessageEntityType.SPOILER:
-                start_tag = end_tag = SPOILER_DELIM
             elif entity_type == MessageEntityType.TEXT_LINK:
                 url = entity.url
                 start_tag = "["
@@ -226,16 +325,18 @@ class Markdown:
             entities_offsets.append((start_tag, start,))
             entities_offsets.append((end_tag, end,))
 
-        entities_offsets = map(
-            lambda x: x[1],
-            sorted(
-                enumerate(entities_offsets),
-                key=lambda x: (x[1][1], x[0]),
-                reverse=True
-            )
-        )
+        # Tags at the same offset keep the order they were added in
+        entities_offsets.sort(key=lambda x: x[1])
+
+        parts = []
+        last_offset = 0
 
         for entity, offset in entities_offsets:
-            text = text[:offset] + entity + text[offset:]
+            parts.append(text[last_offset:offset])
+            parts.append(entity)
+            last_offset = offset
+
+        parts.append(text[last_offset:])
+        text = "".join(parts)
 
-        return utils.remove_surrogates(text)
+        return text if is_bmp else utils.remove_surrogates(text)
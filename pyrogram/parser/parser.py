@@ -20,16 +20,20 @@ from typing import Optional
 
 import pyrogram
 from pyrogram import enums
+from pyrogram.cache import Cache
 from .html import HTML
 from .markdown import Markdown
 
 
 class Parser:
-    def __init__(self, client: Optional["pyrogram.Client"]):
+    def __init__(self, client: Optional["pyrogram.Client"], cache_size: int = 0):
         self.client = client
         self.html = HTML(client)
         self.markdown = Markdown(client)
 
+        # Parse results by (mode, text), kept with the mentions unresolved
+        self.cache = Cache(cache_size) if cache_size else None
+
     async def parse(self, text: str, mode: Optional[enums.ParseMode] = None):
         text = str(text if text else "").strip()
 
@@ -39,14 +43,27 @@ class Parser:
             else:
                 mode = enums.ParseMode.DEFAULT
 
+        if self.cache is None:
+            return await self.parse_text(text, mode)
+
+        key = (mode, text)
+        result = self.cache.get(key)
+
+        if result is None:
+            result = self.cache[key] = await self.parse_text(text, mode, False)
+
+        # Mentions are resolved every time, the cached result must not change and the peers may not be known yet
+        return await self.html.resolve_mentions(result)
+
+    async def parse_text(self, text: str, mode: enums.ParseMode, resolve: bool = True):
         if mode == enums.ParseMode.DEFAULT:
-            return await self.markdown.parse(text)
+            return await self.markdown.parse(text, resolve=resolve)
 
         if mode == enums.ParseMode.MARKDOWN:
-            return await self.markdown.parse(text, True)
+            return await self.markdown.parse(text, True, resolve)
 
         if mode == enums.ParseMode.HTML:
-            return await self.html.parse(text)
+            return await self.html.parse(text, resolve)
 
         if mode == enums.ParseMode.DISABLED:
             return {"message": text, "entities": None}
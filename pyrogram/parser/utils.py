@@ -21,6 +21,8 @@ from struct import unpack
 
 # SMP = Supplementary Multilingual Plane: https://en.wikipedia.org/wiki/Plane_(Unicode)#Overview
 SMP_RE = re.compile(r"[\U00010000-\U0010FFFF]")
+# Code points that add_surrogates or remove_surrogates would change: SMP code points and lone surrogates
+NON_BMP_RE = re.compile(r"[\U00010000-\U0010FFFF\uD800-\uDFFF]")
 
 
 def add_surrogates(text):
@@ -32,10 +34,18 @@ def add_surrogates(text):
     )
 
 
+def is_bmp(text):
+    return text.isascii() or NON_BMP_RE.search(text) is None
+
+
 def remove_surrogates(text):
     # Replace each surrogate pair with a SMP code point
     return text.encode("utf-16", "surrogatepass").decode("utf-16", "ignore")
 
 
-def replace_once(source: str, old: str, new: str, start: int):
-    return source[:start] + source[start:].replace(old, new, 1)
+def get_utf16_length(text: str) -> int:
+    # SMP code points take two UTF-16 code units
+    if text.isascii():
+        return len(text)
+
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
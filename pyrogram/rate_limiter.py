@@ -0,0 +1,247 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+from pyrogram import raw
+from pyrogram.raw.core import TLObject
+from .cache import Cache
+from .flood import get_peer_key
+
+
+class TokenBucket:
+    """Allow up to *count* events every *period* seconds, refilling continuously."""
+
+    def __init__(self, count: int, period: float):
+        self.capacity = count
+        self.rate = count / period
+        self.tokens = float(count)
+        self.updated = time.monotonic()
+
+    def delay(self, now: float) -> float:
+        """Seconds to wait before a token is available."""
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def consume(self):
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """Throttle outgoing messages to stay within Telegram's sending limits.
+
+    Every limited request takes a token from the global bucket and one from the bucket of its chat. Requests that
+    can't be sent yet are queued per chat and the queues are served round-robin, so that a chat with a long backlog
+    (e.g. a broadcast) doesn't delay the messages sent to the other chats.
+
+    Limits are ``(count, seconds)`` tuples; pass None to disable a limit.
+
+    Parameters:
+        total (``tuple``, *optional*):
+            Limit for all the chats together. Defaults to 30 messages per second.
+
+        private (``tuple``, *optional*):
+            Limit for each private chat. Defaults to 1 message per second.
+
+        group (``tuple``, *optional*):
+            Limit for each group or channel. Defaults to 20 messages per minute.
+    """
+
+    LIMITED_FUNCTIONS = (
+        raw.functions.messages.SendMessage,
+        raw.functions.messages.SendMedia,
+        raw.functions.messages.SendMultiMedia,
+        raw.functions.messages.SendInlineBotResult,
+        raw.functions.messages.ForwardMessages,
+        raw.functions.messages.EditMessage,
+        raw.functions.messages.EditInlineBotMessage,
+    )
+
+    GROUP_PEER_KEYS = ("chat_id", "channel_id")
+    MAX_BUCKETS = 10000
+
+    def __init__(
+        self,
+        total: Optional[Tuple[int, float]] = (30, 1),
+        private: Optional[Tuple[int, float]] = (1, 1),
+        group: Optional[Tuple[int, float]] = (20, 60)
+    ):
+        self.private = private
+        self.group = group
+
+        self.total_bucket = TokenBucket(*total) if total else None
+        self.buckets = Cache(self.MAX_BUCKETS)
+
+        self.queues: Dict[Hashable, Deque[Tuple[asyncio.Future, float]]] = {}
+        # Chats with queued requests, in the order they are served
+        self.order: Deque[Hashable] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+        self.requests = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.max_queued = 0
+
+    def is_limited(self, query: TLObject) -> bool:
+        return isinstance(query, self.LIMITED_FUNCTIONS)
+
+    def get_bucket(self, chat: Optional[Hashable]) -> Optional[TokenBucket]:
+        if chat is None:
+            return None
+
+        limit = self.group if chat[0] in self.GROUP_PEER_KEYS else self.private
+
+        if not limit:
+            return None
+
+        bucket = self.buckets.get(chat)
+
+        if bucket is None:
+            bucket = self.buckets[chat] = TokenBucket(*limit)
+
+        return bucket
+
+    def get_delay(self, chat: Optional[Hashable], now: float) -> float:
+        bucket = self.get_bucket(chat)
+
+        return max(
+            self.total_bucket.delay(now) if self.total_bucket else 0,
+            bucket.delay(now) if bucket else 0
+        )
+
+    def take(self, chat: Optional[Hashable]):
+        bucket = self.get_bucket(chat)
+
+        if self.total_bucket:
+            self.total_bucket.consume()
+
+        if bucket:
+            bucket.consume()
+
+        self.requests += 1
+
+    async def acquire(self, query: TLObject):
+        """Wait until *query* can be sent without exceeding the limits."""
+        chat = get_peer_key(query)
+        now = time.monotonic()
+
+        if chat not in self.queues and not self.get_delay(chat, now):
+            self.take(chat)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+
+        if chat not in self.queues:
+            self.queues[chat] = deque()
+            self.order.append(chat)
+
+        self.queues[chat].append((future, now))
+        self.max_queued = max(self.max_queued, self.queued)
+        self.wakeup.set()
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.serve())
+
+        await future
+
+    async def serve(self):
+        while self.order:
+            # Drop the requests that were cancelled while waiting
+            for chat in list(self.order):
+                queue = self.queues[chat]
+
+                while queue and queue[0][0].done():
+                    queue.popleft()
+
+                if not queue:
+                    self.order.remove(chat)
+                    del self.queues[chat]
+
+            now = time.monotonic()
+            delay = math.inf
+
+            for _ in range(len(self.order)):
+                chat = self.order[0]
+                chat_delay = self.get_delay(chat, now)
+
+                if chat_delay:
+                    delay = min(delay, chat_delay)
+                    self.order.rotate(-1)
+                    continue
+
+                queue = self.queues[chat]
+                future, queued_at = queue.popleft()
+
+                self.take(chat)
+                self.delayed += 1
+                self.wait_time += now - queued_at
+                self.max_wait_time = max(self.max_wait_time, now - queued_at)
+
+                future.set_result(None)
+
+                # The chat goes to the back of the line, so that the next request is for another chat
+                self.order.rotate(-1)
+
+                if not queue:
+                    self.order.pop()
+                    del self.queues[chat]
+
+                break
+            else:
+                if self.order:
+                    self.wakeup.clear()
+
+                    try:
+                        await asyncio.wait_for(self.wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+                continue
+
+            # Let the released request run before serving the next one
+            await asyncio.sleep(0)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self.queues.values())
+
+    def queue_depths(self) -> Dict[Hashable, int]:
+        """Get the number of queued requests of each chat."""
+        return {chat: len(queue) for chat, queue in self.queues.items()}
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "chats": len(self.queues),
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+            "average_wait_time": self.wait_time / self.delayed if self.delayed else 0.0,
+        }
@@ -28,4 +28,5 @@ from .primitives.double import Double
 from .primitives.int import Int, Long, Int128, Int256
 from .primitives.string import String
 from .primitives.vector import Vector
+from .registry import Registry
 from .tl_object import TLObject
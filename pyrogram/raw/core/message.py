@@ -17,11 +17,14 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from io import BytesIO
+from struct import Struct
 from typing import Any
 
 from .primitives.int import Int, Long
 from .tl_object import TLObject
 
+HEADER = Struct("<qii")
+
 
 class Message(TLObject):
     ID = 0x5BB8E511  # hex(crc32(b"message msg_id:long seqno:int bytes:int body:Object = Message"))
@@ -46,11 +49,17 @@ class Message(TLObject):
         return Message(TLObject.read(BytesIO(body)), msg_id, seq_no, length)
 
     def write(self, *args: Any) -> bytes:
-        b = BytesIO()
+        b = bytearray()
+        self.write_into(b)
+
+        return bytes(b)
+
+    def write_into(self, b: bytearray) -> None:
+        start = len(b)
 
-        b.write(Long(self.msg_id))
-        b.write(Int(self.seq_no))
-        b.write(Int(self.length))
-        b.write(self.body.write())
+        # The body length is filled in once the body is written, so that it doesn't need to be serialized twice
+        b += HEADER.pack(self.msg_id, self.seq_no, 0)
+        self.body.write_into(b)
 
-        return b.getvalue()
+        self.length = len(b) - start - HEADER.size
+        b[start + 12:start + HEADER.size] = self.length.to_bytes(4, "little")
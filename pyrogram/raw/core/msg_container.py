@@ -40,14 +40,14 @@ class MsgContainer(TLObject):
         return MsgContainer([Message.read(data) for _ in range(count)])
 
     def write(self, *args: Any) -> bytes:
-        b = BytesIO()
+        b = bytearray()
+        self.write_into(b)
 
-        b.write(Int(self.ID, False))
+        return bytes(b)
 
-        count = len(self.messages)
-        b.write(Int(count))
+    def write_into(self, b: bytearray) -> None:
+        b += Int(self.ID, False)
+        b += Int(len(self.messages))
 
         for message in self.messages:
-            b.write(message.write())
-
-        return b.getvalue()
+            message.write_into(b)
@@ -17,7 +17,7 @@
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
 from io import BytesIO
-from typing import Any
+from typing import Any, Union
 
 from ..tl_object import TLObject
 
@@ -53,3 +53,18 @@ class Bytes(bytes, TLObject):
                 + value
                 + bytes(-length % 4)
             )
+
+    @staticmethod
+    def append(b: bytearray, value: Union[bytes, bytearray, memoryview]) -> None:
+        """Append the serialization of *value* to *b*, without building an intermediate bytes object."""
+        length = len(value)
+
+        if length <= 253:
+            b.append(length)
+            b += value
+            b += bytes(-(length + 1) % 4)
+        else:
+            b.append(254)
+            b += length.to_bytes(3, "little")
+            b += value
+            b += bytes(-length % 4)
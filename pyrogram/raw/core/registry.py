@@ -0,0 +1,76 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from importlib import import_module
+from typing import Dict, Iterator, Any
+
+
+class Registry(dict):
+    """Constructor ID to TL class mapping that imports classes on first lookup.
+
+    The generated table maps each constructor ID to the dotted path of its class. A class is imported and cached
+    the first time its ID is looked up, so only the objects actually seen on the wire are ever loaded.
+    """
+
+    __slots__ = ("table",)
+
+    def __init__(self, table: Dict[int, str]):
+        super().__init__()
+
+        self.table = table
+
+    def __missing__(self, key: int) -> type:
+        path, name = self.table[key].rsplit(".", 1)
+        value = self[key] = getattr(import_module(path), name)
+
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.table
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def get(self, key: int, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.table.keys()
+
+    def values(self):
+        self.load()
+
+        return super().values()
+
+    def items(self):
+        self.load()
+
+        return super().items()
+
+    def load(self) -> "Registry":
+        """Import every class in the table at once, like the eager registry used to do."""
+        for key in self.table:
+            _ = self[key]
+
+        return self
@@ -35,11 +35,17 @@ class TLObject:
     def write(self, *args: Any) -> bytes:
         pass
 
+    def write_into(self, b: bytearray) -> None:
+        b += self.write()
+
     @staticmethod
     def default(obj: "TLObject") -> Union[str, Dict[str, str]]:
         if isinstance(obj, bytes):
             return repr(obj)
 
+        if isinstance(obj, memoryview):
+            return repr(obj.tobytes())
+
         return {
             "_": obj.QUALNAME,
             **{
@@ -0,0 +1,351 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import pyrogram
+from pyrogram import raw, utils
+from pyrogram.errors import RPCError
+
+log = logging.getLogger(__name__)
+
+
+class UpdatesSequencer:
+    """Apply updates carrying a pts exactly once and in order.
+
+    Every update box (the common one, identified by 0, and one per channel, identified by the raw channel id) keeps
+    the pts of the last applied update. Updates that were already applied are dropped, updates that arrive too early
+    are held back for a short while waiting for the missing ones and only when a gap can't be filled the difference
+    of that single box is fetched.
+
+    Parameters:
+        client (:obj:`~pyrogram.Client`):
+            The client the updates are dispatched to.
+    """
+
+    GAP_TIMEOUT = 0.5
+    # Times the difference of a box is asked for before the updates that still don't fit in are dropped
+    MAX_GAP_ATTEMPTS = 3
+    MAX_PENDING = 100
+    CHANNEL_DIFFERENCE_LIMIT = 100
+
+    AFFECTED_RESULTS = (
+        raw.types.messages.AffectedMessages,
+        raw.types.messages.AffectedHistory,
+        raw.types.messages.AffectedFoundMessages,
+    )
+
+    # Functions wrapping the query actually sent, which is found in their *query* field
+    WRAPPERS = (
+        raw.functions.InvokeWithTakeout,
+        raw.functions.InvokeWithoutUpdates,
+        raw.functions.InvokeWithLayer,
+        raw.functions.InvokeAfterMsg,
+        raw.functions.InvokeAfterMsgs,
+        raw.functions.InvokeWithMessagesRange,
+        raw.functions.InvokeWithBusinessConnection,
+        raw.functions.InitConnection,
+    )
+
+    def __init__(self, client: "pyrogram.Client"):
+        self.client = client
+
+        self.states: Dict[int, int] = {}
+        self.pending: Dict[int, List[Tuple[int, int, Optional[tuple]]]] = {}
+        self.gap_tasks: Dict[int, asyncio.Task] = {}
+        # Date of the last common box update, needed to ask for the difference
+        self.date = 0
+
+        self.counters = {
+            "applied": 0,
+            "duplicates": 0,
+            "reordered": 0,
+            "gaps": 0,
+            "differences": 0,
+            "dropped": 0,
+        }
+
+    @staticmethod
+    def get_box(update: "raw.base.Update") -> int:
+        return getattr(
+            getattr(
+                getattr(
+                    update, "message", None
+                ), "peer_id", None
+            ), "channel_id", None
+        ) or getattr(update, "channel_id", None) or 0
+
+    @staticmethod
+    def get_query_box(query: "raw.core.TLObject") -> Optional[int]:
+        """Get the update box of the pts contained in the result of a query, None if it can't be told."""
+        while isinstance(query, UpdatesSequencer.WRAPPERS):
+            query = query.query
+
+        # channels.* functions name the channel in *channel*, messages.* ones may name a supergroup in *peer*
+        for field in ("channel", "peer"):
+            peer = getattr(query, field, None)
+
+            if peer is None:
+                continue
+
+            channel_id = getattr(peer, "channel_id", None)
+
+            if channel_id is not None:
+                return channel_id
+
+            if isinstance(peer, (
+                raw.types.InputPeerSelf,
+                raw.types.InputPeerUser,
+                raw.types.InputPeerChat,
+                raw.types.InputPeerUserFromMessage
+            )):
+                return 0
+
+            return None
+
+        # Functions taking message ids only, e.g.: messages.DeleteMessages, work on the common box
+        return 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self.counters,
+            "pending": sum(len(i) for i in self.pending.values()),
+            "boxes": len(self.states),
+        }
+
+    def set_state(self, box: int, pts: int):
+        self.states[box] = pts
+
+    def is_duplicate(self, box: int, pts: int, pts_count: int) -> bool:
+        local_pts = self.states.get(box)
+
+        return local_pts is not None and local_pts + pts_count > pts
+
+    def feed(self, box: int, pts: Optional[int], pts_count: Optional[int], packet: Optional[tuple] = None):
+        """Sequence an update.
+
+        Parameters:
+            box (``int``):
+                The update box: 0 for the common one, the raw channel id for channels.
+
+            pts (``int``):
+                The pts of the update. Updates without pts are dispatched right away.
+
+            pts_count (``int``):
+                The number of events the update accounts for.
+
+            packet (``tuple``, *optional*):
+                The (update, users, chats) tuple to dispatch. Pass None to only move the state forward, e.g.: for
+                updates contained in the result of a request made by this client.
+        """
+        if pts is None or pts_count is None:
+            self._dispatch(packet)
+            return
+
+        local_pts = self.states.get(box)
+
+        if local_pts is None or local_pts + pts_count == pts:
+            self._apply(box, pts, packet)
+            self._drain(box)
+        elif local_pts + pts_count > pts:
+            self.counters["duplicates"] += 1
+        else:
+            pending = self.pending.setdefault(box, [])
+            pending.append((pts, pts_count, packet))
+
+            if len(pending) > self.MAX_PENDING:
+                # Too much is being held back already, don't wait any longer
+                task = self.gap_tasks.pop(box, None)
+
+                if task is not None:
+                    task.cancel()
+
+                self.gap_tasks[box] = self.client.loop.create_task(self._resolve_gap(box, 0))
+            elif box not in self.gap_tasks:
+                self.gap_tasks[box] = self.client.loop.create_task(self._resolve_gap(box, self.GAP_TIMEOUT))
+
+    def feed_result(self, query: "raw.core.TLObject", result: "raw.core.TLObject"):
+        """Move the states forward with the updates contained in the result of a request made by this client."""
+        if isinstance(result, raw.types.UpdateShortSentMessage):
+            self.feed(0, result.pts, result.pts_count)
+        elif isinstance(result, (raw.types.Updates, raw.types.UpdatesCombined)):
+            for update in result.updates:
+                pts = getattr(update, "pts", None)
+                pts_count = getattr(update, "pts_count", None)
+
+                if pts is not None and pts_count is not None:
+                    self.feed(self.get_box(update), pts, pts_count)
+        elif isinstance(result, UpdatesSequencer.AFFECTED_RESULTS):
+            # The pts refers to the box of the chat the request was about
+            box = self.get_query_box(query)
+
+            if box is not None:
+                self.feed(box, result.pts, result.pts_count)
+
+    def reset(self):
+        for task in self.gap_tasks.values():
+            task.cancel()
+
+        self.gap_tasks.clear()
+        self.pending.clear()
+        self.states.clear()
+
+    def _dispatch(self, packet: Optional[tuple]):
+        if packet is not None:
+            self.client.dispatcher.updates_queue.put_nowait(packet)
+
+    def _apply(self, box: int, pts: int, packet: Optional[tuple]):
+        self.states[box] = pts
+        self.counters["applied"] += 1
+        self._dispatch(packet)
+
+    def _drain(self, box: int):
+        pending = self.pending.get(box)
+
+        if not pending:
+            return
+
+        pending.sort(key=lambda i: i[0])
+
+        while pending:
+            pts, pts_count, packet = pending[0]
+            expected_pts = self.states[box] + pts_count
+
+            if expected_pts > pts:
+                self.counters["duplicates"] += 1
+            elif expected_pts == pts:
+                self.counters["reordered"] += 1
+                self._apply(box, pts, packet)
+            else:
+                break
+
+            pending.pop(0)
+
+        if not pending:
+            del self.pending[box]
+
+            task = self.gap_tasks.pop(box, None)
+
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+
+    async def _resolve_gap(self, box: int, delay: float, attempt: int = 1):
+        try:
+            await asyncio.sleep(delay)
+
+            if not self.pending.get(box):
+                return
+
+            self.counters["gaps"] += 1
+
+            try:
+                await self._get_difference(box)
+            except (RPCError, OSError, TimeoutError, ValueError, KeyError) as e:
+                log.warning("Unable to get the difference of update box %s: %s", box, e)
+
+            self._drain(box)
+
+            if not self.pending.get(box):
+                return
+
+            # Updates still held back don't follow the state: either they are newer than the difference, and the
+            # gap is asked for again, or they are bogus and must not move the state forward
+            if attempt < self.MAX_GAP_ATTEMPTS:
+                self.gap_tasks[box] = self.client.loop.create_task(
+                    self._resolve_gap(box, self.GAP_TIMEOUT, attempt + 1)
+                )
+            else:
+                dropped = self.pending.pop(box)
+                self.counters["dropped"] += len(dropped)
+                log.warning("Dropping %s updates of update box %s that don't follow its pts", len(dropped), box)
+        finally:
+            if self.gap_tasks.get(box) is asyncio.current_task():
+                del self.gap_tasks[box]
+
+    async def _get_difference(self, box: int):
+        while True:
+            self.counters["differences"] += 1
+
+            if box:
+                diff = await self.client.invoke(
+                    raw.functions.updates.GetChannelDifference(
+                        channel=await self.client.resolve_peer(utils.get_channel_id(box)),
+                        filter=raw.types.ChannelMessagesFilterEmpty(),
+                        pts=self.states[box],
+                        limit=self.CHANNEL_DIFFERENCE_LIMIT,
+                        force=False
+                    )
+                )
+
+                if isinstance(diff, raw.types.updates.ChannelDifferenceEmpty):
+                    self.states[box] = diff.pts
+                    return
+
+                if isinstance(diff, raw.types.updates.ChannelDifferenceTooLong):
+                    self.states[box] = diff.dialog.pts
+                    self._dispatch_difference(box, diff.messages, [], diff.users, diff.chats)
+                    return
+
+                self.states[box] = diff.pts
+                self._dispatch_difference(box, diff.new_messages, diff.other_updates, diff.users, diff.chats)
+
+                if diff.final:
+                    return
+            else:
+                diff = await self.client.invoke(
+                    raw.functions.updates.GetDifference(
+                        pts=self.states[box],
+                        date=self.date,
+                        qts=-1
+                    )
+                )
+
+                if isinstance(diff, raw.types.updates.DifferenceEmpty):
+                    self.date = diff.date
+                    return
+
+                if isinstance(diff, raw.types.updates.DifferenceTooLong):
+                    self.states[box] = diff.pts
+                    return
+
+                state = diff.state if isinstance(diff, raw.types.updates.Difference) else diff.intermediate_state
+
+                self.states[box] = state.pts
+                self.date = state.date
+                self._dispatch_difference(box, diff.new_messages, diff.other_updates, diff.users, diff.chats)
+
+                if isinstance(diff, raw.types.updates.Difference):
+                    return
+
+    def _dispatch_difference(self, box: int, messages: list, other_updates: list, users: list, chats: list):
+        users = {i.id: i for i in users}
+        chats = {i.id: i for i in chats}
+        update_type = raw.types.UpdateNewChannelMessage if box else raw.types.UpdateNewMessage
+
+        for message in messages:
+            self._dispatch((
+                update_type(message=message, pts=self.states[box], pts_count=-1),
+                users,
+                chats
+            ))
+
+        for update in other_updates:
+            self._dispatch((update, users, chats))
@@ -29,7 +29,7 @@ from pyrogram.connection import Connection
 from pyrogram.crypto import aes, rsa, prime
 from pyrogram.errors import SecurityCheckMismatch
 from pyrogram.raw.core import TLObject, Long, Int
-from .internals import MsgId
+from .internals import MsgId, SaltManager
 
 log = logging.getLogger(__name__)
 
@@ -269,6 +269,11 @@ class Auth:
 
                 log.debug(f"Server salt: {int.from_bytes(server_salt, 'little')}")
 
+                # Sessions using the new auth key can start with the right salt instead of having it rejected first
+                SaltManager.get(self.dc_id, self.test_mode, auth_key).set(
+                    int.from_bytes(server_salt, "little", signed=True)
+                )
+
                 log.info(f"Done auth key exchange: {set_client_dh_params_answer.__class__.__name__}")
             except Exception as e:
                 log.info("Retrying due to %s: %s", type(e).__name__, e)
@@ -16,7 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Tuple
+from typing import Dict, Tuple
 
 import os
 
@@ -62,10 +62,16 @@ class DataCenter:
         4: "2001:067c:04e8:f004:0000:0000:0000:000b"
     }
 
+    # Addresses taking precedence over the ones above, keyed by DC id (e.g.: to point clients to a local server)
+    CUSTOM: Dict[int, Tuple[str, int]] = {}
+
     TEST_PORT = int(os.environ.get("PYROGRAM_REPLIT_WNTRAFIK_PORT", 80))
     PROD_PORT = int(os.environ.get("PYROGRAM_REPLIT_NWTRAFIK_PORT", 443))
 
     def __new__(cls, dc_id: int, test_mode: bool, ipv6: bool, media: bool) -> Tuple[str, int]:
+        if dc_id in cls.CUSTOM:
+            return cls.CUSTOM[dc_id]
+
         if test_mode:
             if ipv6:
                 ip = cls.TEST_IPV6[dc_id]
@@ -0,0 +1,123 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from hashlib import sha1
+from typing import Dict, List, Set, Tuple
+
+from pyrogram.raw.core import FutureSalt, FutureSalts
+
+
+class SaltManager:
+    """Server salts of one auth key, shared by every session using that key on the same DC.
+
+    The salt learned from the auth key exchange or from a ``bad_server_salt`` notification is used until future salts
+    are known. Once fetched with ``get_future_salts``, the manager switches to the next salt as soon as it becomes
+    valid, so that requests are not rejected when the server rotates it.
+    """
+
+    # Number of future salts to ask for (the server returns at most 64)
+    FUTURE_SALTS = 32
+    # Ask for more salts when fewer than this many are left to switch to
+    MIN_FUTURE_SALTS = 2
+
+    managers: Dict[Tuple[int, bool, bytes], "SaltManager"] = {}
+
+    def __init__(self, key: Tuple[int, bool, bytes] = None):
+        self.key = key
+        # Started sessions using the salts, the manager is forgotten once the last one stops
+        self.sessions: Set[object] = set()
+
+        self.salt = 0
+        self.future_salts: List[FutureSalt] = []
+        # Difference between the server time and the local time
+        self.time_offset = 0.0
+        self.is_fetching = False
+
+        self.counters = {
+            "bad_salts": 0,
+            "fetches": 0,
+            "switches": 0,
+        }
+
+    @classmethod
+    def get(cls, dc_id: int, test_mode: bool, auth_key: bytes) -> "SaltManager":
+        key = (dc_id, test_mode, sha1(auth_key).digest()[-8:])
+
+        if key not in cls.managers:
+            cls.managers[key] = SaltManager(key)
+
+        return cls.managers[key]
+
+    def attach(self, session) -> "SaltManager":
+        """Register a started session and get the manager it must use.
+
+        A session restarting after being the last one to stop registers its manager again, with the salts it knows.
+        """
+        manager = self.managers.setdefault(self.key, self)
+        manager.sessions.add(session)
+
+        return manager
+
+    def detach(self, session):
+        """Unregister a stopped session and forget the manager if no other session uses it."""
+        self.sessions.discard(session)
+
+        if not self.sessions and self.managers.get(self.key) is self:
+            del self.managers[self.key]
+
+    def server_time(self) -> float:
+        return time.time() + self.time_offset
+
+    def current(self) -> int:
+        """Get the salt to use for the next message."""
+        now = self.server_time()
+
+        # Switch to the latest salt that became valid
+        while self.future_salts and self.future_salts[0].valid_since <= now:
+            future_salt = self.future_salts.pop(0)
+
+            if future_salt.valid_until > now and future_salt.salt != self.salt:
+                self.salt = future_salt.salt
+                self.counters["switches"] += 1
+
+        return self.salt
+
+    def set(self, salt: int):
+        """Use the salt provided by the server, e.g. in a ``bad_server_salt`` notification."""
+        if salt != self.salt:
+            self.salt = salt
+
+            # The known future salts are useless if the server disagrees with them
+            if all(s.salt != salt for s in self.future_salts):
+                self.future_salts.clear()
+
+    def bad_salt(self, salt: int):
+        self.counters["bad_salts"] += 1
+        self.set(salt)
+
+    def add(self, future_salts: FutureSalts):
+        self.time_offset = future_salts.now - time.time()
+        self.future_salts = sorted(future_salts.salts, key=lambda s: s.valid_since)
+        self.counters["fetches"] += 1
+
+        self.current()
+
+    @property
+    def needs_future_salts(self) -> bool:
+        return not self.is_fetching and len(self.future_salts) < self.MIN_FUTURE_SALTS
@@ -33,9 +33,10 @@ from pyrogram.errors import (
     ServiceUnavailable, BadMsgNotification,
     SecurityCheckMismatch,
 )
+from pyrogram.flood import get_peer_key
 from pyrogram.raw.all import layer
 from pyrogram.raw.core import TLObject, MsgContainer, Int, FutureSalts
-from .internals import MsgId, MsgFactory
+from .internals import MsgId, MsgFactory, SaltManager
 
 log = logging.getLogger(__name__)
 
@@ -90,7 +91,7 @@ class Session:
         self.session_id = os.urandom(8)
         self.msg_factory = MsgFactory()
 
-        self.salt = 0
+        self.salt_manager = SaltManager.get(dc_id, test_mode, auth_key)
 
         self.pending_acks = set()
 
@@ -107,8 +108,18 @@ class Session:
 
         self.loop = asyncio.get_event_loop()
 
+    @property
+    def salt(self) -> int:
+        return self.salt_manager.current()
+
+    @salt.setter
+    def salt(self, value: int):
+        self.salt_manager.set(value)
+
     async def start(self):
         while True:
+            self.salt_manager = self.salt_manager.attach(self)
+
             self.connection = Connection(
                 self.dc_id,
                 self.test_mode,
@@ -149,6 +160,9 @@ class Session:
 
                 self.ping_task = self.loop.create_task(self.ping_worker())
 
+                if self.salt_manager.needs_future_salts:
+                    self.loop.create_task(self.fetch_future_salts())
+
                 log.info(f"Session initialized: Layer {layer}")
                 log.info(f"Device: {self.client.device_model} - {self.client.app_version}")
                 log.info(f"System: {self.client.system_version} ({self.client.lang_code.upper()})")
@@ -171,6 +185,8 @@ class Session:
     async def stop(self):
         self.is_connected.clear()
 
+        self.salt_manager.detach(self)
+
         self.ping_task_event.set()
 
         if self.ping_task is not None:
@@ -312,8 +328,28 @@ class Session:
             except (OSError, TimeoutError, RPCError):
                 pass
 
+            if self.salt_manager.needs_future_salts:
+                await self.fetch_future_salts()
+
         log.info("PingTask stopped")
 
+    async def fetch_future_salts(self):
+        salt_manager = self.salt_manager
+
+        if salt_manager.is_fetching:
+            return
+
+        salt_manager.is_fetching = True
+
+        try:
+            salt_manager.add(
+                await self.send(raw.functions.GetFutureSalts(num=SaltManager.FUTURE_SALTS), timeout=self.WAIT_TIMEOUT)
+            )
+        except (OSError, TimeoutError, RPCError) as e:
+            log.info(f"Unable to get future salts: {e!r}")
+        finally:
+            salt_manager.is_fetching = False
+
     async def network_worker(self):
         log.info("NetworkTask started")
 
@@ -384,7 +420,7 @@ class Session:
             elif isinstance(result, raw.types.BadMsgNotification):
                 raise BadMsgNotification(result.error_code)
             elif isinstance(result, raw.types.BadServerSalt):
-                self.salt = result.new_server_salt
+                self.salt_manager.bad_salt(result.new_server_salt)
                 return await self.send(data, wait_response, timeout)
             else:
                 return result
@@ -407,13 +443,19 @@ class Session:
             inner_query = query
 
         query_name = ".".join(inner_query.QUALNAME.split(".")[1:])
+        peer = get_peer_key(inner_query)
+        flood_registry = self.client.flood_registry
 
         while True:
+            await flood_registry.wait(query_name, peer, sleep_threshold, self.client.name)
+
             try:
                 return await self.send(query, timeout=timeout)
             except (FloodWait, FloodPremiumWait) as e:
                 amount = e.value
 
+                flood_registry.add(query_name, peer, amount, type(e))
+
                 if amount > sleep_threshold >= 0:
                     raise
 
@@ -440,5 +482,5 @@ class Session:
 
                 await asyncio.sleep(0.5)
 
-                return await self.invoke(query, retries - 1, timeout)
+                return await self.invoke(query, retries - 1, timeout, sleep_threshold)
         raise TimeoutError("Exceeded maximum number of retries")
@@ -23,6 +23,7 @@ import time
 from typing import List, Tuple, Any
 
 from pyrogram import raw
+from .file_storage import USERNAMES_SCHEMA, UPDATE_STATE_SCHEMA, EXPORT_STATE_SCHEMA
 from .storage import Storage
 from .. import utils
 from pathlib import Path
@@ -65,6 +66,14 @@ CREATE TABLE update_state
     seq  INTEGER
 );
 
+CREATE TABLE export_state
+(
+    id              INTEGER PRIMARY KEY,
+    last_message_id INTEGER,
+    count           INTEGER,
+    date            INTEGER
+);
+
 CREATE TABLE version
 (
     number INTEGER PRIMARY KEY
@@ -84,7 +93,6 @@ BEGIN
 END;
 """
 
-
 def get_input_peer(peer_id: int, access_hash: int, peer_type: str):
     if peer_type in ["user", "bot"]:
         return raw.types.InputPeerUser(
@@ -107,7 +115,7 @@ def get_input_peer(peer_id: int, access_hash: int, peer_type: str):
 
 
 class AioSQLiteStorage(Storage):
-    VERSION = 5
+    VERSION = 6
     USERNAME_TTL = 8 * 60 * 60
 
     def __init__(self, name: str):
@@ -118,29 +126,35 @@ class AioSQLiteStorage(Storage):
     async def update(self):
         version = await self.version()
 
+        # Older releases increased the version by 4 every time the database was opened, past the version 5 they
+        # were at
+        if version > self.VERSION:
+            version = 5
+
         if version == 1:
             await self.conn.execute("DELETE FROM peers")
             await self.conn.commit()
-
-        version += 1
+            version += 1
 
         if version == 2:
             await self.conn.execute("ALTER TABLE sessions ADD api_id INTEGER")
             await self.conn.commit()
-
-        version += 1
+            version += 1
 
         if version == 3:
             await self.conn.executescript(USERNAMES_SCHEMA)
             await self.conn.commit()
-
-        version += 1
+            version += 1
 
         if version == 4:
             await self.conn.executescript(UPDATE_STATE_SCHEMA)
             await self.conn.commit()
+            version += 1
 
-        version += 1
+        if version == 5:
+            await self.conn.executescript(EXPORT_STATE_SCHEMA)
+            await self.conn.commit()
+            version += 1
 
         await self.version(version)
 
@@ -223,6 +237,26 @@ class AioSQLiteStorage(Storage):
             )
             await self.conn.commit()
 
+    async def export_state(self, value: Tuple[int, int, int, int] = object):
+        if value == object:
+            q = await self.conn.execute(
+                "SELECT id, last_message_id, count, date FROM export_state"
+            )
+            return await q.fetchall()
+        else:
+            if isinstance(value, int):
+                await self.conn.execute(
+                    "DELETE FROM export_state WHERE id = ?",
+                    (value,)
+                )
+            else:
+                await self.conn.execute(
+                    "REPLACE INTO export_state (id, last_message_id, count, date)"
+                    "VALUES (?, ?, ?, ?)",
+                    value
+                )
+            await self.conn.commit()
+
     async def get_peer_by_id(self, peer_id: int):
         q = await self.conn.execute(
             "SELECT id, access_hash, type FROM peers WHERE id = ?",
@@ -53,6 +53,16 @@ CREATE TABLE update_state
 );
 """
 
+EXPORT_STATE_SCHEMA = """
+CREATE TABLE export_state
+(
+    id              INTEGER PRIMARY KEY,
+    last_message_id INTEGER,
+    count           INTEGER,
+    date            INTEGER
+);
+"""
+
 
 class FileStorage(SQLiteStorage):
     FILE_EXTENSION = ".session"
@@ -86,6 +96,10 @@ class FileStorage(SQLiteStorage):
         with self.conn:
             self.conn.executescript("CREATE INDEX idx_usernames_id ON usernames (id);")
 
+    def _update_from_six_impl(self):
+        with self.conn:
+            self.conn.executescript(EXPORT_STATE_SCHEMA)
+
     def _connect_impl(self, path):
         self.conn = sqlite3.connect(str(path), timeout=1, check_same_thread=False)
 
@@ -117,6 +131,10 @@ class FileStorage(SQLiteStorage):
             await self.loop.run_in_executor(self.executor, self._update_from_five_impl)
             version += 1
 
+        if version == 6:
+            await self.loop.run_in_executor(self.executor, self._update_from_six_impl)
+            version += 1
+
         await self.version(version)
 
     async def open(self):
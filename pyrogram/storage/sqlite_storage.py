@@ -70,6 +70,14 @@ CREATE TABLE update_state
     seq  INTEGER
 );
 
+CREATE TABLE export_state
+(
+    id              INTEGER PRIMARY KEY,
+    last_message_id INTEGER,
+    count           INTEGER,
+    date            INTEGER
+);
+
 CREATE TABLE version
 (
     number INTEGER PRIMARY KEY
@@ -113,7 +121,7 @@ def get_input_peer(peer_id: int, access_hash: int, peer_type: str):
 
 
 class SQLiteStorage(Storage):
-    VERSION = 6
+    VERSION = 7
     USERNAME_TTL = 8 * 60 * 60
 
     def __init__(self, name: str):
@@ -208,6 +216,28 @@ class SQLiteStorage(Storage):
     async def update_state(self, value: Tuple[int, int, int, int, int] = object):
         return await self.loop.run_in_executor(self.executor, self._update_state_impl, value)
 
+    def _export_state_impl(self, value: Tuple[int, int, int, int] = object):
+        if value == object:
+            return self.conn.execute(
+                "SELECT id, last_message_id, count, date FROM export_state"
+            ).fetchall()
+        else:
+            with self.conn:
+                if isinstance(value, int):
+                    self.conn.execute(
+                        "DELETE FROM export_state WHERE id = ?",
+                        (value,)
+                    )
+                else:
+                    self.conn.execute(
+                        "REPLACE INTO export_state (id, last_message_id, count, date)"
+                        "VALUES (?, ?, ?, ?)",
+                        value
+                    )
+
+    async def export_state(self, value: Tuple[int, int, int, int] = object):
+        return await self.loop.run_in_executor(self.executor, self._export_state_impl, value)
+
     def _get_peer_by_id_impl(self, peer_id: int):
         with self.conn:
             return self.conn.execute(
@@ -97,6 +97,22 @@ class Storage(ABC):
         """
         raise NotImplementedError
 
+    async def export_state(self, value: Tuple[int, int, int, int] = object):
+        """Get or set the progress of the chats exported with :meth:`~pyrogram.Client.export_chats`.
+
+        Storage engines that don't implement this method can't be used to resume exports.
+
+        Parameters:
+            value (``Tuple[int, int, int, int]`` | ``int``): A tuple containing the progress of a chat to set, or the
+                id of a chat to delete its progress.
+                Tuple must contain the following information:
+                - ``int``: The id of the chat.
+                - ``int``: The id of the last exported message.
+                - ``int``: The number of exported messages.
+                - ``int``: The date of the last checkpoint.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_peer_by_id(self, peer_id: int):
         """Retrieve a peer by its ID.
@@ -54,6 +54,12 @@ class InlineKeyboardMarkup(Object):
         )
 
     async def write(self, client: "pyrogram.Client"):
+        if client.markup_cache is not None:
+            cached = client.markup_cache.get(id(self))
+
+            if cached is not None:
+                return cached[1]
+
         rows = []
 
         for r in self.inline_keyboard:
@@ -64,7 +70,12 @@ class InlineKeyboardMarkup(Object):
 
             rows.append(raw.types.KeyboardButtonRow(buttons=buttons))
 
-        return raw.types.ReplyInlineMarkup(rows=rows)
+        markup = raw.types.ReplyInlineMarkup(rows=rows)
+
+        if client.markup_cache is not None:
+            client.markup_cache[id(self)] = (self, markup)
+
+        return markup
 
         # There seems to be a Python issues with nested async comprehensions.
         # See: https://bugs.python.org/issue33346
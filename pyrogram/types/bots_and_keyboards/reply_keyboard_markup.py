@@ -110,8 +110,14 @@ class ReplyKeyboardMarkup(Object):
             input_field_placeholder=kb.placeholder
         )
 
-    async def write(self, _: "pyrogram.Client"):
-        return raw.types.ReplyKeyboardMarkup(
+    async def write(self, client: "pyrogram.Client"):
+        if client.markup_cache is not None:
+            cached = client.markup_cache.get(id(self))
+
+            if cached is not None:
+                return cached[1]
+
+        markup = raw.types.ReplyKeyboardMarkup(
             rows=[raw.types.KeyboardButtonRow(
                 buttons=[
                     types.KeyboardButton(j).write()
@@ -125,3 +131,8 @@ class ReplyKeyboardMarkup(Object):
             persistent=self.is_persistent or None,
             placeholder=self.input_field_placeholder or None
         )
+
+        if client.markup_cache is not None:
+            client.markup_cache[id(self)] = (self, markup)
+
+        return markup
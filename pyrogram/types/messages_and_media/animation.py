@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, ThumbnailSource, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Animation(Object):
@@ -62,6 +62,9 @@ class Animation(Object):
             Animation thumbnails.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -98,17 +101,19 @@ class Animation(Object):
         file_name: str
     ) -> "Animation":
         return Animation(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.ANIMATION,
                 dc_id=animation.dc_id,
                 media_id=animation.id,
                 access_hash=animation.access_hash,
                 file_reference=animation.file_reference
-            ).encode(),
-            file_unique_id=FileUniqueId(
+            ),
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=animation.id
-            ).encode(),
+            ),
             width=getattr(video_attributes, "w", 0),
             height=getattr(video_attributes, "h", 0),
             duration=getattr(video_attributes, "duration", 0),
@@ -136,7 +141,8 @@ class Animation(Object):
             video_sizes.sort(key=lambda p: p.size)
             video_size = video_sizes[-1]
             return Animation(
-                file_id=FileId(
+                file_id=Lazy(
+                    encode_file_id,
                     file_type=FileType.PHOTO,
                     dc_id=video.dc_id,
                     media_id=video.id,
@@ -147,11 +153,12 @@ class Animation(Object):
                     thumbnail_size=video_size.type,
                     volume_id=0,
                     local_id=0
-                ).encode() if video else None,
-                file_unique_id=FileUniqueId(
+                ) if video else None,
+                file_unique_id=Lazy(
+                    encode_file_unique_id,
                     file_unique_type=FileUniqueType.DOCUMENT,
                     media_id=video.id
-                ).encode() if video else None,
+                ) if video else None,
                 width=video_size.w,
                 height=video_size.h,
                 file_size=video_size.size,
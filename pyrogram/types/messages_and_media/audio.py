@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Audio(Object):
@@ -62,6 +62,9 @@ class Audio(Object):
             Thumbnails of the music file album cover.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -98,17 +101,19 @@ class Audio(Object):
         file_name: str
     ) -> "Audio":
         return Audio(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.AUDIO,
                 dc_id=audio.dc_id,
                 media_id=audio.id,
                 access_hash=audio.access_hash,
                 file_reference=audio.file_reference
-            ).encode(),
-            file_unique_id=FileUniqueId(
+            ),
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=audio.id
-            ).encode(),
+            ),
             duration=audio_attributes.duration,
             performer=audio_attributes.performer,
             title=audio_attributes.title,
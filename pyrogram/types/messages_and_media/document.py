@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Document(Object):
@@ -53,6 +53,9 @@ class Document(Object):
             Document thumbnails as defined by sender.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -78,17 +81,19 @@ class Document(Object):
     @staticmethod
     def _parse(client, document: "raw.types.Document", file_name: str) -> "Document":
         return Document(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.DOCUMENT,
                 dc_id=document.dc_id,
                 media_id=document.id,
                 access_hash=document.access_hash,
                 file_reference=document.file_reference
-            ).encode(),
-            file_unique_id=FileUniqueId(
+            ),
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=document.id
-            ).encode(),
+            ),
             file_name=file_name,
             mime_type=document.mime_type,
             file_size=document.size,
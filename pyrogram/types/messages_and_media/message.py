@@ -421,6 +421,27 @@ class Message(Object, Update):
 
     # TODO: Add game missing field.
 
+    __slots__ = (
+        "id", "from_user", "sender_chat", "date", "chat", "forward_origin", "reply_to_message_id", "message_thread_id",
+        "reply_to_message", "mentioned", "empty", "service", "scheduled", "from_scheduled", "media", "edit_date",
+        "media_group_id", "author_signature", "has_protected_content", "is_from_offline", "has_media_spoiler", "text",
+        "entities", "caption_entities", "show_caption_above_media", "audio", "document", "photo", "sticker",
+        "animation", "game", "video", "alternative_videos", "voice", "video_note", "caption", "contact", "location",
+        "venue", "web_page", "poll", "dice", "new_chat_members", "left_chat_member", "new_chat_title", "new_chat_photo",
+        "delete_chat_photo", "group_chat_created", "supergroup_chat_created", "channel_chat_created",
+        "message_auto_delete_timer_changed", "migrate_to_chat_id", "migrate_from_chat_id", "pinned_message", "invoice",
+        "game_high_score", "views", "forwards", "via_bot", "outgoing", "matches", "command", "reply_markup",
+        "video_chat_scheduled", "video_chat_started", "video_chat_ended", "video_chat_participants_invited",
+        "web_app_data", "reactions", "link_preview_options", "effect_id", "external_reply", "is_topic_message",
+        "is_automatic_forward", "sender_boost_count", "boost_added", "quote", "story", "reply_to_story", "giveaway",
+        "giveaway_created", "users_shared", "chat_shared", "connected_website", "write_access_allowed",
+        "giveaway_completed", "giveaway_winners", "gift_code", "gifted_premium", "gifted_stars", "forum_topic_created",
+        "forum_topic_edited", "forum_topic_closed", "forum_topic_reopened", "general_forum_topic_hidden",
+        "general_forum_topic_unhidden", "custom_action", "sender_business_bot", "business_connection_id", "user_gift",
+        "successful_payment", "paid_media", "refunded_payment", "contact_registered", "chat_join_type",
+        "screenshot_taken", "_raw",
+    )
+
     def __init__(
         self,
         *,
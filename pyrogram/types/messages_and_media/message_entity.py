@@ -52,6 +52,10 @@ class MessageEntity(Object):
             Use :meth:`~pyrogram.Client.get_custom_emoji_stickers` to get full information about the sticker.
     """
 
+    __slots__ = (
+        "type", "offset", "length", "url", "user", "language", "custom_emoji_id",
+    )
+
     def __init__(
         self,
         *,
@@ -103,21 +107,17 @@ class MessageEntity(Object):
         )
 
     async def write(self):
-        args = self.__dict__.copy()
-
-        for arg in ("_client", "type", "user"):
-            args.pop(arg)
+        args = dict(offset=self.offset, length=self.length)
 
         if self.user:
             args["user_id"] = await self._client.resolve_peer(self.user.id)
 
-        if not self.url:
-            args.pop("url")
+        if self.url:
+            args["url"] = self.url
 
-        if self.language is None:
-            args.pop("language")
+        if self.language is not None:
+            args["language"] = self.language
 
-        args.pop("custom_emoji_id")
         if self.custom_emoji_id is not None:
             args["document_id"] = self.custom_emoji_id
 
@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, ThumbnailSource, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Photo(Object):
@@ -56,6 +56,9 @@ class Photo(Object):
             Available thumbnails of this photo.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -111,7 +114,8 @@ class Photo(Object):
             main = photos[-1]
 
             return Photo(
-                file_id=FileId(
+                file_id=Lazy(
+                    encode_file_id,
                     file_type=FileType.PHOTO,
                     dc_id=photo.dc_id,
                     media_id=photo.id,
@@ -122,11 +126,12 @@ class Photo(Object):
                     thumbnail_size=main.type,
                     volume_id=0,
                     local_id=0
-                ).encode(),
-                file_unique_id=FileUniqueId(
+                ),
+                file_unique_id=Lazy(
+                    encode_file_unique_id,
                     file_unique_type=FileUniqueType.DOCUMENT,
                     media_id=photo.id
-                ).encode(),
+                ),
                 width=main.w,
                 height=main.h,
                 file_size=main.size,
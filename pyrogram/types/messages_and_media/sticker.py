@@ -23,8 +23,8 @@ import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
 from pyrogram.errors import StickersetInvalid
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Sticker(Object):
@@ -74,6 +74,9 @@ class Sticker(Object):
 
     # TODO: Add mask position
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -170,17 +173,19 @@ class Sticker(Object):
             set_name = None
 
         return Sticker(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.STICKER,
                 dc_id=sticker.dc_id,
                 media_id=sticker.id,
                 access_hash=sticker.access_hash,
                 file_reference=sticker.file_reference
-            ).encode(),
-            file_unique_id=FileUniqueId(
+            ),
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=sticker.id
-            ).encode(),
+            ),
             width=(
                 image_size_attributes.w
                 if image_size_attributes
@@ -20,8 +20,8 @@ from typing import List, Optional, Union
 
 import pyrogram
 from pyrogram import raw
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, ThumbnailSource, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Thumbnail(Object):
@@ -45,6 +45,9 @@ class Thumbnail(Object):
             File size.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -85,7 +88,8 @@ class Thumbnail(Object):
 
             parsed_thumbs.append(
                 Thumbnail(
-                    file_id=FileId(
+                    file_id=Lazy(
+                        encode_file_id,
                         file_type=file_type,
                         dc_id=media.dc_id,
                         media_id=media.id,
@@ -96,11 +100,12 @@ class Thumbnail(Object):
                         thumbnail_size=thumb.type,
                         volume_id=0,
                         local_id=0
-                    ).encode(),
-                    file_unique_id=FileUniqueId(
+                    ),
+                    file_unique_id=Lazy(
+                        encode_file_unique_id,
                         file_unique_type=FileUniqueType.DOCUMENT,
                         media_id=media.id
-                    ).encode(),
+                    ),
                     width=thumb.w,
                     height=thumb.h,
                     file_size=thumb.size,
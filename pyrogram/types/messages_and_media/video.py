@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, ThumbnailSource, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Video(Object):
@@ -68,6 +68,9 @@ class Video(Object):
             Video thumbnails.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -109,17 +112,19 @@ class Video(Object):
         ttl_seconds: int = None
     ) -> "Video":
         return Video(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.VIDEO,
                 dc_id=video.dc_id,
                 media_id=video.id,
                 access_hash=video.access_hash,
                 file_reference=video.file_reference
-            ).encode() if video else None,
-            file_unique_id=FileUniqueId(
+            ) if video else None,
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=video.id
-            ).encode() if video else None,
+            ) if video else None,
             width=video_attributes.w if video_attributes else None,
             height=video_attributes.h if video_attributes else None,
             duration=video_attributes.duration if video_attributes else None,
@@ -22,8 +22,8 @@ from typing import List
 import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class VideoNote(Object):
@@ -59,6 +59,9 @@ class VideoNote(Object):
             Video thumbnails.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -93,17 +96,19 @@ class VideoNote(Object):
         ttl_seconds: int = None
     ) -> "VideoNote":
         return VideoNote(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.VIDEO_NOTE,
                 dc_id=video_note.dc_id,
                 media_id=video_note.id,
                 access_hash=video_note.access_hash,
                 file_reference=video_note.file_reference
-            ).encode() if video_note else None,
-            file_unique_id=FileUniqueId(
+            ) if video_note else None,
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=video_note.id
-            ).encode() if video_note else None,
+            ) if video_note else None,
             length=video_attributes.w if video_attributes else None,
             duration=video_attributes.duration if video_attributes else None,
             file_size=video_note.size if video_note else None,
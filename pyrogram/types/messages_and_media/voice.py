@@ -20,8 +20,8 @@ from datetime import datetime
 
 import pyrogram
 from pyrogram import raw, utils
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class Voice(Object):
@@ -54,6 +54,9 @@ class Voice(Object):
             Time-to-live seconds, for one-time media.
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -81,17 +84,19 @@ class Voice(Object):
     @staticmethod
     def _parse(client, voice: "raw.types.Document", attributes: "raw.types.DocumentAttributeAudio", ttl_seconds: int = None) -> "Voice":
         return Voice(
-            file_id=FileId(
+            file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.VOICE,
                 dc_id=voice.dc_id,
                 media_id=voice.id,
                 access_hash=voice.access_hash,
                 file_reference=voice.file_reference
-            ).encode() if voice else None,
-            file_unique_id=FileUniqueId(
+            ) if voice else None,
+            file_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=voice.id
-            ).encode() if voice else None,
+            ) if voice else None,
             duration=attributes.duration if attributes else None,
             mime_type=voice.mime_type if voice else None,
             file_size=voice.size if voice else None,
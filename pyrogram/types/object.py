@@ -19,12 +19,71 @@
 import typing
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from json import dumps
+from typing import Iterator, Tuple
 
 import pyrogram
 
 
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    # Slots declared along the MRO, base classes first, so that attributes keep their definition order
+    return tuple(
+        slot
+        for klass in reversed(cls.__mro__)
+        for slot in klass.__dict__.get("__slots__", ())
+        if slot not in ("__dict__", "__weakref__")
+    )
+
+
+class Lazy:
+    """A value computed by calling *function* with *kwargs*, the first time the :class:`LazyAttribute` it was
+    assigned to is read."""
+
+    __slots__ = ("function", "kwargs")
+
+    def __init__(self, function: typing.Callable, **kwargs):
+        self.function = function
+        self.kwargs = kwargs
+
+    def __call__(self):
+        return self.function(**self.kwargs)
+
+
+class LazyAttribute:
+    """An attribute that can be assigned a :class:`Lazy` value, computed and stored in its place on first access.
+
+    Values are kept in the instance dict under the attribute name, so the attribute is still listed, printed, compared
+    and pickled like the others.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: "Object", owner: type = None):
+        if instance is None:
+            return self
+
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"'{type(instance).__name__}' object has no attribute '{self.name}'") from None
+
+        if type(value) is Lazy:
+            value = instance.__dict__[self.name] = value()
+
+        return value
+
+    def __set__(self, instance: "Object", value):
+        instance.__dict__[self.name] = value
+
+
 class Object:
+    # High-volume types (Message, User, Chat, ...) declare their own __slots__ so that their fields don't need a
+    # per-instance dict. The __dict__ slot is kept so that arbitrary attributes can still be attached at runtime.
+    __slots__ = ("_client", "__dict__")
+
     def __init__(self, client: "pyrogram.Client" = None):
         self._client = client
 
@@ -38,12 +97,20 @@ class Object:
         """
         self._client = client
 
-        for i in self.__dict__:
+        for i in self._attributes():
             o = getattr(self, i)
 
             if isinstance(o, Object):
                 o.bind(client)
 
+    def _attributes(self) -> Iterator[str]:
+        """Iterate over the names of the attributes currently set, either as slots or in the instance dict."""
+        for attr in _slot_names(type(self)):
+            if hasattr(self, attr):
+                yield attr
+
+        yield from self.__dict__
+
     @staticmethod
     def default(obj: "Object"):
         if isinstance(obj, bytes):
@@ -60,8 +127,12 @@ class Object:
         if isinstance(obj, datetime):
             return str(obj)
 
-        # TODO: #20
-        if not hasattr(obj, "__dict__"):
+        if isinstance(obj, Object):
+            attrs = list(obj._attributes())
+        elif hasattr(obj, "__dict__"):
+            attrs = obj.__dict__
+        else:
+            # TODO: #20
             return obj.__class__.__name__
 
         return {
@@ -71,7 +142,7 @@ class Object:
                     "*" * 9 if attr == "phone_number" else
                     getattr(obj, attr)
                 )
-                for attr in filter(lambda x: not x.startswith("_"), obj.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), attrs)
                 if getattr(obj, attr) is not None
             }
         }
@@ -84,13 +155,13 @@ class Object:
             self.__class__.__name__,
             ", ".join(
                 f"{attr}={repr(getattr(self, attr))}"
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), self._attributes())
                 if getattr(self, attr) is not None
             )
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in self._attributes():
             try:
                 if attr.startswith("_"):
                     continue
@@ -110,10 +181,11 @@ class Object:
             if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "dt":
                 state[attr] = datetime.fromtimestamp(obj[1])
 
-        self.__dict__ = state
+        for attr, value in state.items():
+            setattr(self, attr, value)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
+        state = {attr: getattr(self, attr) for attr in self._attributes()}
         state.pop("_client", None)
 
         for attr in state:
@@ -226,6 +226,19 @@ class Chat(Object):
 
     """
 
+    __slots__ = (
+        "id", "type", "is_verified", "is_restricted", "is_creator", "is_scam", "is_fake", "is_support", "title",
+        "username", "first_name", "last_name", "photo", "bio", "description", "dc_id", "has_protected_content",
+        "invite_link", "pinned_message", "sticker_set_name", "custom_emoji_sticker_set_name", "can_set_sticker_set",
+        "members", "members_count", "restrictions", "permissions", "distance", "linked_chat", "send_as_chat",
+        "available_reactions", "accent_color", "profile_color", "emoji_status", "background", "has_visible_history",
+        "has_hidden_members", "has_aggressive_anti_spam_enabled", "message_auto_delete_time", "slow_mode_delay",
+        "slowmode_next_send_date", "is_forum", "unrestrict_boost_count", "is_public", "is_banned", "banned_until_date",
+        "join_by_request", "is_peak_preview", "personal_chat", "personal_chat_message", "birthdate", "business_intro",
+        "business_location", "business_opening_hours", "active_usernames", "max_reaction_count", "can_send_paid_media",
+        "pending_join_request_count", "can_enable_paid_reaction", "_raw",
+    )
+
     def __init__(
         self,
         *,
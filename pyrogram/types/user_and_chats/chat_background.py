@@ -23,13 +23,13 @@ import pyrogram
 from pyrogram import raw, utils
 from pyrogram import types
 from pyrogram.file_id import (
-    FileId,
     FileType,
-    FileUniqueId,
     FileUniqueType,
     ThumbnailSource,
+    encode_file_id,
+    encode_file_unique_id,
 )
-from ..object import Object
+from ..object import Object, Lazy, LazyAttribute
 
 
 class ChatBackground(Object):
@@ -60,6 +60,9 @@ class ChatBackground(Object):
 
     """
 
+    file_id = LazyAttribute()
+    file_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -98,7 +101,8 @@ class ChatBackground(Object):
             )
         if isinstance(wallpaper, raw.types.WallPaper):
             return ChatBackground(
-                file_id=FileId(
+                file_id=Lazy(
+                    encode_file_id,
                     dc_id=wallpaper.document.dc_id,
                     file_reference=wallpaper.document.file_reference,
                     access_hash=wallpaper.document.access_hash,
@@ -108,10 +112,11 @@ class ChatBackground(Object):
                     local_id=0,
                     thumbnail_source=ThumbnailSource.THUMBNAIL,
                     thumbnail_file_type=FileType.BACKGROUND,
-                ).encode(),
-                file_unique_id=FileUniqueId(
+                ),
+                file_unique_id=Lazy(
+                    encode_file_unique_id,
                     file_unique_type=FileUniqueType.DOCUMENT, media_id=wallpaper.document.id
-                ).encode(),
+                ),
                 file_size=wallpaper.document.size,
                 slug=wallpaper.slug,
                 date=utils.timestamp_to_datetime(wallpaper.document.date),
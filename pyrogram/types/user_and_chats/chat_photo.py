@@ -20,8 +20,8 @@ from typing import Union
 
 import pyrogram
 from pyrogram import raw, types
-from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType, ThumbnailSource
-from ..object import Object
+from pyrogram.file_id import FileType, FileUniqueType, ThumbnailSource, encode_file_id, encode_file_unique_id
+from ..object import Object, Lazy, LazyAttribute
 
 
 class ChatPhoto(Object):
@@ -55,6 +55,11 @@ class ChatPhoto(Object):
 
     """
 
+    small_file_id = LazyAttribute()
+    small_photo_unique_id = LazyAttribute()
+    big_file_id = LazyAttribute()
+    big_photo_unique_id = LazyAttribute()
+
     def __init__(
         self,
         *,
@@ -88,7 +93,8 @@ class ChatPhoto(Object):
             return None
 
         return ChatPhoto(
-            small_file_id=FileId(
+            small_file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.CHAT_PHOTO,
                 dc_id=chat_photo.dc_id,
                 media_id=chat_photo.photo_id,
@@ -98,12 +104,14 @@ class ChatPhoto(Object):
                 local_id=0,
                 chat_id=peer_id,
                 chat_access_hash=peer_access_hash
-            ).encode(),
-            small_photo_unique_id=FileUniqueId(
+            ),
+            small_photo_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=chat_photo.photo_id
-            ).encode(),
-            big_file_id=FileId(
+            ),
+            big_file_id=Lazy(
+                encode_file_id,
                 file_type=FileType.CHAT_PHOTO,
                 dc_id=chat_photo.dc_id,
                 media_id=chat_photo.photo_id,
@@ -113,11 +121,12 @@ class ChatPhoto(Object):
                 local_id=0,
                 chat_id=peer_id,
                 chat_access_hash=peer_access_hash
-            ).encode(),
-            big_photo_unique_id=FileUniqueId(
+            ),
+            big_photo_unique_id=Lazy(
+                encode_file_unique_id,
                 file_unique_type=FileUniqueType.DOCUMENT,
                 media_id=chat_photo.photo_id
-            ).encode(),
+            ),
             has_animation=chat_photo.has_video,
             is_personal=getattr(chat_photo, "personal", False),
             minithumbnail=types.StrippedThumbnail(
@@ -200,6 +200,16 @@ class User(Object, Update):
 
     """
 
+    __slots__ = (
+        "id", "is_self", "is_contact", "is_mutual_contact", "is_deleted", "is_bot", "is_verified", "is_restricted",
+        "is_scam", "is_fake", "is_support", "is_premium", "first_name", "last_name", "status", "last_online_date",
+        "next_offline_date", "username", "language_code", "emoji_status", "dc_id", "phone_number", "photo",
+        "restrictions", "added_to_attachment_menu", "can_be_added_to_attachment_menu", "can_join_groups",
+        "can_read_all_group_messages", "supports_inline_queries", "restricts_new_chats", "inline_need_location",
+        "can_be_edited", "can_connect_to_business", "inline_query_placeholder", "active_usernames", "is_close_friend",
+        "accent_color", "profile_color", "have_access", "has_main_web_app", "active_user_count", "_raw",
+    )
+
     def __init__(
         self,
         *,
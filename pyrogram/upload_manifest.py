@@ -0,0 +1,149 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import time
+from hashlib import sha256
+from pathlib import Path
+from typing import BinaryIO, Optional, Set
+
+log = logging.getLogger(__name__)
+
+
+# Blocks read across the file, besides its first and last part, and their size
+FINGERPRINT_SAMPLES = 16
+FINGERPRINT_SAMPLE_SIZE = 4096
+
+
+def get_fingerprint(fp: BinaryIO, file_size: int, part_size: int) -> str:
+    """Identify a file by its size, name, modification time and inode when it is on disk, first and last part and a
+    few blocks spread over it, without reading it all."""
+    digest = sha256(f"{file_size}:{part_size}:{os.path.basename(getattr(fp, 'name', ''))}".encode())
+
+    try:
+        stat = os.fstat(fp.fileno())
+    except (AttributeError, OSError, ValueError):
+        # In-memory files have no file descriptor
+        pass
+    else:
+        digest.update(f":{stat.st_mtime_ns}:{stat.st_ino}".encode())
+
+    fp.seek(0)
+    digest.update(fp.read(part_size))
+
+    for i in range(1, FINGERPRINT_SAMPLES + 1):
+        fp.seek(file_size * i // (FINGERPRINT_SAMPLES + 1))
+        digest.update(fp.read(FINGERPRINT_SAMPLE_SIZE))
+
+    fp.seek(max(0, file_size - part_size))
+    digest.update(fp.read(part_size))
+
+    fp.seek(0)
+
+    return digest.hexdigest()
+
+
+class UploadManifest:
+    """Progress of a resumable upload, persisted as a JSON file so that it survives process restarts.
+
+    Telegram keeps uploaded parts for a limited time only, so manifests older than :attr:`MAX_AGE` seconds are not
+    resumed.
+    """
+
+    MAX_AGE = 12 * 60 * 60
+    SAVE_INTERVAL = 1
+
+    def __init__(self, path: Path, fingerprint: str, file_id: int, total_parts: int, is_big: bool):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.file_id = file_id
+        self.total_parts = total_parts
+        self.is_big = is_big
+        self.parts: Set[int] = set()
+        self.date = time.time()
+
+        self.last_save = 0.0
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str, total_parts: int, is_big: bool) -> Optional["UploadManifest"]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            data.get("fingerprint") != fingerprint
+            or data.get("total_parts") != total_parts
+            or data.get("is_big") != is_big
+            or time.time() - data.get("date", 0) > cls.MAX_AGE
+        ):
+            return None
+
+        manifest = cls(path, fingerprint, data["file_id"], total_parts, is_big)
+        manifest.parts = set(data["parts"])
+        manifest.date = data["date"]
+
+        return manifest
+
+    @classmethod
+    def open(cls, directory: Path, fingerprint: str, file_id: int, total_parts: int, is_big: bool) -> "UploadManifest":
+        """Resume the upload of a file if a valid manifest exists, otherwise start a new one with the given file_id."""
+        path = directory / f"{fingerprint}.json"
+        manifest = cls.load(path, fingerprint, total_parts, is_big)
+
+        if manifest is not None:
+            log.info(f"Resuming upload {manifest.file_id}: {len(manifest.parts)}/{total_parts} parts already sent")
+            return manifest
+
+        return cls(path, fingerprint, file_id, total_parts, is_big)
+
+    def add(self, part: int):
+        self.parts.add(part)
+
+        if time.monotonic() - self.last_save >= self.SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        self.last_save = time.monotonic()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "fingerprint": self.fingerprint,
+                    "file_id": self.file_id,
+                    "total_parts": self.total_parts,
+                    "is_big": self.is_big,
+                    "date": self.date,
+                    "parts": sorted(self.parts),
+                }, f)
+
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning(f"Unable to save the upload manifest: {e}")
+
+    def delete(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,96 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import io
+import mmap
+import threading
+from hashlib import md5
+from typing import BinaryIO, Optional, Union
+
+
+class UploadReader:
+    """Read the parts of a file being uploaded without blocking the event loop.
+
+    Files on disk are memory-mapped and in-memory files expose their buffer, so that parts are handed out as
+    ``memoryview`` slices that are only copied once, when the request is serialized in the crypto executor. Other
+    file-like objects are read in a thread.
+
+    Parameters:
+        fp (``BinaryIO``):
+            The file to read.
+
+        file_size (``int``):
+            The size of the file.
+    """
+
+    def __init__(self, fp: BinaryIO, file_size: int):
+        self.fp = fp
+        self.file_size = file_size
+        self.lock = threading.Lock()
+
+        self.mmap: Optional[mmap.mmap] = None
+        self.view: Optional[memoryview] = None
+
+        if isinstance(fp, io.BytesIO):
+            self.view = fp.getbuffer()
+        else:
+            try:
+                self.mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                pass
+            else:
+                self.view = memoryview(self.mmap)
+
+    def read_sync(self, offset: int, size: int) -> Union[bytes, memoryview]:
+        if self.view is not None:
+            return self.view[offset:offset + size]
+
+        with self.lock:
+            self.fp.seek(offset)
+            return self.fp.read(size)
+
+    async def read(self, offset: int, size: int) -> Union[bytes, memoryview]:
+        """Get *size* bytes starting at *offset*."""
+        if self.view is not None:
+            return self.view[offset:offset + size]
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.read_sync, offset, size)
+
+    def md5(self, part_size: int) -> str:
+        """Compute the MD5 checksum of the whole file. Blocking, meant to be run in an executor."""
+        if self.view is not None:
+            return md5(self.view).hexdigest()
+
+        digest = md5()
+
+        for offset in range(0, self.file_size, part_size):
+            digest.update(self.read_sync(offset, part_size))
+
+        return digest.hexdigest()
+
+    def close(self):
+        # Parts still referenced somewhere keep the buffer exported; it is then released when they are collected
+        try:
+            if self.view is not None:
+                self.view.release()
+
+            if self.mmap is not None:
+                self.mmap.close()
+        except BufferError:
+            pass
@@ -26,12 +26,12 @@ import struct
 from concurrent.futures.thread import ThreadPoolExecutor
 from datetime import datetime, timezone
 from getpass import getpass
-from typing import Union, List, Dict, Optional
+from typing import Union, List, Dict, Optional, Iterator, Tuple
 
 import pyrogram
 from pyrogram import raw, enums
 from pyrogram import types
-from pyrogram.file_id import FileId, FileType, PHOTO_TYPES, DOCUMENT_TYPES
+from pyrogram.file_id import FileId, FileType, ThumbnailSource, PHOTO_TYPES, DOCUMENT_TYPES
 
 
 async def ainput(prompt: str = "", *, hide: bool = False):
@@ -88,6 +88,79 @@ def get_input_media_from_file_id(
     raise ValueError(f"Unknown file id: {file_id}")
 
 
+def get_input_file_location(file_id: FileId) -> "raw.base.InputFileLocation":
+    file_type = file_id.file_type
+
+    if file_type == FileType.CHAT_PHOTO:
+        if file_id.chat_id > 0:
+            peer = raw.types.InputPeerUser(
+                user_id=file_id.chat_id,
+                access_hash=file_id.chat_access_hash
+            )
+        else:
+            if file_id.chat_access_hash == 0:
+                peer = raw.types.InputPeerChat(
+                    chat_id=-file_id.chat_id
+                )
+            else:
+                peer = raw.types.InputPeerChannel(
+                    channel_id=get_channel_id(file_id.chat_id),
+                    access_hash=file_id.chat_access_hash
+                )
+
+        return raw.types.InputPeerPhotoFileLocation(
+            peer=peer,
+            photo_id=file_id.media_id,
+            big=file_id.thumbnail_source == ThumbnailSource.CHAT_PHOTO_BIG
+        )
+
+    if file_type == FileType.PHOTO:
+        return raw.types.InputPhotoFileLocation(
+            id=file_id.media_id,
+            access_hash=file_id.access_hash,
+            file_reference=file_id.file_reference,
+            thumb_size=file_id.thumbnail_size
+        )
+
+    return raw.types.InputDocumentFileLocation(
+        id=file_id.media_id,
+        access_hash=file_id.access_hash,
+        file_reference=file_id.file_reference,
+        thumb_size=file_id.thumbnail_size
+    )
+
+
+FILE_PART_ALIGNMENT = 4 * 1024
+FILE_PART_MAX_SIZE = 1024 * 1024
+
+
+def get_file_range_parts(start: int, end: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """Split the bytes range [start, end) into (offset, limit) pairs valid for upload.GetFile.
+
+    Offsets are multiples of 4 KiB, limits are powers of two between 4 KiB and 1 MiB that divide the offset, so
+    that no part crosses a 1 MiB boundary. Each part is the largest one allowed at its offset that doesn't run past
+    the end, except for the remainder, which is fetched with the smallest single part covering it whenever the
+    offset allows one. Without an end, parts keep coming until the caller stops asking.
+    """
+    offset = start - start % FILE_PART_ALIGNMENT
+
+    while end is None or offset < end:
+        limit = FILE_PART_MAX_SIZE
+
+        while offset % limit:
+            limit //= 2
+
+        if end is not None:
+            remaining = end - offset
+
+            while limit // 2 >= remaining and limit > FILE_PART_ALIGNMENT:
+                limit //= 2
+
+        yield offset, limit
+
+        offset += limit
+
+
 async def parse_messages(
     client,
     messages: "raw.types.messages.Messages",
@@ -291,6 +364,44 @@ def get_channel_id(peer_id: int) -> int:
     return MAX_CHANNEL_ID - peer_id
 
 
+async def resolve_peers(client: "pyrogram.Client", peer_ids: List[Union[int, str]]) -> list:
+    """Resolve many peer ids concurrently, in the given order.
+
+    Users and basic groups missing from the storage don't need an access hash, so they are turned into input peers
+    right away and fetched by the batched request they're used in, instead of by one request each in resolve_peer.
+    """
+    async def resolve(peer_id: Union[int, str]):
+        if isinstance(peer_id, int):
+            try:
+                return await client.storage.get_peer_by_id(peer_id)
+            except KeyError:
+                peer_type = get_peer_type(peer_id)
+
+                if peer_type == "user":
+                    return raw.types.InputPeerUser(user_id=peer_id, access_hash=0)
+
+                if peer_type == "chat":
+                    return raw.types.InputPeerChat(chat_id=-peer_id)
+
+        return await client.resolve_peer(peer_id)
+
+    return await asyncio.gather(*[resolve(i) for i in peer_ids])
+
+
+async def gather_chunks(function, items: list, size: int, concurrency: int = 4) -> list:
+    """Call an async function with the items split in chunks of the given size, running up to *concurrency* calls at
+    a time. The lists returned by the calls are joined in the order of the chunks."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(chunk: list) -> list:
+        async with semaphore:
+            return await function(chunk)
+
+    results = await asyncio.gather(*[call(items[i:i + size]) for i in range(0, len(items), size)])
+
+    return [item for result in results for item in result]
+
+
 def btoi(b: bytes) -> int:
     return int.from_bytes(b, "big")
 
@@ -434,6 +545,14 @@ async def parse_deleted_messages(client, update, users, chats) -> List["types.Me
                     client, chats[chat_id]
                 )
 
+    if delete_chat is not None:
+        client.message_cache.invalidate(delete_chat.id, messages)
+    else:
+        # Message ids are shared by all private chats and basic groups, so any of them may hold the deleted messages
+        for chat_id in list(client.message_cache.groups):
+            if isinstance(chat_id, int) and chat_id >= MIN_CHAT_ID:
+                client.message_cache.invalidate(chat_id, messages)
+
     parsed_messages = []
 
     for message in messages:
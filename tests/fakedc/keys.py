@@ -0,0 +1,74 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""RSA key pair used by the fake data center in place of the Telegram servers' keys."""
+
+from hashlib import sha1
+
+from pyrogram.crypto import rsa
+from pyrogram.raw.core import Bytes
+
+# Throwaway 2048-bit key, generated for the fake data center only
+MODULUS = int(
+    "AF8CCDA3E773AD227F46AB778AD124013ABD5403DAE6BE93B415B46EEF2C09BB"
+    "BA978280209BF0DB92033DAC541EB3E2A5CABC17D25BED5FE2E4E44DB739DC57"
+    "4037E11128042462704356E1AE4B36489AB03D0E33454F67FC1A1F0E51745AEC"
+    "6F23C005BE06D806599764AAB62B8DB23E2913D2DE63AE549CE8FCF457C06BF4"
+    "B6FA9FC2D8C751DBAFFC537761CD284E26E9C91C2C42999CF14A033F93E48737"
+    "03CE6A296248CDC6AF3DB81792EBDB189D90FE17CCF8066AEBF361DAF13B45D4"
+    "C1AFDF936F35B6DC17E76D7B1E4E04EE1EC55D4E496178B07A28F2E9731B9012"
+    "6D2F796D2736777C87D233CF7DC15EA72B42529881B29E0166F179ADF2ECD991",
+    16
+)
+
+PUBLIC_EXPONENT = 0x010001
+
+PRIVATE_EXPONENT = int(
+    "1AB933FABDFA9982155EF42E3BF70F6492850CBB9380A9C541564683D6ABDD05"
+    "7367AA09882D44F29FDD176FDAD45BACE67120C5FD9359E4CD5CEBB63AECB772"
+    "9EC782DF0238F332FB04FD3E58B2815E7711DA1185D388BD7B1E9CD8A8A4AE4C"
+    "ACB484003BC7BDEDE5888ADE03E2486D3852377ED3B4D7EE707E75375AFE6350"
+    "7A4C22ECB7511DB45BC7165E1C8DB8A3F79A205A21B447FFB76B99C9C0ADE506"
+    "649C732CC56924EE46F138E4037067A71C96C5888EC1B7CD4A8FF0B60C69F1D7"
+    "70D39293A72F28B4EF845646F12261BAE941D763B3DF24C81D710CDE2297FBB5"
+    "47D2B5520D288C0609C99910FD064AE935F69AF44B6422231839A2165F68A03B",
+    16
+)
+
+
+def get_fingerprint() -> int:
+    # https://core.telegram.org/mtproto/auth_key#dh-exchange-initiation
+    data = Bytes(MODULUS.to_bytes(256, "big")) + Bytes(PUBLIC_EXPONENT.to_bytes(3, "big"))
+
+    return int.from_bytes(sha1(data).digest()[-8:], "little", signed=True)
+
+
+FINGERPRINT = get_fingerprint()
+
+
+def register():
+    """Make clients trust the fake data center public key."""
+    rsa.server_public_keys[FINGERPRINT] = rsa.PublicKey(MODULUS, PUBLIC_EXPONENT)
+
+
+def unregister():
+    rsa.server_public_keys.pop(FINGERPRINT, None)
+
+
+def decrypt(data: bytes) -> bytes:
+    return pow(int.from_bytes(data, "big"), PRIVATE_EXPONENT, MODULUS).to_bytes(256, "big")[1:]
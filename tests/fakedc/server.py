@@ -0,0 +1,774 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from hashlib import sha1, sha256
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import pyrogram
+from pyrogram import raw
+from pyrogram.crypto import aes, mtproto, prime
+from pyrogram.raw.core import (
+    TLObject, Message, MsgContainer, FutureSalt, FutureSalts, Int, Long, Bool, Vector
+)
+from pyrogram.session.internals import DataCenter
+from . import keys
+from .transport import Transport, accept
+
+log = logging.getLogger(__name__)
+
+# https://core.telegram.org/mtproto/samples-auth_key
+P, Q = 1229739323, 1402015859
+
+DC_IDS = (1, 2, 3, 4, 5, 203)
+
+WRAPPERS = (
+    raw.functions.InvokeWithLayer,
+    raw.functions.InitConnection,
+    raw.functions.InvokeWithoutUpdates,
+    raw.functions.InvokeWithTakeout,
+    raw.functions.InvokeWithBusinessConnection,
+    raw.functions.InvokeAfterMsg,
+)
+
+
+class Payload(TLObject):
+    """Already serialized object, used for results which are not TL objects on their own (bools, vectors)."""
+
+    __slots__ = ["data"]
+
+    QUALNAME = "Payload"
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def write(self, *args: Any) -> bytes:
+        return self.data
+
+
+def serialize(result: Any) -> TLObject:
+    if isinstance(result, bool):
+        return Payload(Bool(result))
+
+    if isinstance(result, list):
+        return Payload(Vector(result))
+
+    return result
+
+
+class Handshake:
+    """Server side of the auth key exchange performed by :class:`pyrogram.session.Auth`."""
+
+    def __init__(self, dc: "FakeDC"):
+        self.dc = dc
+
+        self.nonce = None
+        self.server_nonce = int.from_bytes(os.urandom(16), "little", signed=True)
+        self.new_nonce = None
+
+        self.a = int.from_bytes(os.urandom(256), "big")
+        self.tmp_aes_key = None
+        self.tmp_aes_iv = None
+
+    def handle(self, query: TLObject) -> TLObject:
+        if isinstance(query, (raw.functions.ReqPqMulti, raw.functions.ReqPq)):
+            self.nonce = query.nonce
+
+            return raw.types.ResPQ(
+                nonce=self.nonce,
+                server_nonce=self.server_nonce,
+                pq=(P * Q).to_bytes(8, "big"),
+                server_public_key_fingerprints=[keys.FINGERPRINT]
+            )
+
+        if isinstance(query, raw.functions.ReqDHParams):
+            data = keys.decrypt(query.encrypted_data)
+            inner = TLObject.read(BytesIO(data[20:]))
+
+            if data[:20] != sha1(inner.write()).digest() or inner.nonce != self.nonce:
+                raise ConnectionError("Invalid p_q_inner_data")
+
+            self.new_nonce = inner.new_nonce.to_bytes(32, "little", signed=True)
+            server_nonce = self.server_nonce.to_bytes(16, "little", signed=True)
+
+            self.tmp_aes_key = (
+                sha1(self.new_nonce + server_nonce).digest()
+                + sha1(server_nonce + self.new_nonce).digest()[:12]
+            )
+
+            self.tmp_aes_iv = (
+                sha1(server_nonce + self.new_nonce).digest()[12:]
+                + sha1(self.new_nonce + self.new_nonce).digest() + self.new_nonce[:4]
+            )
+
+            answer = raw.types.ServerDHInnerData(
+                nonce=self.nonce,
+                server_nonce=self.server_nonce,
+                g=3,
+                dh_prime=prime.CURRENT_DH_PRIME.to_bytes(256, "big"),
+                g_a=pow(3, self.a, prime.CURRENT_DH_PRIME).to_bytes(256, "big"),
+                server_time=int(time.time())
+            ).write()
+
+            answer_with_hash = sha1(answer).digest() + answer
+            answer_with_hash += os.urandom(-len(answer_with_hash) % 16)
+
+            return raw.types.ServerDHParamsOk(
+                nonce=self.nonce,
+                server_nonce=self.server_nonce,
+                encrypted_answer=aes.ige256_encrypt(answer_with_hash, self.tmp_aes_key, self.tmp_aes_iv)
+            )
+
+        if isinstance(query, raw.functions.SetClientDHParams):
+            data = aes.ige256_decrypt(query.encrypted_data, self.tmp_aes_key, self.tmp_aes_iv)
+            inner = TLObject.read(BytesIO(data[20:]))
+            server_nonce = self.server_nonce.to_bytes(16, "little", signed=True)
+
+            g_b = int.from_bytes(inner.g_b, "big")
+            auth_key = pow(g_b, self.a, prime.CURRENT_DH_PRIME).to_bytes(256, "big")
+            auth_key_aux_hash = sha1(auth_key).digest()[:8]
+
+            self.dc.auth_keys[sha1(auth_key).digest()[-8:]] = auth_key
+            self.dc.stats["auth_keys"] += 1
+
+            # The first salt of a new auth key comes from the nonces, see https://core.telegram.org/mtproto/auth_key
+            server_salt = bytes(a ^ b for a, b in zip(self.new_nonce[:8], server_nonce[:8]))
+            self.dc.initial_salts[sha1(auth_key).digest()[-8:]] = (
+                int.from_bytes(server_salt, "little", signed=True),
+                time.time() + self.dc.salt_period
+            )
+
+            return raw.types.DhGenOk(
+                nonce=self.nonce,
+                server_nonce=self.server_nonce,
+                new_nonce_hash1=int.from_bytes(
+                    sha1(self.new_nonce + b"\x01" + auth_key_aux_hash).digest()[-16:], "little", signed=True
+                )
+            )
+
+        raise ConnectionError(f"Unexpected unencrypted query: {query.QUALNAME}")
+
+
+class Session:
+    """Server side of one client session, identified by its auth key and session id."""
+
+    def __init__(self, dc: "FakeDC", transport: Transport, auth_key: bytes, session_id: bytes):
+        self.dc = dc
+        self.transport = transport
+        self.auth_key = auth_key
+        self.auth_key_id = sha1(auth_key).digest()[-8:]
+        self.session_id = session_id
+
+        self.seq_no = 0
+
+    def pack(self, message: Message) -> bytes:
+        data = Long(self.dc.salt) + self.session_id + message.write()
+        padding = os.urandom(-(len(data) + 12) % 16 + 12)
+
+        # 96 = 88 + 8 (outgoing server message)
+        msg_key = sha256(self.auth_key[96:96 + 32] + data + padding).digest()[8:24]
+        aes_key, aes_iv = mtproto.kdf(self.auth_key, msg_key, False)
+
+        return self.auth_key_id + msg_key + aes.ige256_encrypt(data + padding, aes_key, aes_iv)
+
+    async def send(self, body: TLObject, response: bool = True, content_related: bool = True):
+        if content_related:
+            seq_no = self.seq_no * 2 + 1
+            self.seq_no += 1
+        else:
+            seq_no = self.seq_no * 2
+
+        message = Message(body, self.dc.get_msg_id(response), seq_no, len(body.write()))
+
+        try:
+            await self.transport.send(self.pack(message))
+        except (OSError, RuntimeError):
+            pass
+
+    async def handle(self, message: Message, salt: int):
+        if isinstance(message.body, MsgContainer):
+            for m in message.body.messages:
+                await self.handle(m, salt)
+
+            return
+
+        body = message.body
+
+        if isinstance(body, raw.types.MsgsAck):
+            return
+
+        if not self.dc.is_valid_salt(salt, self.auth_key_id):
+            self.dc.stats["bad_salts"] += 1
+
+            await self.send(
+                raw.types.BadServerSalt(
+                    bad_msg_id=message.msg_id,
+                    bad_msg_seqno=message.seq_no,
+                    error_code=48,
+                    new_server_salt=self.dc.salt
+                ),
+                content_related=False
+            )
+            return
+
+        if self.dc.latency:
+            await asyncio.sleep(self.dc.latency)
+
+        if isinstance(body, (raw.functions.Ping, raw.functions.PingDelayDisconnect)):
+            await self.send(raw.types.Pong(msg_id=message.msg_id, ping_id=body.ping_id), content_related=False)
+        elif isinstance(body, raw.functions.GetFutureSalts):
+            period = self.dc.salt_period
+            slot = int(time.time()) // period
+
+            await self.send(
+                FutureSalts(
+                    message.msg_id,
+                    int(time.time()),
+                    [FutureSalt(i * period, (i + 1) * period, self.dc.get_salt(i)) for i in range(slot, slot + body.num)]
+                ),
+                content_related=False
+            )
+        else:
+            result = await self.dc.invoke(body, self)
+
+            await self.send(
+                Payload(
+                    Int(raw.types.RpcResult.ID, False)
+                    + Long(message.msg_id)
+                    + serialize(result).write()
+                )
+            )
+
+
+class FakeDC:
+    """Local stand-in for Telegram data centers, speaking MTProto 2.0 over TCP.
+
+    While running, every DC address used by :class:`~pyrogram.session.Session` and
+    :class:`~pyrogram.session.Auth` points to this server, so that a regular :class:`~pyrogram.Client` can be started,
+    authorized as a bot and used without any network access.
+
+    Parameters:
+        latency (``float``, *optional*):
+            Seconds to wait before answering each request.
+
+        bandwidth (``int``, *optional*):
+            Bytes per second the server is able to send on each connection. Defaults to 0 (unlimited).
+
+        salt_period (``int``, *optional*):
+            Seconds after which the server salt changes. The previous salt is still accepted for half that time.
+            Defaults to 3600.
+
+    Example:
+        .. code-block:: python
+
+            async with FakeDC() as dc:
+                dc.files[1] = os.urandom(1024)
+
+                async with dc.client() as app:
+                    await app.invoke(raw.functions.help.GetNearestDc())
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        bandwidth: int = 0,
+        salt_period: int = 3600,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.salt_period = salt_period
+        self.host = host
+        self.port = port
+
+        self.server = None  # type: Optional[asyncio.AbstractServer]
+        self.address = None  # type: Optional[Tuple[str, int]]
+
+        self.auth_keys = {}  # type: Dict[bytes, bytes]
+        self.salt_secret = os.urandom(8)
+        # Auth key id -> (salt, expiry) of the salts derived from the auth key exchange
+        self.initial_salts = {}  # type: Dict[bytes, Tuple[int, float]]
+        self.last_msg_id = 0
+
+        self.transports = set()
+        # Sessions which asked for the updates state, and thus receive the updates pushed by the server
+        self.receivers = []  # type: List[Session]
+
+        # Document id -> content, served by upload.GetFile
+        self.files = {}  # type: Dict[int, bytes]
+        # File id -> {part number: bytes}, filled by upload.SaveFilePart and upload.SaveBigFilePart
+        self.uploads = {}  # type: Dict[int, Dict[int, bytes]]
+
+        # Messages of the bot's own chat, newest first, served by messages.GetHistory, see add_history()
+        self.history = []  # type: List[raw.types.Message]
+
+        # Function -> [error, remaining count], see fail() and flood_wait()
+        self.errors = {}  # type: Dict[Type[TLObject], List]
+
+        self.pts = 0
+        self.message_id = 0
+
+        self.me = raw.types.User(
+            id=777000001,
+            is_self=True,
+            bot=True,
+            access_hash=1,
+            first_name="Fake",
+            username="fakedcbot",
+            bot_info_version=1
+        )
+
+        self.handlers = {
+            raw.functions.help.GetConfig: self.get_config,
+            raw.functions.help.GetNearestDc: lambda q: raw.types.NearestDc(country="ZZ", this_dc=2, nearest_dc=2),
+            raw.functions.auth.ImportBotAuthorization: lambda q: raw.types.auth.Authorization(user=self.me),
+            raw.functions.auth.ExportAuthorization: lambda q: raw.types.auth.ExportedAuthorization(
+                id=self.me.id, bytes=b"fake"
+            ),
+            raw.functions.auth.ImportAuthorization: lambda q: raw.types.auth.Authorization(user=self.me),
+            raw.functions.auth.LogOut: lambda q: raw.types.auth.LoggedOut(),
+            raw.functions.users.GetFullUser: self.get_full_user,
+            raw.functions.users.GetUsers: lambda q: [self.me],
+            raw.functions.updates.GetState: self.get_state,
+            raw.functions.updates.GetDifference: self.get_difference,
+            raw.functions.updates.GetChannelDifference: lambda q: raw.types.updates.ChannelDifferenceEmpty(
+                pts=q.pts, final=True
+            ),
+            raw.functions.messages.SendMessage: self.send_message,
+            raw.functions.messages.GetHistory: self.get_history,
+            raw.functions.messages.DeleteMessages: self.delete_messages,
+            raw.functions.messages.ForwardMessages: self.forward_messages,
+            raw.functions.upload.SaveFilePart: self.save_file_part,
+            raw.functions.upload.SaveBigFilePart: self.save_file_part,
+            raw.functions.upload.GetFile: self.get_file,
+        }  # type: Dict[Type[TLObject], Callable]
+
+        self.stats = {
+            "connections": 0,
+            "auth_keys": 0,
+            "requests": 0,
+            "errors": 0,
+            "bad_salts": 0,
+            "updates": 0,
+            "bytes_served": 0,
+            "file_parts": 0,
+            "bytes_received": 0,
+        }
+
+    async def start(self):
+        keys.register()
+
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.address = self.server.sockets[0].getsockname()[:2]
+
+        for dc_id in DC_IDS:
+            DataCenter.CUSTOM[dc_id] = self.address
+
+        log.info("Fake DC listening on %s:%s", *self.address)
+
+    async def stop(self):
+        for dc_id in DC_IDS:
+            DataCenter.CUSTOM.pop(dc_id, None)
+
+        keys.unregister()
+
+        self.server.close()
+
+        for transport in list(self.transports):
+            transport.close()
+
+        await self.server.wait_closed()
+
+    async def __aenter__(self) -> "FakeDC":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    def client(self, name: str = "fakedc", **kwargs) -> "pyrogram.Client":
+        """Create an in-memory bot client ready to be started against this server."""
+        kwargs.setdefault("api_id", 1)
+        kwargs.setdefault("api_hash", "fakedc")
+        kwargs.setdefault("bot_token", f"{self.me.id}:fakedc")
+        kwargs.setdefault("in_memory", True)
+
+        return pyrogram.Client(name, **kwargs)
+
+    @property
+    def salt(self) -> int:
+        """The current server salt."""
+        return self.get_salt(int(time.time()) // self.salt_period)
+
+    def get_salt(self, slot: int) -> int:
+        """Get the salt used during the ``slot``-th salt period since the epoch."""
+        return int.from_bytes(sha1(self.salt_secret + slot.to_bytes(8, "little")).digest()[:8], "little", signed=True)
+
+    def is_valid_salt(self, salt: int, auth_key_id: bytes) -> bool:
+        now = time.time()
+        slot, elapsed = divmod(now, self.salt_period)
+
+        if salt == self.get_salt(int(slot)):
+            return True
+
+        if salt == self.get_salt(int(slot) - 1) and elapsed < self.salt_period / 2:
+            return True
+
+        initial_salt, expiry = self.initial_salts.get(auth_key_id, (None, 0))
+
+        return salt == initial_salt and now < expiry
+
+    def get_msg_id(self, response: bool) -> int:
+        # Server message ids are odd: 1 mod 4 for responses, 3 mod 4 for everything else
+        msg_id = max(int(time.time() * 2 ** 32), self.last_msg_id + 4) & ~3
+        self.last_msg_id = msg_id
+
+        return msg_id | (1 if response else 3)
+
+    def fail(self, function: Type[TLObject], code: int, message: str, count: int = 1):
+        """Answer the next ``count`` calls of ``function`` with an RPC error."""
+        self.errors[function] = [raw.types.RpcError(error_code=code, error_message=message), count]
+
+    def flood_wait(self, function: Type[TLObject], seconds: int, count: int = 1):
+        """Answer the next ``count`` calls of ``function`` with FLOOD_WAIT_X."""
+        self.fail(function, 420, f"FLOOD_WAIT_{seconds}", count)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stats["connections"] += 1
+
+        try:
+            transport = await accept(reader, writer, self.bandwidth)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+
+        self.transports.add(transport)
+
+        handshake = None
+        sessions = {}  # type: Dict[bytes, Session]
+        tasks = set()
+
+        try:
+            while True:
+                packet = await transport.recv()
+
+                if packet is None:
+                    break
+
+                self.stats["bytes_received"] += len(packet)
+
+                if packet[:8] == bytes(8):
+                    handshake = handshake or Handshake(self)
+                    response = handshake.handle(TLObject.read(BytesIO(packet[20:]))).write()
+
+                    await transport.send(bytes(8) + Long(self.get_msg_id(True)) + Int(len(response)) + response)
+                    continue
+
+                auth_key = self.auth_keys.get(packet[:8])
+
+                if auth_key is None:
+                    # Transport error: auth key not found
+                    await transport.send(Int(-404))
+                    break
+
+                # Decrypt in a thread, like a real server would do on its own machine, so that the client's event loop
+                # is not held up by the server
+                salt, session_id, message = await asyncio.get_event_loop().run_in_executor(
+                    None, self.unpack, packet, auth_key
+                )
+
+                session = sessions.get(session_id)
+
+                if session is None:
+                    session = sessions[session_id] = Session(self, transport, auth_key, session_id)
+
+                    await session.send(
+                        raw.types.NewSessionCreated(
+                            first_msg_id=message.msg_id,
+                            unique_id=int.from_bytes(os.urandom(8), "little", signed=True),
+                            server_salt=self.salt
+                        ),
+                        response=False,
+                        content_related=False
+                    )
+
+                # Requests are served concurrently, like a real DC would do
+                task = asyncio.get_event_loop().create_task(session.handle(message, salt))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        except Exception as e:
+            log.exception(e)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            for session in sessions.values():
+                if session in self.receivers:
+                    self.receivers.remove(session)
+
+            self.transports.discard(transport)
+            transport.close()
+
+    @staticmethod
+    def unpack(packet: bytes, auth_key: bytes) -> Tuple[int, bytes, Message]:
+        msg_key = packet[8:24]
+        aes_key, aes_iv = mtproto.kdf(auth_key, msg_key, True)
+        data = aes.ige256_decrypt(packet[24:], aes_key, aes_iv)
+
+        # 88 = 88 + 0 (incoming client message)
+        if msg_key != sha256(auth_key[88:88 + 32] + data).digest()[8:24]:
+            raise ConnectionError("msg_key mismatch")
+
+        return (
+            int.from_bytes(data[:8], "little", signed=True),
+            data[8:16],
+            Message.read(BytesIO(data[16:]))
+        )
+
+    async def invoke(self, query: TLObject, session: Session) -> Any:
+        while isinstance(query, WRAPPERS):
+            query = query.query
+
+        self.stats["requests"] += 1
+
+        error = self.errors.get(type(query))
+
+        if error:
+            error[1] -= 1
+
+            if error[1] <= 0:
+                del self.errors[type(query)]
+
+            self.stats["errors"] += 1
+            return error[0]
+
+        if isinstance(query, (raw.functions.updates.GetState, raw.functions.updates.GetDifference)):
+            if session not in self.receivers:
+                self.receivers.append(session)
+
+        handler = self.handlers.get(type(query))
+
+        if handler is None:
+            self.stats["errors"] += 1
+            return raw.types.RpcError(error_code=400, error_message="METHOD_INVALID")
+
+        result = handler(query)
+
+        if inspect.isawaitable(result):
+            result = await result
+
+        return result
+
+    async def push(self, updates: TLObject):
+        """Send an update to every session that is receiving updates."""
+        self.stats["updates"] += 1
+
+        for session in list(self.receivers):
+            await session.send(updates, response=False)
+
+    def add_history(self, count: int):
+        """Add ``count`` text messages to the bot's own chat, one second apart."""
+        for _ in range(count):
+            self.message_id += 1
+            self.history.insert(0, raw.types.Message(
+                id=self.message_id,
+                peer_id=raw.types.PeerUser(user_id=self.me.id),
+                date=1700000000 + self.message_id,
+                message=f"Message {self.message_id}"
+            ))
+
+    def new_message(self, text: str, from_id: int = 777000, date: int = None) -> raw.types.Updates:
+        """Build the updates for a new private message sent by ``from_id`` to the bot, advancing the pts."""
+        self.pts += 1
+        self.message_id += 1
+
+        date = date or int(time.time())
+        user = raw.types.User(id=from_id, access_hash=from_id, first_name=f"User {from_id}")
+
+        return raw.types.Updates(
+            updates=[
+                raw.types.UpdateNewMessage(
+                    message=raw.types.Message(
+                        id=self.message_id,
+                        peer_id=raw.types.PeerUser(user_id=from_id),
+                        from_id=raw.types.PeerUser(user_id=from_id),
+                        date=date,
+                        message=text
+                    ),
+                    pts=self.pts,
+                    pts_count=1
+                )
+            ],
+            users=[user],
+            chats=[],
+            date=date,
+            seq=0
+        )
+
+    def get_config(self, query: raw.functions.help.GetConfig) -> raw.types.Config:
+        now = int(time.time())
+
+        return raw.types.Config(
+            date=now,
+            expires=now + 3600,
+            test_mode=False,
+            this_dc=2,
+            dc_options=[
+                raw.types.DcOption(id=dc_id, ip_address=self.address[0], port=self.address[1])
+                for dc_id in DC_IDS
+            ],
+            dc_txt_domain_name="localhost",
+            chat_size_max=200,
+            megagroup_size_max=200000,
+            forwarded_count_max=100,
+            online_update_period_ms=210000,
+            offline_blur_timeout_ms=5000,
+            offline_idle_timeout_ms=30000,
+            online_cloud_timeout_ms=300000,
+            notify_cloud_delay_ms=30000,
+            notify_default_delay_ms=1500,
+            push_chat_period_ms=60000,
+            push_chat_limit=2,
+            edit_time_limit=172800,
+            revoke_time_limit=2147483647,
+            revoke_pm_time_limit=2147483647,
+            rating_e_decay=2419200,
+            stickers_recent_limit=200,
+            channels_read_media_period=604800,
+            call_receive_timeout_ms=20000,
+            call_ring_timeout_ms=90000,
+            call_connect_timeout_ms=30000,
+            call_packet_timeout_ms=10000,
+            me_url_prefix="https://t.me/",
+            caption_length_max=1024,
+            message_length_max=4096,
+            webfile_dc_id=4
+        )
+
+    def get_full_user(self, query: raw.functions.users.GetFullUser) -> raw.types.users.UserFull:
+        return raw.types.users.UserFull(
+            full_user=raw.types.UserFull(
+                id=self.me.id,
+                settings=raw.types.PeerSettings(),
+                notify_settings=raw.types.PeerNotifySettings(),
+                common_chats_count=0
+            ),
+            chats=[],
+            users=[self.me]
+        )
+
+    def get_state(self, query: raw.functions.updates.GetState) -> raw.types.updates.State:
+        return raw.types.updates.State(pts=self.pts, qts=0, date=int(time.time()), seq=0, unread_count=0)
+
+    def get_difference(self, query: raw.functions.updates.GetDifference) -> raw.types.updates.DifferenceEmpty:
+        return raw.types.updates.DifferenceEmpty(date=int(time.time()), seq=0)
+
+    def send_message(self, query: raw.functions.messages.SendMessage) -> raw.types.UpdateShortSentMessage:
+        self.pts += 1
+        self.message_id += 1
+
+        return raw.types.UpdateShortSentMessage(
+            id=self.message_id,
+            pts=self.pts,
+            pts_count=1,
+            date=int(time.time()),
+            out=True
+        )
+
+    def get_history(self, query: raw.functions.messages.GetHistory) -> raw.types.messages.Messages:
+        # Same paging as Telegram: start at the first message older than offset_id, move by add_offset, take limit
+        start = 0
+
+        if query.offset_id:
+            start = next((i for i, m in enumerate(self.history) if m.id < query.offset_id), len(self.history))
+
+        start += query.add_offset
+        end = max(start + query.limit, 0)
+        messages = [
+            m for m in self.history[max(start, 0):end]
+            if (not query.max_id or m.id < query.max_id) and m.id > query.min_id
+        ]
+
+        return raw.types.messages.Messages(messages=messages, chats=[], users=[self.me])
+
+    def delete_messages(self, query: raw.functions.messages.DeleteMessages) -> raw.types.messages.AffectedMessages:
+        ids = set(query.id)
+        count = len(self.history)
+
+        self.history = [m for m in self.history if m.id not in ids]
+        self.pts += 1
+
+        return raw.types.messages.AffectedMessages(pts=self.pts, pts_count=count - len(self.history))
+
+    def forward_messages(self, query: raw.functions.messages.ForwardMessages) -> raw.types.Updates:
+        # Messages are forwarded from and to the bot's own chat, those that don't exist are skipped
+        messages = {m.id: m for m in self.history}
+        updates = []
+
+        for message_id, random_id in zip(query.id, query.random_id):
+            if message_id not in messages:
+                continue
+
+            self.pts += 1
+            self.message_id += 1
+
+            message = raw.types.Message(
+                id=self.message_id,
+                peer_id=raw.types.PeerUser(user_id=self.me.id),
+                date=int(time.time()),
+                message=messages[message_id].message
+            )
+
+            self.history.insert(0, message)
+            updates.append(raw.types.UpdateMessageID(id=message.id, random_id=random_id))
+            updates.append(raw.types.UpdateNewMessage(message=message, pts=self.pts, pts_count=1))
+
+        return raw.types.Updates(updates=updates, users=[self.me], chats=[], date=int(time.time()), seq=0)
+
+    def save_file_part(self, query: raw.functions.upload.SaveFilePart) -> bool:
+        self.uploads.setdefault(query.file_id, {})[query.file_part] = query.bytes
+
+        return True
+
+    def get_file(self, query: raw.functions.upload.GetFile) -> TLObject:
+        data = self.files.get(getattr(query.location, "id", None))
+
+        if data is None:
+            return raw.types.RpcError(error_code=400, error_message="FILE_ID_INVALID")
+
+        # Same rules as non-precise requests: 4 KiB aligned offsets, limits dividing 1 MiB, no 1 MiB boundary crossed
+        if query.offset % 4096 or query.limit % 4096 or not 0 < query.limit <= 1048576 or 1048576 % query.limit:
+            return raw.types.RpcError(error_code=400, error_message="LIMIT_INVALID")
+
+        if query.offset // 1048576 != (query.offset + query.limit - 1) // 1048576:
+            return raw.types.RpcError(error_code=400, error_message="OFFSET_INVALID")
+
+        chunk = data[query.offset:query.offset + query.limit]
+        self.stats["file_parts"] += 1
+        self.stats["bytes_served"] += len(chunk)
+
+        return raw.types.upload.File(type=raw.types.storage.FilePartial(), mtime=0, bytes=chunk)
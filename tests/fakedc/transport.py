@@ -0,0 +1,171 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Server side of the TCP transports in :mod:`pyrogram.connection.transport.tcp`.
+
+The transport in use is detected from the first bytes a client sends, exactly like Telegram servers do.
+"""
+
+import asyncio
+from binascii import crc32
+from struct import pack, unpack
+from typing import Optional
+
+from pyrogram.crypto import aes
+
+ABRIDGED = b"\xef"
+INTERMEDIATE = b"\xee" * 4
+
+# Longest packet accepted by the TCP Full detection heuristic
+MAX_PACKET_SIZE = 16 * 1024 * 1024
+
+
+class Transport:
+    """Frames packets for one accepted connection."""
+
+    NAME = "TCPAbridged"
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, bandwidth: int = 0):
+        self.reader = reader
+        self.writer = writer
+        self.bandwidth = bandwidth
+
+        self.encrypt = None
+        self.decrypt = None
+
+        self.lock = asyncio.Lock()
+
+    async def read(self, length: int) -> bytes:
+        data = await self.reader.readexactly(length)
+
+        return bytes(aes.ctr256_decrypt(data, *self.decrypt)) if self.decrypt else data
+
+    async def write(self, data: bytes):
+        if self.encrypt:
+            data = aes.ctr256_encrypt(data, *self.encrypt)
+
+        async with self.lock:
+            self.writer.write(data)
+            await self.writer.drain()
+
+            # Simulate a limited link by holding the connection for as long as the data would take to go through
+            if self.bandwidth:
+                await asyncio.sleep(len(data) / self.bandwidth)
+
+    async def recv(self) -> Optional[bytes]:
+        length = await self.read(1)
+
+        if length == b"\x7f":
+            length = await self.read(3)
+
+        return await self.read(int.from_bytes(length, "little") * 4)
+
+    async def send(self, data: bytes):
+        length = len(data) // 4
+
+        await self.write(
+            (bytes([length]) if length <= 126 else b"\x7f" + length.to_bytes(3, "little"))
+            + data
+        )
+
+    def close(self):
+        self.writer.close()
+
+
+class IntermediateTransport(Transport):
+    NAME = "TCPIntermediate"
+
+    async def recv(self) -> Optional[bytes]:
+        return await self.read(unpack("<i", await self.read(4))[0])
+
+    async def send(self, data: bytes):
+        await self.write(pack("<i", len(data)) + data)
+
+
+class FullTransport(Transport):
+    NAME = "TCPFull"
+
+    def __init__(self, *args, header: bytes = b""):
+        super().__init__(*args)
+
+        self.header = header
+        self.seq_no = 0
+
+    async def recv(self) -> Optional[bytes]:
+        if self.header:
+            # Length and sequence number of the first packet were consumed by the detection
+            head, self.header = self.header, b""
+        else:
+            head = await self.read(8)
+
+        length = unpack("<I", head[:4])[0]
+        packet = head + await self.read(length - 8)
+
+        if crc32(packet[:-4]) != unpack("<I", packet[-4:])[0]:
+            return None
+
+        return packet[8:-4]
+
+    async def send(self, data: bytes):
+        data = pack("<II", len(data) + 12, self.seq_no) + data
+        self.seq_no += 1
+
+        await self.write(data + pack("<I", crc32(data)))
+
+
+async def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, bandwidth: int = 0) -> Transport:
+    head = await reader.readexactly(1)
+
+    if head == ABRIDGED:
+        return Transport(reader, writer, bandwidth)
+
+    head += await reader.readexactly(3)
+
+    if head == INTERMEDIATE:
+        return IntermediateTransport(reader, writer, bandwidth)
+
+    head += await reader.readexactly(4)
+    length, seq_no = unpack("<II", head)
+
+    # The first TCP Full packet starts with its length followed by a zero sequence number
+    if seq_no == 0 and 12 <= length <= MAX_PACKET_SIZE and length % 4 == 0:
+        return FullTransport(reader, writer, bandwidth, header=head)
+
+    # Obfuscated transports start with a 64 bytes random nonce, whose tail carries the inner transport tag.
+    # Decrypting the whole nonce also brings the stream cipher to the same state as the client's one.
+    nonce = head + await reader.readexactly(56)
+    temp = nonce[55:7:-1]
+
+    decrypt = (nonce[8:40], bytearray(nonce[40:56]), bytearray(1))
+    encrypt = (temp[0:32], bytearray(temp[32:48]), bytearray(1))
+
+    tag = aes.ctr256_decrypt(nonce, *decrypt)[56:60]
+
+    if tag == ABRIDGED * 4:
+        transport = Transport(reader, writer, bandwidth)
+        transport.NAME = "TCPAbridgedO"
+    elif tag == INTERMEDIATE:
+        transport = IntermediateTransport(reader, writer, bandwidth)
+        transport.NAME = "TCPIntermediateO"
+    else:
+        raise ConnectionError(f"Unknown transport: {nonce.hex()}")
+
+    transport.encrypt = encrypt
+    transport.decrypt = decrypt
+
+    return transport
@@ -16,7 +16,10 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import pytest
+
 import pyrogram
+from pyrogram import raw
 from pyrogram.parser.html import HTML
 
 
@@ -145,3 +148,63 @@ def test_html_unparse_no_entities():
     entities = []
 
     assert HTML.unparse(text=text, entities=entities) == expected
+
+
+def test_html_unparse_emoji():
+    expected = "😀 <b>bold <i>👨\u200d👩\u200d👧</i> &lt;i&gt;</b>"
+    text = "😀 bold 👨\u200d👩\u200d👧 <i>"
+    entities = pyrogram.types.List(
+        [pyrogram.types.MessageEntity(type=pyrogram.enums.MessageEntityType.BOLD, offset=3, length=17),
+         pyrogram.types.MessageEntity(type=pyrogram.enums.MessageEntityType.ITALIC, offset=8, length=8)])
+
+    assert HTML.unparse(text=text, entities=entities) == expected
+
+
+@pytest.mark.asyncio
+async def test_html_parse_nested():
+    expected = {
+        "message": "bold italic link",
+        "entities": [
+            raw.types.MessageEntityBold(offset=0, length=11),
+            raw.types.MessageEntityItalic(offset=5, length=6),
+            raw.types.MessageEntityTextUrl(offset=12, length=4, url="https://t.me/?a=1&b=2"),
+        ]
+    }
+    text = '<b>bold <I>italic</I></b> <a href="https://t.me/?a=1&amp;b=2">link</a>'
+
+    assert await HTML(None).parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_html_parse_utf16_offsets():
+    expected = {
+        "message": "😀😀 x <b>",
+        "entities": [
+            raw.types.MessageEntityItalic(offset=0, length=2),
+            raw.types.MessageEntityBold(offset=5, length=1),
+            raw.types.MessageEntityCode(offset=7, length=3),
+        ]
+    }
+    text = "<i>😀</i>&#128512; <b>x</b> <code>&lt;b&gt;</code>"
+
+    assert await HTML(None).parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_html_parse_ignored_markup():
+    expected = {
+        "message": "a < b text",
+        "entities": [raw.types.MessageEntityUnderline(offset=6, length=4)]
+    }
+    text = "a < b <!-- comment --><br/><u>text</u >"
+
+    assert await HTML(None).parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_html_parse_malformed():
+    assert await HTML(None).parse("</>x") == {"message": "</>x", "entities": None}
+    assert await HTML(None).parse("<script><b>x</b></script>") == {
+        "message": "x",
+        "entities": [raw.types.MessageEntityBold(offset=0, length=1)]
+    }
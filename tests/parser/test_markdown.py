@@ -0,0 +1,201 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from pyrogram import enums, raw, types
+from pyrogram.parser import Parser
+from pyrogram.parser.markdown import Markdown
+from pyrogram.parser.markdown import Markdown
+
+
+# expected: the expected parsed text and entities
+# text: the Markdown text
+
+
+async def parse(text: str, mode: enums.ParseMode = enums.ParseMode.DEFAULT):
+    result = await Parser(None).parse(text, mode)
+
+    return result["message"], result["entities"]
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_styles():
+    expected = ("bold italic underline strike spoiler code", [
+        raw.types.MessageEntityBold(offset=0, length=4),
+        raw.types.MessageEntityItalic(offset=5, length=6),
+        raw.types.MessageEntityUnderline(offset=12, length=9),
+        raw.types.MessageEntityStrike(offset=22, length=6),
+        raw.types.MessageEntitySpoiler(offset=29, length=7),
+        raw.types.MessageEntityCode(offset=37, length=4),
+    ])
+    text = "**bold** __italic__ --underline-- ~~strike~~ ||spoiler|| `code`"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_nested():
+    expected = ("a b c d e", [
+        raw.types.MessageEntityBold(offset=2, length=5),
+        raw.types.MessageEntityItalic(offset=4, length=1),
+    ])
+    text = "a **b __c__ d** e"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_utf16_offsets():
+    expected = ("😀 bold 😀 x", [
+        raw.types.MessageEntityBold(offset=3, length=7),
+        raw.types.MessageEntityItalic(offset=11, length=1),
+    ])
+    text = "😀 **bold 😀** __x__"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_links():
+    expected = ("link me 👍", [
+        raw.types.MessageEntityTextUrl(offset=0, length=4, url="https://example.com/?a=1&b=2"),
+        raw.types.InputMessageEntityMentionName(offset=5, length=2, user_id=123),
+        raw.types.MessageEntityCustomEmoji(offset=8, length=2, document_id=5368324170671202286),
+    ])
+    text = "[link](https://example.com/?a=1&amp;b=2) [me](tg://user?id=123) ![👍](tg://emoji?id=5368324170671202286)"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_pre():
+    expected = ("before\n\ndef f():\n    return 1\n\nafter", [
+        raw.types.MessageEntityPre(offset=7, length=23, language="python"),
+    ])
+    text = "before\n```python\ndef f():\n    return 1\n```\nafter"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_pre_at_start():
+    expected = ("print(1)", [raw.types.MessageEntityPre(offset=0, length=8, language="py")])
+    text = "```py\nprint(1)\n```"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_fixed_width():
+    expected = ("x a **b** c y", [raw.types.MessageEntityCode(offset=2, length=9)])
+    text = "x `a **b** c` y"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_blockquotes():
+    expected = ("text\nquote\nsecond\nafter\nmore", [
+        raw.types.MessageEntityBlockquote(offset=5, length=12, collapsed=False),
+        raw.types.MessageEntityBlockquote(offset=24, length=4, collapsed=True),
+    ])
+    text = "text\n> quote\n> second\nafter\n**> more"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_html():
+    expected = ("bold and md", [
+        raw.types.MessageEntityBold(offset=0, length=4),
+        raw.types.MessageEntityItalic(offset=9, length=2),
+    ])
+    text = "<b>bold</b> and __md__"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_html_attributes():
+    expected = ("x", [raw.types.MessageEntityTextUrl(offset=0, length=1, url="https://x.com/a__b__c")])
+    text = '<a href="https://x.com/a__b__c">x</a>'
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_unclosed():
+    expected = ("bold", None)
+    text = "**bold"
+
+    assert await parse(text) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_strict():
+    expected = ("bold <i>x</i> &amp;", [raw.types.MessageEntityBold(offset=0, length=4)])
+    text = "**bold** <i>x</i> &amp;"
+
+    assert await parse(text, enums.ParseMode.MARKDOWN) == expected
+
+
+def test_markdown_unparse_nested():
+    expected = "**bold __italic__ bold** `code`"
+    text = "bold italic bold code"
+    entities = types.List(
+        [types.MessageEntity(type=enums.MessageEntityType.BOLD, offset=0, length=16),
+         types.MessageEntity(type=enums.MessageEntityType.ITALIC, offset=5, length=6),
+         types.MessageEntity(type=enums.MessageEntityType.CODE, offset=17, length=4)])
+
+    assert Markdown.unparse(text=text, entities=entities) == expected
+
+
+def test_markdown_unparse_emoji():
+    expected = "😀 [link](https://example.com) ||👨\u200d👩\u200d👧 spoiler||"
+    text = "😀 link 👨\u200d👩\u200d👧 spoiler"
+    entities = types.List(
+        [types.MessageEntity(type=enums.MessageEntityType.TEXT_LINK, offset=3, length=4, url="https://example.com"),
+         types.MessageEntity(type=enums.MessageEntityType.SPOILER, offset=8, length=16)])
+
+    assert Markdown.unparse(text=text, entities=entities) == expected
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_whitespace():
+    expected = ("a", [raw.types.MessageEntityBold(offset=0, length=1)])
+
+    assert await parse("  **a**  ") == expected
+    assert await parse("  <b>a</b>\n") == expected
+    assert await Markdown(None).parse("  a") == {"message": "  a", "entities": None}
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_malformed_html():
+    assert await parse("**x** </>y") == ("x </>y", [raw.types.MessageEntityBold(offset=0, length=1)])
+    assert await parse("<!-- comment -->x") == ("x", None)
+    assert await parse("&lt;b&gt;x") == ("<b>x", None)
+    assert await parse("<script><b>x</b></script>") == ("x", [raw.types.MessageEntityBold(offset=0, length=1)])
+
+
+@pytest.mark.asyncio
+async def test_markdown_parse_unclosed_autolink():
+    expected = ("a <https://x.com b", [raw.types.MessageEntityBold(offset=0, length=16)])
+    text = "**a <https://x.com** b"
+
+    assert await parse(text) == expected
@@ -0,0 +1,91 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+import pytest
+
+from pyrogram import enums, raw, types
+from pyrogram.parser import Parser
+from tests.fakedc import FakeDC
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_hits():
+    parser = Parser(None, 8)
+    text = "**bold** and __italic__"
+
+    first = await parser.parse(text)
+    first["entities"].clear()
+    second = await parser.parse(text)
+
+    assert second == {
+        "message": "bold and italic",
+        "entities": [
+            raw.types.MessageEntityBold(offset=0, length=4),
+            raw.types.MessageEntityItalic(offset=9, length=6)
+        ]
+    }
+    assert parser.cache.stats["hits"] == 1
+    assert parser.cache.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_modes():
+    parser = Parser(None, 2)
+    text = "**bold** <b>html</b>"
+
+    assert (await parser.parse(text, enums.ParseMode.HTML))["message"] == "**bold** html"
+    assert (await parser.parse(text, enums.ParseMode.DISABLED))["message"] == text
+    assert (await parser.parse(text, enums.ParseMode.DEFAULT))["message"] == "bold html"
+
+    # The least recently used result, parsed as HTML, made room for the last one
+    assert parser.cache.stats["size"] == 2
+    assert parser.cache.stats["evictions"] == 1
+    assert (enums.ParseMode.HTML, text) not in parser.cache
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_mentions():
+    async with FakeDC() as dc:
+        async with dc.client(parse_cache_size=8) as app:
+            text = f'<a href="tg://user?id={dc.me.id}">me</a>'
+
+            for _ in range(2):
+                entity, = (await app.parser.parse(text, enums.ParseMode.HTML))["entities"]
+
+                assert isinstance(entity, raw.types.InputMessageEntityMentionName)
+                assert not isinstance(entity.user_id, int)
+
+            # The cached result keeps the user id, mentions are resolved every time the text is used
+            cached, = app.parser.cache.get((enums.ParseMode.HTML, text))["entities"]
+
+            assert cached.user_id == dc.me.id
+            assert app.parser.cache.stats["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_markup_cache():
+    async with FakeDC() as dc:
+        async with dc.client(parse_cache_size=8) as app:
+            markup = types.InlineKeyboardMarkup([[types.InlineKeyboardButton("Open", callback_data="open")]])
+
+            assert await markup.write(app) is await markup.write(app)
+            assert app.markup_cache.stats["hits"] == 1
+
+            other = types.InlineKeyboardMarkup([[types.InlineKeyboardButton("Open", callback_data="open")]])
+
+            assert await other.write(app) is not await markup.write(app)
+            assert len(app.markup_cache) == 2
@@ -0,0 +1,119 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import random
+
+import pytest
+
+from pyrogram import raw, utils
+from pyrogram.errors import PeerIdInvalid
+from tests.fakedc import FakeDC
+
+
+def get_users_handler(dc: FakeDC, sizes: list, missing: set = frozenset()):
+    def get_users(query: raw.functions.users.GetUsers) -> list:
+        sizes.append(len(query.id))
+
+        return [
+            dc.me if isinstance(i, raw.types.InputPeerSelf) else
+            raw.types.User(id=i.user_id, access_hash=i.user_id * 2, first_name=str(i.user_id))
+            for i in query.id
+            if isinstance(i, raw.types.InputPeerSelf) or i.user_id not in missing
+        ]
+
+    return get_users
+
+
+@pytest.mark.asyncio
+async def test_gather_chunks():
+    running = peak = 0
+
+    async def function(chunk: list) -> list:
+        nonlocal running, peak
+
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(random.random() / 100)
+        running -= 1
+
+        return [i * 2 for i in chunk]
+
+    assert await utils.gather_chunks(function, list(range(95)), 10, 3) == [i * 2 for i in range(95)]
+    assert peak == 3
+    assert await utils.gather_chunks(function, [], 10) == []
+
+
+@pytest.mark.asyncio
+async def test_get_users_chunks():
+    user_ids = random.sample(range(1, 10 ** 6), 450)
+    sizes = []
+
+    async with FakeDC() as dc:
+        dc.handlers[raw.functions.users.GetUsers] = get_users_handler(dc, sizes, {user_ids[7]})
+
+        async with dc.client() as app:
+            users = await app.get_users(user_ids + ["me"])
+
+            # Users the server doesn't return are left out, the others keep their order
+            assert [u.id for u in users] == user_ids[:7] + user_ids[8:] + [dc.me.id]
+            assert sorted(sizes) == [51, 200, 200]
+
+            # The users fetched are cached and resolved without requests
+            assert await app.resolve_peer(user_ids[0]) == raw.types.InputPeerUser(
+                user_id=user_ids[0], access_hash=user_ids[0] * 2
+            )
+
+
+@pytest.mark.asyncio
+async def test_get_users_missing():
+    async with FakeDC() as dc:
+        dc.handlers[raw.functions.users.GetUsers] = lambda q: []
+
+        async with dc.client() as app:
+            assert await app.get_users([123456]) == []
+
+            with pytest.raises(PeerIdInvalid):
+                await app.get_users(123456)
+
+
+@pytest.mark.asyncio
+async def test_get_chats():
+    sizes = []
+    chat_ids = []
+
+    def get_chats(query: raw.functions.messages.GetChats) -> raw.types.messages.Chats:
+        chat_ids.append(query.id)
+
+        return raw.types.messages.Chats(chats=[
+            raw.types.Chat(id=i, title=str(i), photo=raw.types.ChatPhotoEmpty(), participants_count=1, date=0, version=1)
+            for i in query.id
+        ])
+
+    async with FakeDC() as dc:
+        dc.handlers[raw.functions.users.GetUsers] = get_users_handler(dc, sizes)
+        dc.handlers[raw.functions.messages.GetChats] = get_chats
+
+        async with dc.client() as app:
+            chats = await app.get_chats([-10, 20, "me", -30, -10])
+
+            assert [c.id for c in chats] == [-10, 20, dc.me.id, -30, -10]
+            assert chats[0].title == "10"
+            # One request for each kind of chat, the same basic group is asked for once
+            assert sizes == [2]
+            assert chat_ids == [[10, 30]]
@@ -0,0 +1,113 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.errors import Forbidden
+from tests.fakedc import FakeDC
+
+
+@pytest.mark.asyncio
+async def test_delete_messages_chunks():
+    async with FakeDC() as dc:
+        dc.add_history(300)
+
+        async with dc.client() as app:
+            assert await app.delete_messages("me", range(1, 251)) == 250
+            assert [m.id for m in dc.history] == list(range(300, 250, -1))
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_messages():
+    async with FakeDC() as dc:
+        dc.add_history(300)
+        dc.fail(raw.functions.messages.DeleteMessages, 403, "MESSAGE_DELETE_FORBIDDEN")
+
+        async with dc.client() as app:
+            r = await app.bulk_delete_messages("me", range(1, 251), max_concurrent_requests=1)
+
+            # The failed chunk doesn't stop the others
+            assert list(r.errors) == list(range(1, 101))
+            assert isinstance(r.errors[1], Forbidden)
+            assert list(r.results) == list(range(101, 251))
+            assert [m.id for m in dc.history] == list(range(300, 250, -1)) + list(range(100, 0, -1))
+
+
+@pytest.mark.asyncio
+async def test_bulk_forward_messages():
+    async with FakeDC() as dc:
+        dc.add_history(150)
+        dc.history = [m for m in dc.history if m.id != 42]
+
+        async with dc.client(sleep_threshold=0) as app:
+            dc.flood_wait(raw.functions.messages.ForwardMessages, 1)
+
+            start = time.monotonic()
+            r = await app.bulk_forward_messages("me", "me", range(1, 151))
+
+            # The chunk hitting the flood wait is sent again, the missing message is skipped
+            assert time.monotonic() - start >= 1
+            assert not r.errors
+            assert list(r.results) == [i for i in range(1, 151) if i != 42]
+            assert all(m.text == f"Message {i}" for i, m in r.results.items())
+            # The chunks are forwarded in order
+            assert [m.id for m in r.results.values()] == list(range(151, 300))
+
+
+@pytest.mark.asyncio
+async def test_forward_messages_chunks():
+    async with FakeDC() as dc:
+        dc.add_history(150)
+
+        async with dc.client() as app:
+            messages = await app.forward_messages("me", "me", range(1, 151))
+
+            assert [m.text for m in messages] == [f"Message {i}" for i in range(1, 151)]
+            assert (await app.forward_messages("me", "me", 7)).text == "Message 7"
+
+            # The same message can be forwarded more than once
+            assert [m.text for m in await app.forward_messages("me", "me", [5, 5])] == ["Message 5"] * 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_forward_messages_without_message_ids():
+    async with FakeDC() as dc:
+        dc.add_history(10)
+        dc.history = [m for m in dc.history if m.id != 4]
+
+        def forward_messages(query: raw.functions.messages.ForwardMessages) -> raw.types.Updates:
+            r = dc.forward_messages(query)
+            r.updates = [i for i in r.updates if not isinstance(i, raw.types.UpdateMessageID)]
+
+            return r
+
+        dc.handlers[raw.functions.messages.ForwardMessages] = forward_messages
+
+        async with dc.client() as app:
+            # Messages are matched to their source ids in order only when none was skipped
+            r = await app.bulk_forward_messages("me", "me", [1, 2, 3])
+
+            assert [(i, m.text) for i, m in r.results.items()] == [(i, f"Message {i}") for i in (1, 2, 3)]
+
+            r = await app.bulk_forward_messages("me", "me", [3, 4, 5])
+
+            assert not r.results and not r.errors
+            assert len(await app.forward_messages("me", "me", [3, 4, 5])) == 2
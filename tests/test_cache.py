@@ -0,0 +1,111 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest import mock
+
+from pyrogram.cache import Cache, approximate_size
+
+
+def test_lru_eviction():
+    cache = Cache(3)
+
+    for i in range(3):
+        cache[(1, i)] = i
+
+    assert cache[(1, 0)] == 0  # Mark as recently used
+
+    cache[(1, 3)] = 3
+
+    assert (1, 1) not in cache
+    assert [k for k in cache.store] == [(1, 2), (1, 0), (1, 3)]
+    assert cache.evictions == 1
+
+
+def test_overwrite_keeps_size():
+    cache = Cache(2)
+
+    cache["a"] = 1
+    cache["a"] = 2
+
+    assert len(cache) == 1
+    assert cache["a"] == 2
+
+
+def test_hits_and_misses():
+    cache = Cache(10)
+    cache["a"] = 1
+
+    assert cache["a"] == 1
+    assert cache["b"] is None
+    assert cache.get("c", 0) == 0
+
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+
+
+def test_byte_budget():
+    cache = Cache(100, max_bytes=10, sizeof=len)
+
+    cache["a"] = "xxxx"
+    cache["b"] = "xxxx"
+    assert cache.bytes == 8
+
+    cache["c"] = "xxxx"
+    assert "a" not in cache
+    assert cache.bytes == 8
+
+    # A single value bigger than the budget doesn't stay in the cache
+    cache["d"] = "x" * 20
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_ttl():
+    cache = Cache(10, ttl=5)
+
+    with mock.patch("pyrogram.cache.time.monotonic", return_value=100):
+        cache["a"] = 1
+
+    with mock.patch("pyrogram.cache.time.monotonic", return_value=104):
+        assert cache["a"] == 1
+
+    with mock.patch("pyrogram.cache.time.monotonic", return_value=106):
+        assert cache["a"] is None
+
+    assert "a" not in cache
+    assert cache.expirations == 1
+
+
+def test_invalidate():
+    cache = Cache(10)
+
+    for chat_id in (1, 2):
+        for message_id in range(3):
+            cache[(chat_id, message_id)] = message_id
+
+    assert cache.invalidate(1, [0, 1, 5]) == 2
+    assert (1, 2) in cache
+
+    assert cache.invalidate(2) == 3
+    assert 2 not in cache.groups
+    assert len(cache) == 1
+
+
+def test_approximate_size():
+    assert approximate_size("x" * 1000) > 1000
+    assert approximate_size(["x" * 1000, "y" * 1000]) > 2000
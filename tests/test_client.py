@@ -0,0 +1,119 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+import pyrogram
+from pyrogram import raw, types
+
+ALICE = raw.types.User(id=1, access_hash=1, first_name="Alice", usernames=[], restriction_reason=[])
+GROUP = raw.types.Chat(
+    id=2, title="Group", photo=raw.types.ChatPhotoEmpty(), participants_count=2, date=0, version=1
+)
+
+
+async def make_client() -> pyrogram.Client:
+    client = pyrogram.Client("test", in_memory=True)
+    await client.storage.open()
+
+    return client
+
+
+def short_message(i, **kwargs):
+    return raw.types.UpdateShortMessage(
+        id=i, user_id=1, message=f"message {i}", pts=100 + i, pts_count=1, date=0, entities=[], **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_build_short_message_needs_cached_peers():
+    client = await make_client()
+
+    assert client.build_short_message(short_message(1)) is None
+
+    await client.fetch_peers([ALICE])
+    update, users, chats = client.build_short_message(short_message(1))
+
+    assert isinstance(update, raw.types.UpdateNewMessage)
+    assert update.pts == 101
+    assert users == {1: ALICE}
+
+    message = await types.Message._parse(client, update.message, users, chats, replies=0)
+
+    assert message.text == "message 1"
+    assert message.from_user.first_name == "Alice"
+    assert message.chat.id == 1
+
+    # The forwarded message's sender isn't cached
+    fwd_from = raw.types.MessageFwdHeader(date=0, from_id=raw.types.PeerUser(user_id=3))
+    assert client.build_short_message(short_message(2, fwd_from=fwd_from)) is None
+
+
+@pytest.mark.asyncio
+async def test_build_short_chat_message():
+    client = await make_client()
+    await client.fetch_peers([ALICE, GROUP])
+
+    update, users, chats = client.build_short_message(
+        raw.types.UpdateShortChatMessage(
+            id=1, from_id=1, chat_id=2, message="hi", pts=10, pts_count=1, date=0, entities=[]
+        )
+    )
+
+    message = await types.Message._parse(client, update.message, users, chats, replies=0)
+
+    assert message.chat.id == -2
+    assert message.from_user.id == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_peers_share_a_difference_request():
+    client = await make_client()
+    client.is_connected = True
+    invoked = []
+
+    async def invoke(query, *args, **kwargs):
+        invoked.append(query)
+
+        return raw.types.updates.Difference(
+            new_messages=[
+                raw.types.Message(id=i, peer_id=raw.types.PeerUser(user_id=1), date=0, message=f"message {i}")
+                for i in (1, 2)
+            ],
+            new_encrypted_messages=[],
+            other_updates=[],
+            chats=[],
+            users=[ALICE],
+            state=raw.types.updates.State(pts=102, qts=0, date=0, seq=0, unread_count=0)
+        )
+
+    client.invoke = invoke
+
+    await client.handle_updates(short_message(1))
+    await client.handle_updates(short_message(2))
+    await asyncio.sleep(client.SHORT_MESSAGES_DELAY * 2)
+
+    assert len(invoked) == 1
+    assert invoked[0].pts == 100
+    assert client.dispatcher.updates_queue.qsize() == 2
+
+    update, users, _ = client.dispatcher.updates_queue.get_nowait()
+    assert update.message.id == 1
+    assert users == {1: ALICE}
@@ -0,0 +1,119 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.dispatcher import Dispatcher, UpdatesQueue
+
+
+def make_queue(**kwargs) -> UpdatesQueue:
+    lanes = {
+        **{update: "high" for update in Dispatcher.HIGH_PRIORITY_UPDATES},
+        **{update: "low" for update in Dispatcher.LOW_PRIORITY_UPDATES},
+    }
+
+    return UpdatesQueue(lanes, **kwargs)
+
+
+def callback_query(i):
+    return raw.types.UpdateBotCallbackQuery(
+        query_id=i, user_id=1, peer=raw.types.PeerUser(user_id=1), msg_id=1, chat_instance=0
+    ), {}, {}
+
+
+def new_message(i):
+    return raw.types.UpdateNewMessage(message=raw.types.MessageEmpty(id=i), pts=0, pts_count=0), {}, {}
+
+
+def user_status(i):
+    return raw.types.UpdateUserStatus(user_id=i, status=raw.types.UserStatusEmpty()), {}, {}
+
+
+@pytest.mark.asyncio
+async def test_weighted_lanes():
+    queue = make_queue(weights={"high": 2, "normal": 1, "low": 1})
+
+    for i in range(4):
+        queue.put_nowait(new_message(i))
+        queue.put_nowait(user_status(i))
+
+    for i in range(4):
+        queue.put_nowait(callback_query(i))
+
+    lanes = []
+
+    for _ in range(12):
+        update = (await queue.get())[0]
+        lanes.append(queue.lane_of.get(type(update), "normal"))
+        queue.task_done()
+
+    assert lanes[:4] == ["high", "high", "normal", "low"]
+    assert lanes[4:8] == ["high", "high", "normal", "low"]
+    assert lanes[8:] == ["normal", "low", "normal", "low"]
+
+    await asyncio.wait_for(queue.join(), 1)
+
+
+@pytest.mark.asyncio
+async def test_reserved_lanes():
+    queue = make_queue()
+    queue.put_nowait(new_message(1))
+
+    task = asyncio.ensure_future(queue.get(("high",)))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    queue.put_nowait(callback_query(1))
+    packet = await asyncio.wait_for(task, 1)
+
+    assert isinstance(packet[0], raw.types.UpdateBotCallbackQuery)
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_updates_are_dropped():
+    queue = make_queue(max_age={"low": 10})
+
+    with mock.patch("pyrogram.dispatcher.time.monotonic", return_value=100):
+        queue.put_nowait(user_status(1))
+        queue.put_nowait(new_message(1))
+
+    with mock.patch("pyrogram.dispatcher.time.monotonic", return_value=120):
+        queue.put_nowait(user_status(2))
+
+        assert isinstance((await queue.get())[0], raw.types.UpdateNewMessage)
+        assert (await queue.get())[0].user_id == 2
+
+    assert queue.stats["low"]["dropped"] == 1
+    assert queue.stats["low"]["processed"] == 1
+    assert queue.stats["normal"]["max_wait"] == 20
+
+
+@pytest.mark.asyncio
+async def test_stop_signal_after_pending_updates():
+    queue = make_queue()
+
+    queue.put_nowait(new_message(1))
+    queue.put_nowait(None)
+
+    assert (await queue.get()) is not None
+    assert (await queue.get()) is None
@@ -0,0 +1,142 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.export import download_media_file
+from pyrogram.storage import Storage
+from tests.fakedc import FakeDC
+
+
+def read_records(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_export_and_resume(tmp_path):
+    path = tmp_path / "export.jsonl"
+
+    async with FakeDC() as dc:
+        dc.add_history(250)
+
+        async with dc.client() as app:
+            assert await app.export_chats(["me"], path) == {dc.me.id: 250}
+
+            records = read_records(path)
+            messages = [r["message"] for r in records if "message" in r]
+
+            assert [r for r in records if "user" in r] == [records[0]]
+            assert [m["id"] for m in messages] == list(range(1, 251))
+            assert messages[0]["message"] == "Message 1"
+            assert [state[:3] for state in await app.storage.export_state()] == [(dc.me.id, 250, 250)]
+
+            # Only the new messages are exported when resuming
+            dc.add_history(30)
+
+            assert await app.export_chats(["me"], path) == {dc.me.id: 280}
+            assert [r["message"]["id"] for r in read_records(path) if "message" in r] == list(range(1, 281))
+
+            assert await app.export_chats(["me"], tmp_path / "full.jsonl", resume=False) == {dc.me.id: 280}
+
+
+@pytest.mark.asyncio
+async def test_export_without_export_state(tmp_path, monkeypatch):
+    path = tmp_path / "export.jsonl"
+
+    async with FakeDC() as dc:
+        dc.add_history(150)
+
+        async with dc.client() as app:
+            # Storage engines that don't save the progress export the chats from their beginning every time
+            monkeypatch.setattr(type(app.storage), "export_state", Storage.export_state)
+
+            assert await app.export_chats(["me"], path) == {dc.me.id: 150}
+            assert await app.export_chats(["me"], path) == {dc.me.id: 150}
+            assert len([r for r in read_records(path) if "message" in r]) == 300
+
+
+@pytest.mark.asyncio
+async def test_export_media(tmp_path):
+    data = os.urandom(5000)
+
+    async with FakeDC() as dc:
+        dc.add_history(3)
+        dc.files[42] = data
+        dc.message_id += 1
+        dc.history.insert(0, raw.types.Message(
+            id=dc.message_id,
+            peer_id=raw.types.PeerUser(user_id=dc.me.id),
+            date=1700000000,
+            message="",
+            media=raw.types.MessageMediaDocument(
+                document=raw.types.Document(
+                    id=42,
+                    access_hash=0,
+                    file_reference=b"",
+                    date=1700000000,
+                    mime_type="text/plain",
+                    size=len(data),
+                    dc_id=2,
+                    attributes=[raw.types.DocumentAttributeFilename(file_name="../notes.txt")]
+                )
+            )
+        ))
+
+        async with dc.client() as app:
+            await app.export_chats(["me"], tmp_path / "export.jsonl", media_dir=tmp_path / "media")
+
+        records = [r for r in read_records(tmp_path / "export.jsonl") if "message" in r]
+
+        assert [r["media"] for r in records] == [None, None, None, f"{dc.me.id}/4_42_notes.txt"]
+        assert (tmp_path / "media" / records[-1]["media"]).read_bytes() == data
+
+
+@pytest.mark.asyncio
+async def test_download_media_file_cleanup(tmp_path):
+    path = tmp_path / "media" / "file.bin"
+
+    async def failing(file_id, file_size):
+        yield b"x" * 10
+        raise OSError("connection lost")
+
+    async def stalled(file_id, file_size):
+        yield b"x" * 10
+        await asyncio.sleep(10)
+
+    with pytest.raises(OSError):
+        await download_media_file(SimpleNamespace(get_file=failing), None, 20, path)
+
+    task = asyncio.ensure_future(download_media_file(SimpleNamespace(get_file=stalled), None, 20, path))
+
+    while not (tmp_path / "media" / "file.bin.temp").exists():
+        await asyncio.sleep(0.01)
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Neither the file nor its temporary file are left behind
+    assert os.listdir(tmp_path / "media") == []
@@ -18,7 +18,7 @@
 
 import pytest
 
-from pyrogram.file_id import FileId, FileUniqueId, FileType, FileUniqueType
+from pyrogram.file_id import FileId, FileUniqueId, FileType, FileUniqueType, rle_encode, rle_decode
 
 
 def check(file_id: str, expected_file_type: FileType):
@@ -178,6 +178,14 @@ def test_unknown_thumbnail_source():
         check(unknown, FileType.THUMBNAIL)
 
 
+def test_rle():
+    assert rle_encode(b"\x01\x00\x00\x02\x00") == b"\x01\x00\x02\x02\x00\x01"
+    assert rle_decode(b"\x01\x00\x02\x02\x00\x01") == b"\x01\x00\x00\x02\x00"
+
+    for data in (b"", b"\x01\x02", bytes(3), bytes(255), b"\x01" + bytes(600) + b"\x02"):
+        assert rle_decode(rle_encode(data)) == data
+
+
 def test_stringify_file_id():
     file_id = "BQACAgIAAx0CAAGgr9AAAgmPX7b4UxbjNoFEO_L0I4s6wrXNJA8AAgQAA4GkuUm9FFvIaOhXWR4E"
     string = "{'major': 4, 'minor': 30, 'file_type': <FileType.DOCUMENT: 5>, 'dc_id': 2, " \
@@ -192,3 +200,22 @@ def test_stringify_file_unique_id():
     string = "{'file_unique_type': <FileUniqueType.DOCUMENT: 2>, 'media_id': 5312458109417947140}"
 
     assert str(FileUniqueId.decode(file_unique_id)) == string
+
+
+def test_decode_returns_copies():
+    file_id = "BQACAgIAAx0CAAGgr9AAAgmPX7b4UxbjNoFEO_L0I4s6wrXNJA8AAgQAA4GkuUm9FFvIaOhXWR4E"
+
+    decoded = FileId.decode(file_id)
+    decoded.file_reference = b"zz"
+    decoded.dc_id = 4
+
+    assert decoded.encode() != file_id
+    assert FileId.decode(file_id).dc_id == 2
+    assert FileId.decode(file_id).encode() == file_id
+
+    file_unique_id = "AgADBAADgaS5SQ"
+
+    decoded = FileUniqueId.decode(file_unique_id)
+    decoded.media_id = 1
+
+    assert FileUniqueId.decode(file_unique_id).encode() == file_unique_id
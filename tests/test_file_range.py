@@ -0,0 +1,74 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from pyrogram.utils import get_file_range_parts
+
+KB = 1024
+MB = 1024 * 1024
+
+
+def check_parts(start, end):
+    parts = list(get_file_range_parts(start, end))
+
+    for offset, limit in parts:
+        assert offset % (4 * KB) == 0
+        assert 4 * KB <= limit <= MB and MB % limit == 0
+        assert offset // MB == (offset + limit - 1) // MB
+
+    # Contiguous parts covering the range without a whole part wasted on either side
+    assert parts[0][0] <= start < parts[0][0] + parts[0][1]
+    assert all(a + la == b for (a, la), (b, _) in zip(parts, parts[1:]))
+    assert parts[-1][0] < end <= parts[-1][0] + parts[-1][1]
+
+    return parts
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (0, 10, [(0, 4 * KB)]),
+    (0, MB, [(0, MB)]),
+    (0, 600 * KB, [(0, MB)]),
+    (5000, 6000, [(4 * KB, 4 * KB)]),
+    (4 * KB, 20 * KB, [(4 * KB, 4 * KB), (8 * KB, 8 * KB), (16 * KB, 4 * KB)]),
+    (MB - 1, MB + 1, [(MB - 4 * KB, 4 * KB), (MB, 4 * KB)]),
+    (3 * MB + 100, 5 * MB, [(3 * MB, MB), (4 * MB, MB)]),
+])
+def test_parts(start, end, expected):
+    assert check_parts(start, end) == expected
+
+
+def test_random_ranges():
+    rng = random.Random(0)
+
+    for _ in range(1000):
+        start = rng.randrange(0, 8 * MB)
+        end = start + rng.randrange(1, 4 * MB)
+        parts = check_parts(start, end)
+
+        # Small ranges are never fetched with more than a few parts
+        if end - start <= 4 * KB:
+            assert len(parts) <= 2
+
+
+def test_open_ended():
+    parts = get_file_range_parts(12 * KB)
+
+    assert [next(parts) for _ in range(4)] == [(12 * KB, 4 * KB), (16 * KB, 16 * KB), (32 * KB, 32 * KB), (64 * KB, 64 * KB)]
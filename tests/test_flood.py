@@ -0,0 +1,84 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.errors import FloodWait, FloodPremiumWait
+from pyrogram.flood import FloodRegistry, get_peer_key
+
+
+def test_get_peer_key():
+    user = raw.types.InputPeerUser(user_id=1, access_hash=2)
+    channel = raw.types.InputChannel(channel_id=3, access_hash=4)
+
+    assert get_peer_key(raw.functions.messages.SendMessage(peer=user, message="", random_id=0)) == ("user_id", 1)
+    assert get_peer_key(raw.functions.channels.GetFullChannel(channel=channel)) == ("channel_id", 3)
+    assert get_peer_key(raw.functions.messages.GetHistory(
+        peer=raw.types.InputPeerSelf(), offset_id=0, offset_date=0, add_offset=0, limit=0, max_id=0, min_id=0, hash=0
+    )) == ("InputPeerSelf",)
+    assert get_peer_key(raw.functions.help.GetNearestDc()) is None
+
+
+def test_keys():
+    registry = FloodRegistry()
+    registry.add("messages.SendMessage", ("user_id", 1), 10)
+
+    assert registry.get("messages.SendMessage", ("user_id", 1))[0] > 9
+    assert registry.get("messages.SendMessage", ("user_id", 2))[0] == 0
+    assert registry.get("messages.SendMessage")[0] == 0
+
+    # Waits of requests without a peer apply to every peer
+    registry.add("help.GetConfig", None, 10, FloodPremiumWait)
+
+    assert registry.get("help.GetConfig", ("user_id", 1)) == (pytest.approx(10, abs=1), FloodPremiumWait)
+    assert set(registry.current()) == {("messages.SendMessage", ("user_id", 1)), ("help.GetConfig", None)}
+
+
+def test_expiry():
+    registry = FloodRegistry()
+    registry.add("help.GetConfig", None, 0)
+
+    assert registry.get("help.GetConfig") == (0, FloodWait)
+    assert registry.current() == {}
+    assert registry.stats["floods"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wait():
+    registry = FloodRegistry()
+    registry.add("help.GetConfig", None, 0.2)
+
+    await registry.wait("help.GetConfig", None, sleep_threshold=10)
+
+    assert registry.get("help.GetConfig")[0] == 0
+    assert registry.stats["delayed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_above_threshold():
+    registry = FloodRegistry()
+    registry.add("help.GetConfig", None, 30)
+
+    with pytest.raises(FloodWait) as e:
+        await asyncio.wait_for(registry.wait("help.GetConfig", None, sleep_threshold=10), 1)
+
+    assert e.value.value == 30
+    assert registry.stats["rejected"] == 1
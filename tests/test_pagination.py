@@ -0,0 +1,196 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.flood import FloodRegistry
+from pyrogram.pagination import Paginator, RawMessage
+from tests.fakedc import FakeDC
+
+
+class Pages:
+    """Pages of consecutive numbers, recording how many pages were fetched ahead of the consumer."""
+
+    def __init__(self, count: int, size: int = 10, delay: float = 0.01):
+        self.count = count
+        self.size = size
+        self.delay = delay
+        self.offset = 0
+        self.fetched = 0
+        self.running = 0
+
+    async def fetch(self):
+        assert not self.running, "fetch called concurrently"
+
+        self.running += 1
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+
+        items = list(range(self.offset, min(self.offset + self.size, self.count)))
+        self.offset += len(items)
+        self.fetched += bool(items)
+
+        return items
+
+
+async def collect(paginator: Paginator, pages: Pages = None, delay: float = 0) -> tuple:
+    items, ahead = [], 0
+
+    async for item in paginator:
+        items.append(item)
+
+        if pages is not None:
+            ahead = max(ahead, pages.fetched - (len(items) - 1) // pages.size - 1)
+
+        await asyncio.sleep(delay)
+
+    return items, ahead
+
+
+@pytest.mark.asyncio
+async def test_order_and_limit():
+    pages = Pages(95)
+
+    assert (await collect(Paginator(pages.fetch, 1 << 31)))[0] == list(range(95))
+
+    pages = Pages(95)
+
+    assert (await collect(Paginator(pages.fetch, 25)))[0] == list(range(25))
+    # No page is fetched past the limit
+    assert pages.fetched == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_prefetch_depth(prefetch):
+    pages = Pages(200, delay=0.001)
+
+    items, ahead = await collect(Paginator(pages.fetch, 1 << 31, prefetch), pages, delay=0.002)
+
+    assert items == list(range(200))
+    assert ahead == prefetch
+
+
+@pytest.mark.asyncio
+async def test_prefetch_overlaps_consumer():
+    pages = Pages(50, delay=0.05)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await collect(Paginator(pages.fetch, 1 << 31, 0), delay=0.005)
+    sequential = loop.time() - start
+
+    pages = Pages(50, delay=0.05)
+
+    start = loop.time()
+    await collect(Paginator(pages.fetch, 1 << 31, 1), delay=0.005)
+    prefetched = loop.time() - start
+
+    assert prefetched < sequential * 0.8
+
+
+@pytest.mark.asyncio
+async def test_flood_wait_shrinks_prefetch():
+    registry = FloodRegistry()
+    pages = Pages(100, delay=0.001)
+
+    async def fetch():
+        if pages.offset == 20:
+            registry.add("messages.GetHistory", None, 0)
+
+        return await pages.fetch()
+
+    paginator = Paginator(fetch, 1 << 31, 4, registry)
+
+    assert (await collect(paginator, delay=0.001))[0] == list(range(100))
+    assert paginator.prefetch == 2
+
+
+@pytest.mark.asyncio
+async def test_error_after_pages():
+    pages = Pages(100)
+
+    async def fetch():
+        if pages.offset == 30:
+            raise ValueError
+
+        return await pages.fetch()
+
+    items = []
+
+    with pytest.raises(ValueError):
+        async for item in Paginator(fetch, 1 << 31, 2):
+            items.append(item)
+
+    # The pages fetched before the error are yielded first
+    assert items == list(range(30))
+
+
+@pytest.mark.asyncio
+async def test_break_stops_fetching():
+    pages = Pages(1000, delay=0.001)
+    paginator = Paginator(pages.fetch, 1 << 31, 2).__aiter__()
+
+    async for item in paginator:
+        if item == 15:
+            break
+
+    await paginator.aclose()
+    await asyncio.sleep(0.05)
+
+    assert pages.fetched <= 4
+
+
+@pytest.mark.asyncio
+async def test_get_chat_history():
+    async with FakeDC() as dc:
+        dc.add_history(250)
+
+        async with dc.client(prefetch_pages=2) as app:
+            ids = [m.id async for m in app.get_chat_history("me")]
+            assert ids == list(range(250, 0, -1))
+
+            ids = [m.id async for m in app.get_chat_history("me", limit=120, offset_id=200)]
+            assert ids == list(range(199, 79, -1))
+
+            ids = [m.id async for m in app.get_chat_history("me", limit=150, offset_id=50, reverse=True)]
+            assert ids == list(range(50, 200))
+
+
+@pytest.mark.asyncio
+async def test_get_chat_history_raw():
+    async with FakeDC() as dc:
+        dc.add_history(150)
+
+        async with dc.client() as app:
+            messages = [m async for m in app.get_chat_history("me", limit=120, parse=False)]
+
+            assert all(isinstance(m, RawMessage) for m in messages)
+            assert [m.message.id for m in messages] == list(range(150, 30, -1))
+            assert list(messages[0].users) == [dc.me.id]
+
+            messages = [m async for m in app.get_chat_history("me", fields=["id", "message", "views"], reverse=True)]
+
+            assert messages[:2] == [
+                {"id": 1, "message": "Message 1", "views": None},
+                {"id": 2, "message": "Message 2", "views": None}
+            ]
+            assert len(messages) == 150
@@ -0,0 +1,112 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.rate_limiter import RateLimiter, TokenBucket
+
+
+def send_message(user_id: int = None, chat_id: int = None) -> raw.functions.messages.SendMessage:
+    if chat_id is not None:
+        peer = raw.types.InputPeerChat(chat_id=chat_id)
+    else:
+        peer = raw.types.InputPeerUser(user_id=user_id, access_hash=0)
+
+    return raw.functions.messages.SendMessage(peer=peer, message="", random_id=0)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(2, 1)
+    now = bucket.updated
+
+    assert bucket.delay(now) == 0
+    bucket.consume()
+    bucket.consume()
+
+    assert bucket.delay(now) == pytest.approx(0.5)
+    assert bucket.delay(now + 0.5) == 0
+
+
+def test_is_limited():
+    limiter = RateLimiter()
+
+    assert limiter.is_limited(send_message(1))
+    assert not limiter.is_limited(raw.functions.help.GetConfig())
+
+
+@pytest.mark.asyncio
+async def test_per_chat_limit():
+    limiter = RateLimiter(total=None, private=(1, 0.1), group=(2, 0.1))
+
+    start = time.monotonic()
+
+    for _ in range(3):
+        await limiter.acquire(send_message(1))
+
+    # Other chats have their own bucket; groups have their own limits
+    await limiter.acquire(send_message(2))
+    await limiter.acquire(send_message(chat_id=3))
+    await limiter.acquire(send_message(chat_id=3))
+
+    assert 0.2 <= time.monotonic() - start < 0.3
+    assert limiter.stats["requests"] == 6
+    assert limiter.stats["delayed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fair_queuing():
+    limiter = RateLimiter(total=(1, 0.02), private=None)
+    served = []
+
+    async def send(chat: int, n: int):
+        await limiter.acquire(send_message(chat))
+        served.append((chat, n))
+
+    broadcast = [asyncio.create_task(send(1, n)) for n in range(10)]
+    await asyncio.sleep(0)
+
+    reply = asyncio.create_task(send(2, 0))
+    await asyncio.sleep(0)
+
+    assert limiter.queue_depths() == {("user_id", 1): 9, ("user_id", 2): 1}
+
+    await asyncio.gather(reply, *broadcast)
+
+    assert served.index((2, 0)) <= 2
+    assert [n for chat, n in served if chat == 1] == list(range(10))
+    assert limiter.stats["queued"] == 0
+    assert limiter.stats["max_queued"] == 10
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_are_skipped():
+    limiter = RateLimiter(total=None, private=(1, 0.1))
+
+    await limiter.acquire(send_message(1))
+
+    waiting = asyncio.create_task(limiter.acquire(send_message(1)))
+    await asyncio.sleep(0)
+    waiting.cancel()
+
+    await asyncio.wait_for(limiter.acquire(send_message(1)), 1)
+
+    assert limiter.stats["requests"] == 2
@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.raw.core import Registry, TLObject
+
+
+def test_registry_resolves_on_first_lookup():
+    registry = Registry({0x05162463: "pyrogram.raw.types.ResPQ"})
+
+    assert 0x05162463 in registry
+    assert len(registry) == 1
+    assert not dict.__contains__(registry, 0x05162463)
+
+    assert registry[0x05162463] is raw.types.ResPQ
+    assert dict.__contains__(registry, 0x05162463)
+    assert registry.get(0) is None
+
+    with pytest.raises(KeyError):
+        _ = registry[0]
+
+
+def test_registry_load():
+    registry = Registry({
+        0x05162463: "pyrogram.raw.types.ResPQ",
+        0x1cb5c415: "pyrogram.raw.core.Vector",
+    })
+
+    assert dict(registry.items()) == {
+        0x05162463: raw.types.ResPQ,
+        0x1cb5c415: raw.core.Vector,
+    }
+
+
+def test_read_unloaded_constructor():
+    update = raw.types.UpdateShortMessage(id=1, user_id=2, message="hi", pts=3, pts_count=1, date=4)
+
+    result = TLObject.read(BytesIO(update.write()))
+
+    assert isinstance(result, raw.types.UpdateShortMessage)
+    assert (result.id, result.user_id, result.message, result.pts) == (1, 2, "hi", 3)
+
+
+def test_lazy_namespaces():
+    from pyrogram.raw.functions.messages import GetHistory
+
+    assert GetHistory is raw.functions.messages.GetHistory
+    assert raw.types.Updates.QUALNAME == "types.Updates"
+    assert "messages" in dir(raw.types)
+    assert "GetHistory" in dir(raw.functions.messages)
+
+    with pytest.raises(AttributeError):
+        _ = raw.types.DoesNotExist
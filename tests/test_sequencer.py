@@ -0,0 +1,184 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from pyrogram import raw
+from pyrogram.sequencer import UpdatesSequencer
+
+
+class Queue(list):
+    def put_nowait(self, item):
+        self.append(item)
+
+
+class Client:
+    def __init__(self, difference=None):
+        self.loop = asyncio.get_event_loop()
+        self.dispatcher = SimpleNamespace(updates_queue=Queue())
+        self.difference = difference
+        self.invoked = []
+
+    async def invoke(self, query):
+        self.invoked.append(query)
+        return self.difference
+
+    async def resolve_peer(self, peer_id):
+        return raw.types.InputPeerChannel(channel_id=peer_id, access_hash=0)
+
+
+def packet(pts):
+    return raw.types.UpdateNewMessage(message=raw.types.MessageEmpty(id=pts), pts=pts, pts_count=1), {}, {}
+
+
+def dispatched(client):
+    return [update.pts for update, _, _ in client.dispatcher.updates_queue]
+
+
+@pytest.mark.asyncio
+async def test_in_order_and_duplicates():
+    client = Client()
+    sequencer = UpdatesSequencer(client)
+
+    for pts in (10, 11, 11, 12, 10):
+        sequencer.feed(0, pts, 1, packet(pts))
+
+    assert dispatched(client) == [10, 11, 12]
+    assert sequencer.stats["duplicates"] == 2
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_updates_are_reordered():
+    client = Client()
+    sequencer = UpdatesSequencer(client)
+
+    sequencer.feed(0, 10, 1, packet(10))
+    sequencer.feed(0, 12, 1, packet(12))
+    sequencer.feed(0, 13, 1, packet(13))
+
+    assert dispatched(client) == [10]
+
+    sequencer.feed(0, 11, 1, packet(11))
+
+    assert dispatched(client) == [10, 11, 12, 13]
+    assert sequencer.stats["reordered"] == 2
+    assert not sequencer.gap_tasks
+    assert not client.invoked
+
+
+@pytest.mark.asyncio
+async def test_own_results_move_the_state_forward():
+    client = Client()
+    sequencer = UpdatesSequencer(client)
+
+    sequencer.feed(0, 10, 1, packet(10))
+    sequencer.feed_result(None, raw.types.UpdateShortSentMessage(id=1, pts=11, pts_count=1, date=0))
+    sequencer.feed(0, 12, 1, packet(12))
+
+    assert dispatched(client) == [10, 12]
+
+
+@pytest.mark.asyncio
+async def test_channel_gap_fetches_difference():
+    client = Client(
+        raw.types.updates.ChannelDifference(
+            pts=13,
+            new_messages=[raw.types.MessageEmpty(id=11), raw.types.MessageEmpty(id=12)],
+            other_updates=[],
+            chats=[],
+            users=[],
+            final=True
+        )
+    )
+    sequencer = UpdatesSequencer(client)
+    sequencer.GAP_TIMEOUT = 0
+
+    sequencer.feed(5, 10, 1, packet(10))
+    sequencer.feed(5, 13, 1, packet(13))
+    sequencer.feed(0, 100, 1, packet(100))
+
+    await asyncio.gather(*sequencer.gap_tasks.values())
+
+    assert len(client.invoked) == 1
+    assert isinstance(client.invoked[0], raw.functions.updates.GetChannelDifference)
+    assert client.invoked[0].pts == 10
+
+    # The held back update was part of the difference
+    assert [update.message.id for update, _, _ in client.dispatcher.updates_queue] == [10, 100, 11, 12]
+    assert sequencer.states[5] == 13
+    assert sequencer.stats["gaps"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unresolved_gap_drops_updates():
+    client = Client(raw.types.updates.ChannelDifferenceEmpty(pts=10, final=True))
+    sequencer = UpdatesSequencer(client)
+    sequencer.GAP_TIMEOUT = 0
+
+    sequencer.feed(5, 10, 1, packet(10))
+    sequencer.feed(5, 13, 1, packet(13))
+
+    while sequencer.gap_tasks:
+        await asyncio.gather(*sequencer.gap_tasks.values())
+
+    # The difference is asked for again, then the update that doesn't follow the state is dropped
+    assert dispatched(client) == [10]
+    assert sequencer.states[5] == 10
+    assert len(client.invoked) == sequencer.MAX_GAP_ATTEMPTS
+    assert sequencer.stats["dropped"] == 1
+
+    sequencer.feed(5, 11, 1, packet(11))
+
+    assert dispatched(client) == [10, 11]
+
+
+@pytest.mark.asyncio
+async def test_channel_results_use_the_channel_box():
+    sequencer = UpdatesSequencer(Client())
+    sequencer.set_state(0, 100)
+    sequencer.set_state(5, 49997)
+
+    channel = raw.types.InputPeerChannel(channel_id=5, access_hash=0)
+
+    sequencer.feed_result(
+        raw.functions.messages.UnpinAllMessages(peer=channel),
+        raw.types.messages.AffectedHistory(pts=50000, pts_count=3, offset=0)
+    )
+    sequencer.feed_result(
+        raw.functions.InvokeWithTakeout(
+            takeout_id=1,
+            query=raw.functions.channels.DeleteMessages(
+                channel=raw.types.InputChannel(channel_id=5, access_hash=0), id=[1]
+            )
+        ),
+        raw.types.messages.AffectedMessages(pts=50001, pts_count=1)
+    )
+    sequencer.feed_result(
+        raw.functions.messages.ReadMentions(peer=raw.types.InputPeerUser(user_id=1, access_hash=0)),
+        raw.types.messages.AffectedHistory(pts=101, pts_count=1, offset=0)
+    )
+    # The box of an unknown peer can't be told, the result is ignored
+    sequencer.feed_result(
+        raw.functions.messages.ReadMentions(peer=raw.types.InputPeerEmpty()),
+        raw.types.messages.AffectedHistory(pts=60000, pts_count=1, offset=0)
+    )
+
+    assert sequencer.states == {0: 101, 5: 50001}
@@ -0,0 +1,161 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from pyrogram import raw
+from pyrogram.raw.core import Message, MsgContainer, TLObject
+from pyrogram.raw.core.primitives import Int, Long, Int128, Double, Bool, Bytes, String, Vector
+
+
+def read(data: bytes) -> TLObject:
+    return TLObject.read(BytesIO(data))
+
+
+def test_send_message():
+    peer = raw.types.InputPeerChannel(channel_id=1234567890, access_hash=-987654321)
+    reply_to = raw.types.InputReplyToMessage(reply_to_msg_id=42)
+    entities = [
+        raw.types.MessageEntityBold(offset=0, length=5),
+        raw.types.MessageEntityTextUrl(offset=7, length=5, url="https://example.com")
+    ]
+
+    query = raw.functions.messages.SendMessage(
+        peer=peer,
+        message="Hello, wörld 👋",
+        random_id=-1234567890123456789,
+        silent=True,
+        reply_to=reply_to,
+        entities=entities,
+        schedule_date=1700000000
+    )
+
+    assert query.write() == (
+        Int(query.ID, False)
+        + Int(1 << 0 | 1 << 3 | 1 << 5 | 1 << 10)
+        + peer.write()
+        + reply_to.write()
+        + String("Hello, wörld 👋")
+        + Long(-1234567890123456789)
+        + Vector(entities)
+        + Int(1700000000)
+    )
+
+    result = read(query.write())
+
+    assert isinstance(result, raw.functions.messages.SendMessage)
+    assert result.write() == query.write()
+    assert result.entities == entities
+
+
+def test_get_history():
+    query = raw.functions.messages.GetHistory(
+        peer=raw.types.InputPeerSelf(), offset_id=100, offset_date=0, add_offset=-20,
+        limit=100, max_id=0, min_id=0, hash=123456789012345
+    )
+
+    assert query.write() == (
+        Int(query.ID, False)
+        + raw.types.InputPeerSelf().write()
+        + Int(100) + Int(0) + Int(-20) + Int(100) + Int(0) + Int(0)
+        + Long(123456789012345)
+    )
+    assert read(query.write()).write() == query.write()
+
+
+def test_save_file_part():
+    for size in (3, 253, 254, 1024):
+        data = bytes(range(256)) * 4
+        query = raw.functions.upload.SaveFilePart(file_id=-5, file_part=3, bytes=data[:size])
+
+        assert query.write() == Int(query.ID, False) + Long(-5) + Int(3) + Bytes(data[:size])
+        assert read(query.write()).bytes == data[:size]
+
+
+def test_memoryview_bytes():
+    data = bytes(range(256)) * 4
+    query = raw.functions.upload.SaveBigFilePart(
+        file_id=1, file_part=2, file_total_parts=3, bytes=memoryview(data)[100:900]
+    )
+
+    assert query.write() == raw.functions.upload.SaveBigFilePart(
+        file_id=1, file_part=2, file_total_parts=3, bytes=data[100:900]
+    ).write()
+
+
+def test_message_length_is_computed_when_written():
+    query = raw.functions.upload.SaveFilePart(file_id=1, file_part=0, bytes=b"x" * 1000)
+    message = Message(query, 6800000000000000000, 1, 0)
+
+    assert message.write() == Long(6800000000000000000) + Int(1) + Int(len(query)) + query.write()
+    assert message.length == len(query)
+
+
+def test_fixed_width_primitives():
+    res_pq = raw.types.ResPQ(
+        nonce=-2 ** 127,
+        server_nonce=2 ** 127 - 1,
+        pq=b"\x17\xed\x48\x94\x1a\x08\xf9\x81",
+        server_public_key_fingerprints=[-3414540481677951611, 1]
+    )
+
+    assert res_pq.write() == (
+        Int(res_pq.ID, False)
+        + Int128(-2 ** 127)
+        + Int128(2 ** 127 - 1)
+        + Bytes(b"\x17\xed\x48\x94\x1a\x08\xf9\x81")
+        + Vector([-3414540481677951611, 1], Long)
+    )
+    assert read(res_pq.write()) == res_pq
+
+    point = raw.types.InputGeoPoint(lat=45.4642, long=-9.19, accuracy_radius=10)
+
+    assert point.write() == Int(point.ID, False) + Int(1) + Double(45.4642) + Double(-9.19) + Int(10)
+    assert read(point.write()) == point
+
+    views = raw.functions.messages.GetMessagesViews(peer=raw.types.InputPeerEmpty(), id=[1, 2, 3], increment=False)
+
+    assert views.write() == (
+        Int(views.ID, False)
+        + raw.types.InputPeerEmpty().write()
+        + Vector([1, 2, 3], Int)
+        + Bool(False)
+    )
+
+
+def test_empty_optional_vector_is_omitted():
+    update = raw.types.UpdateShortMessage(id=1, user_id=2, message="hi", pts=3, pts_count=1, date=4, entities=[])
+
+    assert update.write() == raw.types.UpdateShortMessage(
+        id=1, user_id=2, message="hi", pts=3, pts_count=1, date=4
+    ).write()
+    assert read(update.write()).entities == []
+
+
+def test_write_into_shared_buffer():
+    ping = raw.functions.Ping(ping_id=7)
+    container = MsgContainer([Message(ping, 6800000000000000000, 1, len(ping))])
+
+    b = bytearray(b"prefix")
+    container.write_into(b)
+
+    assert bytes(b) == b"prefix" + container.write()
+    assert container.write() == (
+        Int(MsgContainer.ID, False) + Int(1)
+        + Long(6800000000000000000) + Int(1) + Int(12) + ping.write()
+    )
@@ -0,0 +1,313 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import time
+from io import BytesIO
+
+import pytest
+
+from pyrogram import StopTransmission, raw, filters
+from pyrogram.connection import Connection
+from pyrogram.errors import FloodWait
+from pyrogram.file_id import FileId, FileType
+from pyrogram.handlers import MessageHandler
+from pyrogram.methods.advanced import save_file
+from pyrogram.session import Auth, Session
+from pyrogram.session.internals import SaltManager
+from pyrogram.upload_reader import UploadReader
+from tests.fakedc import FakeDC
+from tests.fakedc.keys import FINGERPRINT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", sorted(Connection.MODES))
+async def test_transports(mode):
+    async with FakeDC():
+        connection = Connection(2, False, False, None, mode=mode)
+        await connection.connect()
+
+        try:
+            await connection.send(Auth.pack(raw.functions.ReqPqMulti(nonce=42)))
+            res_pq = Auth.unpack(BytesIO(await connection.recv()))
+        finally:
+            connection.close()
+
+    assert res_pq.nonce == 42
+    assert res_pq.server_public_key_fingerprints == [FINGERPRINT]
+
+
+@pytest.mark.asyncio
+async def test_start_and_invoke():
+    async with FakeDC() as dc:
+        async with dc.client() as app:
+            assert app.me.id == dc.me.id
+            assert app.me.is_bot
+
+            nearest_dc = await app.invoke(raw.functions.help.GetNearestDc())
+
+    assert nearest_dc.this_dc == 2
+    assert dc.stats["auth_keys"] == 1
+
+
+@pytest.mark.asyncio
+async def test_flood_wait():
+    async with FakeDC() as dc:
+        async with dc.client() as app:
+            dc.flood_wait(raw.functions.help.GetNearestDc, 3)
+
+            with pytest.raises(FloodWait) as e:
+                await app.invoke(raw.functions.help.GetNearestDc(), sleep_threshold=0)
+
+            assert e.value.value == 3
+
+            # The flood wait is still active: the next call fails without reaching the server
+            requests = dc.stats["requests"]
+
+            with pytest.raises(FloodWait):
+                await app.invoke(raw.functions.help.GetNearestDc(), sleep_threshold=0)
+
+            assert dc.stats["requests"] == requests
+            assert app.flood_registry.stats["rejected"] == 1
+
+            app.flood_registry.clear()
+
+            assert await app.invoke(raw.functions.help.GetNearestDc(), sleep_threshold=0)
+
+
+@pytest.mark.asyncio
+async def test_flood_wait_holds_back_concurrent_calls():
+    async with FakeDC() as dc:
+        async with dc.client() as app:
+            dc.flood_wait(raw.functions.help.GetNearestDc, 1)
+
+            first = asyncio.create_task(app.invoke(raw.functions.help.GetNearestDc()))
+            await asyncio.sleep(0.3)
+
+            requests = dc.stats["requests"]
+            others = [asyncio.create_task(app.invoke(raw.functions.help.GetNearestDc())) for _ in range(3)]
+            await asyncio.sleep(0.3)
+
+            assert dc.stats["requests"] == requests
+            assert all(await asyncio.gather(first, *others))
+
+    assert dc.stats["errors"] == 1
+    assert app.flood_registry.stats["delayed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limits():
+    async with FakeDC() as dc:
+        async with dc.client(rate_limits=dict(private=(1, 0.2))) as app:
+            peer = raw.types.InputPeerUser(user_id=1, access_hash=0)
+            start = asyncio.get_running_loop().time()
+
+            for i in range(3):
+                await app.invoke(raw.functions.messages.SendMessage(peer=peer, message=f"Message {i}", random_id=i))
+
+            assert asyncio.get_running_loop().time() - start >= 0.4
+            assert app.rate_limiter.stats["delayed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(save_file, "PART_SIZE", 1024)
+    monkeypatch.setattr(save_file, "PART_RETRY_DELAY", 0.01)
+
+    content = os.urandom(4 * 1024 + 10)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    sent_parts = []
+
+    def save_file_part(query: raw.functions.upload.SaveFilePart):
+        sent_parts.append(query.file_part)
+
+        if query.file_part == 2 and unstable:
+            return raw.types.RpcError(error_code=400, error_message="FILE_PART_INVALID")
+
+        return dc.save_file_part(query)
+
+    async with FakeDC() as dc:
+        dc.handlers[raw.functions.upload.SaveFilePart] = save_file_part
+
+        async with dc.client(workdir=str(tmp_path), resumable_uploads=True) as app:
+            # Part 2 keeps failing: it is retried, then the upload gives up
+            unstable = True
+            assert await app.save_file(str(path)) is None
+            assert sent_parts == [0, 1, 2, 2, 2, 2, 3, 4]
+
+            # Uploading the same file again only sends the missing part
+            unstable = False
+            sent_parts.clear()
+            file = await app.save_file(str(path))
+
+            assert sent_parts == [2]
+
+    parts = dc.uploads[file.id]
+
+    assert file.parts == 5
+    assert b"".join(parts[i] for i in sorted(parts)) == content
+    assert not list((tmp_path / "fakedc.uploads").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_upload_failed_part(tmp_path, monkeypatch):
+    monkeypatch.setattr(save_file, "PART_SIZE", 1024)
+
+    path = tmp_path / "file.bin"
+    path.write_bytes(os.urandom(4 * 1024 + 10))
+
+    async with FakeDC() as dc:
+        dc.fail(raw.functions.upload.SaveFilePart, 400, "FILE_PART_INVALID")
+
+        async with dc.client(workdir=str(tmp_path)) as app:
+            # Without a manifest the file is returned anyway, sending it reports the missing part
+            file = await app.save_file(str(path))
+
+    assert file.parts == 5
+    assert len(dc.uploads[file.id]) == 4
+
+
+@pytest.mark.asyncio
+async def test_upload_stopped_waits_for_md5(monkeypatch):
+    events = []
+
+    def md5(reader, part_size):
+        time.sleep(0.2)
+        events.append("md5")
+        raise OSError("md5 failed")
+
+    def close(reader):
+        events.append("close")
+
+    def progress(current, total):
+        raise StopTransmission
+
+    monkeypatch.setattr(UploadReader, "md5", md5)
+    monkeypatch.setattr(UploadReader, "close", close)
+
+    async with FakeDC() as dc:
+        async with dc.client() as app:
+            with pytest.raises(StopTransmission):
+                await app.save_file(BytesIO(os.urandom(1024)), progress=progress)
+
+    # The checksum is done and its error retrieved before the reader is closed
+    assert events == ["md5", "close"]
+
+
+@pytest.mark.asyncio
+async def test_salts():
+    async with FakeDC(salt_period=2) as dc:
+        async with dc.client() as app:
+            # The salt derived from the auth key exchange is accepted right away
+            assert dc.stats["bad_salts"] == 0
+
+            # Sessions using the same auth key share the salts
+            session = Session(app, 2, await app.storage.auth_key(), False, is_media=True)
+            await session.start()
+            await session.stop()
+
+            assert session.salt_manager is app.session.salt_manager
+            assert dc.stats["bad_salts"] == 0
+
+            # Future salts are fetched in the background and used when the server rotates its salt
+            while not app.session.salt_manager.counters["fetches"]:
+                await asyncio.sleep(0.1)
+
+            salt = app.session.salt
+            await asyncio.sleep(2.5)
+            await app.invoke(raw.functions.help.GetNearestDc())
+
+            assert app.session.salt != salt
+            assert dc.stats["bad_salts"] == 0
+
+            key = app.session.salt_manager.key
+
+        # The salts are forgotten once the last session using the auth key stops
+        assert key not in SaltManager.managers
+
+
+@pytest.mark.asyncio
+async def test_upload_and_download():
+    content = os.urandom(100 * 1024)
+
+    async with FakeDC() as dc:
+        dc.files[1] = content
+
+        async with dc.client() as app:
+            file = await app.save_file(BytesIO(content))
+            file_id = FileId(file_type=FileType.DOCUMENT, dc_id=2, media_id=1, access_hash=0, file_reference=b"")
+
+            downloaded = b"".join([chunk async for chunk in app.get_file(file_id)])
+
+    parts = dc.uploads[file.id]
+
+    assert b"".join(parts[i] for i in sorted(parts)) == content
+    assert downloaded == content
+
+
+
+@pytest.mark.asyncio
+async def test_download_ranges():
+    content = os.urandom(3 * 1024 * 1024 + 12345)
+    ranges = [(0, 1), (5000, 6000), (1048575, 1048577), (123456, 2345678), (3 * 1024 * 1024, len(content))]
+
+    async with FakeDC() as dc:
+        dc.files[1] = content
+
+        async with dc.client(max_concurrent_transmissions=2) as app:
+            file_id = FileId(
+                file_type=FileType.DOCUMENT, dc_id=2, media_id=1, access_hash=0, file_reference=b""
+            ).encode()
+
+            async def download(start, end):
+                return b"".join([chunk async for chunk in app.stream_media_range(file_id, start, end)])
+
+            downloaded = await asyncio.gather(*(download(start, end) for start, end in ranges))
+            rest = await download(len(content) - 100, None)
+
+            with pytest.raises(ValueError):
+                await download(-100, None)
+
+    assert downloaded == [content[start:end] for start, end in ranges]
+    assert rest == content[-100:]
+    assert dc.stats["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_updates():
+    received = []
+    done = asyncio.Event()
+
+    async with FakeDC() as dc:
+        async with dc.client() as app:
+            async def on_message(_, message):
+                received.append(message.text)
+
+                if len(received) == 3:
+                    done.set()
+
+            app.add_handler(MessageHandler(on_message, filters.private))
+
+            for i in range(3):
+                await dc.push(dc.new_message(f"Message {i}"))
+
+            await asyncio.wait_for(done.wait(), 5)
+
+    assert received == ["Message 0", "Message 1", "Message 2"]
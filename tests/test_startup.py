@@ -0,0 +1,98 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cold "import pyrogram" must stay below this many seconds (best of a few runs). Wall-clock timings vary too much
+# between machines to be checked by default, the test only runs when the budget is set.
+IMPORT_BUDGET = os.environ.get("PYROGRAM_IMPORT_BUDGET")
+
+# Generated raw modules allowed to be imported by "import pyrogram": only those the high-level code references when
+# its modules are loaded, not the whole TL schema.
+RAW_MODULES_BUDGET = 300
+
+SCRIPT = """
+import json, sys, time
+
+start = time.perf_counter()
+import pyrogram
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_pyrogram() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def imports():
+    # The first run also writes the bytecode caches, so it is not timed
+    import_pyrogram()
+
+    return [import_pyrogram() for _ in range(3)]
+
+
+@pytest.mark.skipif(IMPORT_BUDGET is None, reason="PYROGRAM_IMPORT_BUDGET is not set")
+def test_import_time(imports):
+    budget = float(IMPORT_BUDGET)
+    elapsed = min(i["elapsed"] for i in imports)
+
+    assert elapsed < budget, f"import pyrogram took {elapsed:.3f}s, budget is {budget:.3f}s"
+
+
+def test_import_is_lazy(imports):
+    modules = imports[0]["modules"]
+    raw_modules = [m for m in modules if m.startswith("pyrogram.raw.")]
+
+    assert "pyrogram.emoji" not in modules
+    assert len(raw_modules) < RAW_MODULES_BUDGET, f"{len(raw_modules)} raw modules imported"
+
+
+def test_lazy_submodules():
+    import pyrogram
+    from pyrogram import emoji
+
+    assert pyrogram.emoji is emoji
+    assert emoji.GRINNING_FACE == "\U0001f600"
+    assert "emoji" in dir(pyrogram)
+
+    with pytest.raises(AttributeError):
+        _ = pyrogram.missing_attribute
+
+
+def test_mime_types():
+    from pyrogram import Client
+
+    assert Client.mimetypes is Client.mimetypes
+    assert Client.mimetypes.guess_type("sticker.tgs")[0] == "application/x-tgsticker"
+    assert Client.mimetypes.guess_extension("image/png") == ".png"
@@ -0,0 +1,80 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from io import BytesIO
+
+from pyrogram.upload_manifest import UploadManifest, get_fingerprint
+
+
+def test_fingerprint():
+    content = bytes(range(256)) * 16
+    fingerprint = get_fingerprint(BytesIO(content), len(content), 1024)
+
+    assert fingerprint == get_fingerprint(BytesIO(content), len(content), 1024)
+    assert fingerprint != get_fingerprint(BytesIO(content[:-1] + b"x"), len(content), 1024)
+    assert fingerprint != get_fingerprint(BytesIO(content), len(content), 2048)
+
+
+def test_fingerprint_middle_change(tmp_path):
+    original = bytes(range(256)) * 256
+    content = bytearray(original)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+
+    with open(path, "rb") as f:
+        fingerprint = get_fingerprint(f, len(content), 1024)
+
+    # Same size and name, a single byte changed in the middle
+    content[len(content) // 2] ^= 0xFF
+    path.write_bytes(content)
+
+    with open(path, "rb") as f:
+        assert get_fingerprint(f, len(content), 1024) != fingerprint
+
+    assert get_fingerprint(BytesIO(content), len(content), 1024) != get_fingerprint(
+        BytesIO(original), len(content), 1024
+    )
+
+
+def test_resume(tmp_path):
+    manifest = UploadManifest.open(tmp_path, "abc", 42, 10, False)
+    manifest.add(0)
+    manifest.add(3)
+    manifest.save()
+
+    resumed = UploadManifest.open(tmp_path, "abc", 1, 10, False)
+
+    assert resumed.file_id == 42
+    assert resumed.parts == {0, 3}
+
+    # A different layout starts a new upload
+    assert UploadManifest.open(tmp_path, "abc", 1, 11, False).file_id == 1
+    assert UploadManifest.open(tmp_path, "abc", 1, 10, True).file_id == 1
+
+    resumed.delete()
+
+    assert UploadManifest.open(tmp_path, "abc", 1, 10, False).file_id == 1
+
+
+def test_expired(tmp_path):
+    manifest = UploadManifest.open(tmp_path, "abc", 42, 10, False)
+    manifest.date = time.time() - UploadManifest.MAX_AGE - 1
+    manifest.save()
+
+    assert UploadManifest.open(tmp_path, "abc", 1, 10, False).file_id == 1
@@ -0,0 +1,72 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from hashlib import md5
+from io import BytesIO, BufferedReader
+
+import pytest
+
+from pyrogram.upload_reader import UploadReader
+
+CONTENT = bytes(range(256)) * 40
+
+
+class Stream(BufferedReader):
+    """A file-like object that can't be memory-mapped."""
+
+    def fileno(self):
+        raise OSError
+
+
+@pytest.fixture(params=["path", "bytesio", "stream"])
+def reader(request, tmp_path):
+    if request.param == "path":
+        path = tmp_path / "file.bin"
+        path.write_bytes(CONTENT)
+        fp = open(path, "rb")
+    elif request.param == "bytesio":
+        fp = BytesIO(CONTENT)
+    else:
+        fp = Stream(BytesIO(CONTENT))
+
+    reader = UploadReader(fp, len(CONTENT))
+
+    yield reader
+
+    reader.close()
+    fp.close()
+
+
+@pytest.mark.asyncio
+async def test_read(reader):
+    parts = [await reader.read(offset, 1024) for offset in range(0, len(CONTENT), 1024)]
+
+    assert b"".join(bytes(part) for part in parts) == CONTENT
+    assert reader.md5(1024) == md5(CONTENT).hexdigest()
+
+
+def test_zero_copy(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT)
+
+    with open(path, "rb") as fp:
+        reader = UploadReader(fp, len(CONTENT))
+
+        assert isinstance(reader.read_sync(0, 1024), memoryview)
+
+        reader.close()
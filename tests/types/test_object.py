@@ -0,0 +1,113 @@
+#  Pyrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#
+#  This file is part of Pyrogram.
+#
+#  Pyrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import pickle
+from datetime import datetime
+
+from pyrogram import enums, raw, types
+from pyrogram.file_id import FileId, FileType, FileUniqueId
+from pyrogram.types.object import Lazy
+
+
+def make_message(**kwargs) -> "types.Message":
+    return types.Message(
+        id=1,
+        from_user=types.User(id=2, first_name="Alice", is_bot=False),
+        chat=types.Chat(id=3, type=enums.ChatType.PRIVATE, first_name="Alice"),
+        date=datetime(2024, 1, 1),
+        text="bold",
+        entities=[types.MessageEntity(type=enums.MessageEntityType.BOLD, offset=0, length=4)],
+        **kwargs
+    )
+
+
+def test_slotted_types_have_no_fields_in_dict():
+    message = make_message()
+
+    assert "id" in types.Message.__slots__
+    assert "id" not in message.__dict__
+    assert message.sticker is None
+
+
+def test_extra_attributes():
+    message = make_message()
+    message.custom = "value"
+
+    assert message.custom == "value"
+    assert "custom" in repr(message)
+
+
+def test_repr_and_str():
+    message = make_message()
+
+    assert repr(message).startswith("pyrogram.types.Message(id=1, from_user=pyrogram.types.User(id=2,")
+    assert '"first_name": "Alice"' in str(message)
+    assert "sticker" not in str(message)
+
+
+def test_eq():
+    assert make_message() == make_message()
+    assert make_message() != make_message(views=10)
+
+
+def test_pickle_and_copy():
+    message = make_message(client=object())
+    message.custom = "value"
+
+    for restored in (pickle.loads(pickle.dumps(message)), copy.deepcopy(message)):
+        assert restored == message
+        assert restored.date == message.date
+        assert restored.custom == "value"
+        assert not hasattr(restored, "_client")
+
+
+def test_bind():
+    message = make_message()
+    client = object()
+
+    message.bind(client)
+
+    assert message._client is client
+    assert message.from_user._client is client
+    assert message.chat._client is client
+
+
+def test_lazy_file_ids():
+    sizes = [
+        raw.types.PhotoSize(type=size, w=width, h=width, size=width * 100)
+        for size, width in (("m", 320), ("x", 800))
+    ]
+    photo = types.Photo._parse(
+        None, raw.types.Photo(id=1, access_hash=2, file_reference=b"ref", date=0, sizes=sizes, dc_id=2)
+    )
+
+    assert type(photo.__dict__["file_id"]) is Lazy
+    assert pickle.loads(pickle.dumps(photo)) == photo
+
+    file_id = FileId.decode(photo.file_id)
+
+    assert isinstance(photo.__dict__["file_id"], str)
+    assert (file_id.file_type, file_id.media_id, file_id.thumbnail_size) == (FileType.PHOTO, 1, "x")
+    assert FileUniqueId.decode(photo.file_unique_id).media_id == 1
+    assert FileId.decode(photo.thumbs[0].file_id).thumbnail_size == "m"
+    assert f'"file_id": "{photo.file_id}"' in str(photo)
+
+    photo.file_id = "custom"
+
+    assert photo.file_id == "custom"